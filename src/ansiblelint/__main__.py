@@ -33,9 +33,6 @@ import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ansible_compat.prerun import get_cache_dir
-from filelock import BaseFileLock, FileLock, Timeout
-
 from ansiblelint.constants import RC, SKIP_SCHEMA_UPDATE
 
 # safety check for broken ansible core, needs to happen first
@@ -46,10 +43,11 @@ try:
 except Exception as _exc:  # pylint: disable=broad-exception-caught # ruff:ignore[blind-except]
     logging.fatal(_exc)
     sys.exit(RC.INVALID_CONFIG)
+# Modules needed only for linting are imported when used, so that --version
+# and the list commands do not pay for loading them.
 # pylint: disable=ungrouped-imports
 from ansiblelint import cli
 from ansiblelint._mockings import _perform_mockings_cleanup
-from ansiblelint.app import get_app
 from ansiblelint.config import (
     Options,
     get_deps_versions,
@@ -58,7 +56,6 @@ from ansiblelint.config import (
     log_entries,
     options,
 )
-from ansiblelint.loaders import IgnoreRule, IgnoreRuleQualifier, load_ignore_txt
 from ansiblelint.output import (
     console,
     console_stderr,
@@ -66,13 +63,18 @@ from ansiblelint.output import (
     render_yaml,
     should_do_markup,
 )
-from ansiblelint.runner import get_matches
-from ansiblelint.skip_utils import normalize_tag
+from ansiblelint.profiling import profiler
 from ansiblelint.version import __version__
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from filelock import BaseFileLock
+
+    from ansiblelint.app import App
+    from ansiblelint.errors import MatchError
+    from ansiblelint.loaders import IgnoreRule
+
     # RulesCollection must be imported lazily or ansible gets imported too early.
     from ansiblelint.rules import RulesCollection
     from ansiblelint.runner import LintResult
@@ -107,9 +109,14 @@ def initialize_logger(level: int = 0) -> None:
     }
 
     handler = LintLogHandler()
+    handler.name = "ansible-lint"
     formatter = logging.Formatter("%(levelname)-8s %(message)s")
     handler.setFormatter(formatter)
     logger = logging.getLogger()
+    # avoid duplicated messages when initialized again by the same process
+    for existing in logger.handlers[:]:
+        if existing.name == handler.name:
+            logger.removeHandler(existing)
     logger.addHandler(handler)
     # Unknown logging level is treated as DEBUG
     logging_level = verbosity_map.get(level, logging.DEBUG)
@@ -119,6 +126,11 @@ def initialize_logger(level: int = 0) -> None:
     _logger.debug("Logging initialized to level %s", logging_level)
 
 
+def _is_informational(opts: Options) -> bool:
+    """Return true if the command only displays information, without linting."""
+    return bool(opts.version or opts.list_profiles or opts.list_rules or opts.list_tags)
+
+
 def initialize_options(arguments: list[str] | None = None) -> BaseFileLock | None:
     """Load config options and store them inside options module."""
     cache_dir_lock = None
@@ -132,18 +144,18 @@ def initialize_options(arguments: list[str] | None = None) -> BaseFileLock | Non
     for k, v in new_options.__dict__.items():
         setattr(options, k, v)
 
-    # rename deprecated ids/tags to newer names
-    options.tags = [normalize_tag(tag) for tag in options.tags]
-    options.skip_list = [normalize_tag(tag) for tag in options.skip_list]
-    options.warn_list = [normalize_tag(tag) for tag in options.warn_list]
-
     options.configured = True
-    if not (
-        options.version
-        or options.list_profiles
-        or options.list_rules
-        or options.list_tags
-    ):
+    if not _is_informational(options):
+        # pylint: disable=import-outside-toplevel
+        from ansible_compat.prerun import get_cache_dir
+
+        from ansiblelint.skip_utils import normalize_tag
+
+        # rename deprecated ids/tags to newer names
+        options.tags = [normalize_tag(tag) for tag in options.tags]
+        options.skip_list = [normalize_tag(tag) for tag in options.skip_list]
+        options.warn_list = [normalize_tag(tag) for tag in options.warn_list]
+
         options.cache_dir = get_cache_dir(
             pathlib.Path(options.project_dir),
             isolated=not options.offline and not has_custom_ansible_env(),
@@ -153,6 +165,9 @@ def initialize_options(arguments: list[str] | None = None) -> BaseFileLock | Non
 
     # add a lock file so we do not have two instances running inside at the same time
     if options.cache_dir and not options.offline:
+        # pylint: disable=import-outside-toplevel
+        from filelock import FileLock, Timeout
+
         options.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # lock file can only be used if cache_dir is set and writable
@@ -174,6 +189,13 @@ def initialize_options(arguments: list[str] | None = None) -> BaseFileLock | Non
     return cache_dir_lock
 
 
+def release_cache_dir_lock(cache_dir_lock: BaseFileLock | None) -> None:
+    """Release the lock acquired by initialize_options, if any."""
+    if cache_dir_lock:
+        cache_dir_lock.release()
+        pathlib.Path(cache_dir_lock.lock_file).unlink(missing_ok=True)
+
+
 def _do_list(rules: RulesCollection) -> int:
     # On purpose lazy-imports to avoid pre-loading Ansible
     # pylint: disable=import-outside-toplevel
@@ -208,7 +230,8 @@ def _do_transform(result: LintResult, opts: Options) -> None:
     transformer = Transformer(result, options)
 
     # this will mark any matches as fixed if the transforms repaired the issue
-    transformer.run()
+    with profiler.phase("transforms"):
+        transformer.run()
 
 
 def support_banner() -> None:
@@ -229,6 +252,8 @@ def fix(runtime_options: Options, result: LintResult, rules: RulesCollection) ->
     from packaging.version import Version
     from ruamel.yaml import __version__ as ruamel_yaml_version_str
 
+    from ansiblelint.runner import get_matches
+
     # pylint: enable=import-outside-toplevel
 
     if Version(ruamel_safe_version) > Version(
@@ -291,6 +316,9 @@ def fix(runtime_options: Options, result: LintResult, rules: RulesCollection) ->
 # even as a warning.
 # [1] https://github.com/ansible/ansible-lint/issues/3068
 def _rule_is_skipped(tag: str, rules: Iterable[IgnoreRule]) -> bool:
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.loaders import IgnoreRuleQualifier
+
     for rule in rules:
         if tag != rule.rule:
             continue
@@ -298,6 +326,73 @@ def _rule_is_skipped(tag: str, rules: Iterable[IgnoreRule]) -> bool:
     return False
 
 
+def _prune_matches(
+    matches: list[MatchError],
+    opts: Options,
+    ignore_map: dict[str, set[IgnoreRule]],
+) -> list[MatchError]:
+    """Remove the skipped matches and mark the ignored ones."""
+    # Remove skip_list items from the result
+    matches = [m for m in matches if m.tag not in opts.skip_list]
+    # prune qualified skips from ignore file
+    matches = [
+        m for m in matches if not _rule_is_skipped(m.tag, ignore_map[m.filename])
+    ]
+    # others entries are ignored
+    for match in matches:
+        if match.tag in [i.rule for i in ignore_map[match.filename]]:
+            match.ignored = True
+            _logger.debug("Ignored: %s", match)
+    return matches
+
+
+def _lint(
+    app: App,
+    rules: RulesCollection,
+    options: Options,
+    ignore_map: dict[str, set[IgnoreRule]],
+) -> LintResult:
+    """Lint the files and display the matches, fixing them if requested.
+
+    With the ndjson format, matches are displayed as soon as the linting of
+    their file is done instead of at the end.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.app import MatchStream
+    from ansiblelint.runner import get_matches
+
+    stream = None
+    if options.format == "ndjson" and not options.write_list:
+        stream = MatchStream(
+            app, lambda matches: _prune_matches(matches, options, ignore_map)
+        )
+    try:
+        result = get_matches(rules, options, report=stream)
+    except BaseException:
+        if stream:
+            stream.close(complete=False)
+        raise
+
+    result.matches = _prune_matches(result.matches, options, ignore_map)
+
+    if app.yamllint_config.incompatible:  # pragma: no cover
+        _logger.log(
+            level=logging.ERROR if options.write_list else logging.WARNING,
+            msg=app.yamllint_config.incompatible,
+        )
+
+    if options.write_list:
+        if app.yamllint_config.incompatible:  # pragma: no cover
+            sys.exit(RC.INVALID_CONFIG)
+        fix(runtime_options=options, result=result, rules=rules)
+
+    if stream:
+        stream.close()
+    else:
+        app.render_matches(result.matches)
+    return result
+
+
 # pylint: disable=too-many-locals,too-many-statements
 def main(argv: list[str] | None = None) -> int:
     """Linter CLI entry point."""
@@ -346,6 +441,36 @@ def main(argv: list[str] | None = None) -> int:
 
     if must_exit:
         sys.exit(0)
+
+    if options.serve:
+        release_cache_dir_lock(cache_dir_lock)
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.daemon import serve
+
+        return serve(argv)
+    profiler.enabled = options.profile_rules
+
+    # listing needs neither the schemas nor a prepared ansible environment
+    if options.list_profiles:
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.generate_docs import profiles_as_md
+
+        profiles_as_md().display()
+        return 0
+
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.rules import RulesCollection
+
+    if options.list_rules or options.list_tags:
+        return _do_list(
+            RulesCollection(
+                app=None,
+                rulesdirs=options.rulesdirs,
+                profile_name=options.profile,
+                options=options,
+            )
+        )
+
     # checks if we have `ANSIBLE_LINT_SKIP_SCHEMA_UPDATE` set to bypass schema
     # update. Also skip if in offline mode.
     # env var set to skip schema refresh
@@ -368,14 +493,8 @@ def main(argv: list[str] | None = None) -> int:
 
         refresh_schemas()
 
-    # pylint: disable=import-outside-toplevel
-    from ansiblelint.rules import RulesCollection
-
-    if options.list_profiles:
-        from ansiblelint.generate_docs import profiles_as_md
-
-        profiles_as_md().display()
-        return 0
+    from ansiblelint.app import get_app
+    from ansiblelint.loaders import load_ignore_txt
 
     app = get_app(
         offline=None,
@@ -388,61 +507,28 @@ def main(argv: list[str] | None = None) -> int:
         options=options,
     )
 
-    if options.list_rules or options.list_tags:
-        return _do_list(rules)
-
     if isinstance(options.tags, str):
         options.tags = options.tags.split(",")  # pragma: no cover
-    result = get_matches(rules, options)
-
-    mark_as_success = True
-
-    # Remove skip_list items from the result
-    result.matches = [m for m in result.matches if m.tag not in app.options.skip_list]
     # load ignore file
     ignore_map = load_ignore_txt(options.ignore_file)
-    # prune qualified skips from ignore file
-    result.matches = [
-        m for m in result.matches if not _rule_is_skipped(m.tag, ignore_map[m.filename])
-    ]
+    result = _lint(app, rules, options, ignore_map)
 
     # For strict option, decide of success or failure after we have pruned the skipped ones
     # from both the skip_list and the ignore file.
-    if options.strict and result.matches:
-        mark_as_success = False
-
-    # others entries are ignored
-    for match in result.matches:
-        if match.tag in [
-            i.rule for i in ignore_map[match.filename]
-        ]:  # pragma: no cover
-            match.ignored = True
-            _logger.debug("Ignored: %s", match)
-
-    if app.yamllint_config.incompatible:  # pragma: no cover
-        _logger.log(
-            level=logging.ERROR if options.write_list else logging.WARNING,
-            msg=app.yamllint_config.incompatible,
-        )
-
-    if options.write_list:
-        if app.yamllint_config.incompatible:  # pragma: no cover
-            sys.exit(RC.INVALID_CONFIG)
-        fix(runtime_options=options, result=result, rules=rules)
-
-    app.render_matches(result.matches)
+    mark_as_success = not (options.strict and result.matches)
 
     _perform_mockings_cleanup(app.options)
-    if cache_dir_lock:
-        cache_dir_lock.release()
-        pathlib.Path(cache_dir_lock.lock_file).unlink(missing_ok=True)
+    release_cache_dir_lock(cache_dir_lock)
     if options.mock_filters:
         _logger.warning(
             "The following filters were mocked during the run: %s",
             ",".join(options.mock_filters),
         )
 
-    return app.report_outcome(result, mark_as_success=mark_as_success)
+    return_code = app.report_outcome(result, mark_as_success=mark_as_success)
+    if options.profile_rules:
+        console_stderr.print(profiler.report())
+    return return_code
 
 
 def _run_cli_entrypoint() -> None:
@@ -10,8 +10,11 @@ from typing import TYPE_CHECKING, Any
 from packaging.version import InvalidVersion, Version
 
 from ansiblelint.constants import RULE_DOC_URL
+from ansiblelint.profiling import profiler
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from ansiblelint.config import Options
     from ansiblelint.errors import MatchError
     from ansiblelint.file_utils import Lintable
@@ -48,6 +51,9 @@ class BaseRule:
     link: str = ""
     has_dynamic_tags: bool = False
     needs_raw_task: bool = False
+    # Regular expression that a line must contain for ``match`` to be called,
+    # the patterns of all the rules are searched at once
+    line_pattern: str | None = None
     # Used to mark rules that we will never unload (internal ones)
     unloadable: bool = False
     # We use _order to sort rules and to ensure that some run before others,
@@ -96,13 +102,23 @@ class BaseRule:
         """Return the short description of the rule, basically the docstring."""
         return self._shortdesc or self.__doc__ or ""
 
-    def getmatches(self, file: Lintable) -> list[MatchError]:
-        """Return all matches while ignoring exceptions."""
+    def getmatches(
+        self,
+        file: Lintable,
+        *,
+        methods: Sequence[str] = ("matchlines", "matchtasks", "matchyaml"),
+    ) -> list[MatchError]:
+        """Return all matches while ignoring exceptions.
+
+        For files, only the given match methods are called, which allows the
+        rules collection to skip the methods that cannot match a kind of file.
+        """
         matches = []
         if not file.path.is_dir():
-            for method in [self.matchlines, self.matchtasks, self.matchyaml]:
+            for method in [getattr(self, name) for name in methods]:
                 try:
-                    matches.extend(method(file))
+                    with profiler.rule(self.id, method.__name__):
+                        matches.extend(method(file))
                 except Exception as exc:  # pylint: disable=broad-except
                     _logger.warning(
                         "Ignored exception from %s.%s while processing %s: %s",
@@ -113,7 +129,8 @@ class BaseRule:
                     )
                     _logger.debug("Ignored exception details", exc_info=True)
         else:
-            matches.extend(self.matchdir(file))
+            with profiler.rule(self.id, "matchdir"):
+                matches.extend(self.matchdir(file))
         return matches
 
     def matchlines(self, file: Lintable) -> list[MatchError]:
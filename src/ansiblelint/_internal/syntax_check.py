@@ -0,0 +1,260 @@
+"""Long-lived workers that run ansible-playbook syntax checks.
+
+Running ``ansible-playbook --syntax-check`` as a new process for every
+playbook means paying for the ansible imports and plugin loader setup each
+time. Instead, each worker imports ansible once and forks itself for every
+check, so checks stay isolated from each other while starting from an
+already warm interpreter.
+
+When this module is executed it acts as the worker, reading JSON encoded
+requests from stdin and writing JSON encoded results to stdout, one per line.
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+_logger = logging.getLogger(__name__)
+
+# directory, path and modification time of the ansible configuration file,
+# and environment the workers were started with
+_WorkerKey = tuple[str, str, int, tuple[tuple[str, str], ...]]
+
+_lock = threading.Lock()
+# idle workers, indexed by their key
+_idle_workers: dict[_WorkerKey, list[SyntaxCheckWorker]] = {}
+_all_workers: list[SyntaxCheckWorker] = []
+
+
+def can_use_workers() -> bool:
+    """Return true if syntax checks can be executed by long-lived workers."""
+    return hasattr(os, "fork")
+
+
+class SyntaxCheckWorker:
+    """Client side of a long-lived syntax check worker process."""
+
+    def __init__(self, env: dict[str, str]) -> None:
+        """Start the worker process using the given environment."""
+        self.proc = subprocess.Popen(  # ruff:ignore[subprocess-without-shell-equals-true]
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=env,
+        )
+
+    def run(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
+        """Run an ansible-playbook command inside the worker."""
+        if not self.proc.stdin or not self.proc.stdout:  # pragma: no cover
+            msg = "Syntax check worker has no pipes."
+            raise RuntimeError(msg)
+        self.proc.stdin.write(json.dumps({"args": cmd, "cwd": str(Path.cwd())}) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            msg = f"Syntax check worker exited with code {self.proc.wait()}."
+            raise RuntimeError(msg)
+        result = json.loads(line)
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=result["returncode"],
+            stdout=result["stdout"],
+            stderr=result["stderr"],
+        )
+
+    def close(self) -> None:
+        """Ask the worker to exit, wait for it and close its pipes."""
+        if self.proc.stdin:  # pragma: no branch
+            self.proc.stdin.close()
+        if self.proc.poll() is None:
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:  # pragma: no cover
+                self.proc.kill()
+                self.proc.wait()
+        if self.proc.stdout:  # pragma: no branch
+            self.proc.stdout.close()
+
+
+def _ansible_config_file(env: dict[str, str]) -> Path | None:
+    """Return the configuration file ansible loads, like ansible-config does."""
+    for name in (
+        env.get("ANSIBLE_CONFIG", ""),
+        "ansible.cfg",
+        "~/.ansible.cfg",
+        "/etc/ansible/ansible.cfg",
+    ):
+        if not name:
+            continue
+        path = Path(name).expanduser()
+        if path.is_dir():
+            path /= "ansible.cfg"
+        if path.is_file():
+            return path.resolve()
+    return None
+
+
+def _worker_key(env: dict[str, str]) -> _WorkerKey:
+    """Return the key of the workers usable from the current directory.
+
+    Workers load the ansible configuration of the directory they were
+    started from, which changes when a long-running process, like the lint
+    daemon, serves several projects.
+    """
+    config_file = _ansible_config_file(env)
+    try:
+        mtime = config_file.stat().st_mtime_ns if config_file else 0
+    except OSError:  # pragma: no cover
+        mtime = 0
+    return (str(Path.cwd()), str(config_file or ""), mtime, tuple(sorted(env.items())))
+
+
+def _idle_workers_for(
+    key: _WorkerKey,
+) -> tuple[list[SyntaxCheckWorker], list[SyntaxCheckWorker]]:
+    """Return the idle workers of a key, and the ones made stale by it.
+
+    Workers started from the same directory and environment but with a
+    different ansible configuration file are never used again, so they are
+    returned to be closed. Must be called while holding the lock.
+    """
+    stale: list[SyntaxCheckWorker] = []
+    if key not in _idle_workers:
+        for other in list(_idle_workers):
+            if (other[0], other[3]) == (key[0], key[3]):
+                stale.extend(_idle_workers.pop(other))
+        for worker in stale:
+            _all_workers.remove(worker)
+        _idle_workers[key] = []
+    return _idle_workers[key], stale
+
+
+def run_syntax_check(
+    cmd: list[str], env: dict[str, str]
+) -> subprocess.CompletedProcess[str]:
+    """Run an ansible-playbook command using an idle worker for this environment.
+
+    Workers are created on demand, so concurrent callers get their own
+    worker, and are reused by the following calls.
+    """
+    key = _worker_key(env)
+    with _lock:
+        idle, stale = _idle_workers_for(key)
+        worker = idle.pop() if idle else None
+    for stale_worker in stale:
+        stale_worker.close()
+    if worker is None:
+        _logger.debug("Starting a new syntax check worker.")
+        worker = SyntaxCheckWorker(env)
+        with _lock:
+            _all_workers.append(worker)
+    try:
+        result = worker.run(cmd)
+    except (OSError, RuntimeError, ValueError):
+        worker.close()
+        with _lock:
+            _all_workers.remove(worker)
+        raise
+    with _lock:
+        idle.append(worker)
+    return result
+
+
+def start_workers(env: dict[str, str], count: int) -> None:
+    """Start workers for an environment until count of them are idle."""
+    key = _worker_key(env)
+    with _lock:
+        idle, stale = _idle_workers_for(key)
+        missing = count - len(idle)
+    for worker in stale:
+        worker.close()
+    for _ in range(missing):
+        worker = SyntaxCheckWorker(env)
+        with _lock:
+            _all_workers.append(worker)
+            idle.append(worker)
+
+
+@atexit.register
+def close_workers() -> None:
+    """Stop all syntax check workers."""
+    with _lock:
+        workers = list(_all_workers)
+        _all_workers.clear()
+        _idle_workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+def _check(cli: Any, request: dict[str, Any]) -> dict[str, Any]:
+    """Run a single ansible-playbook command inside a forked child."""
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        # child process, its output is captured and sent back to the parent
+        os.close(reader)
+        returncode = 250
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        sys.argv = request["args"]
+        try:
+            os.chdir(request["cwd"])
+            sys.stdin = Path(os.devnull).open(encoding="utf-8")  # ruff:ignore[open-file-with-context-handler]
+            sys.stdout = stdout
+            sys.stderr = stderr
+            cli.cli_executor(request["args"])
+        except SystemExit as exc:
+            returncode = exc.code if isinstance(exc.code, int) else int(bool(exc.code))
+        except BaseException as exc:  # ruff:ignore[blind-except]
+            stderr.write(f"{exc.__class__.__name__}: {exc}\n")
+        finally:
+            with os.fdopen(writer, "w", encoding="utf-8") as channel:
+                json.dump(
+                    {
+                        "returncode": returncode,
+                        "stdout": stdout.getvalue(),
+                        "stderr": stderr.getvalue(),
+                    },
+                    channel,
+                )
+            os._exit(0)
+    os.close(writer)
+    with os.fdopen(reader, encoding="utf-8") as channel:
+        data = channel.read()
+    os.waitpid(pid, 0)
+    result: dict[str, Any] = json.loads(data)
+    return result
+
+
+def serve(requests: IO[str], responses: IO[str]) -> None:
+    """Process syntax check requests until the input is closed."""
+    # pylint: disable=import-outside-toplevel
+    from ansible.cli.playbook import PlaybookCLI
+
+    for line in requests:
+        responses.write(json.dumps(_check(PlaybookCLI, json.loads(line))) + "\n")
+        responses.flush()
+
+
+def main() -> None:
+    """Run the worker using stdin and stdout as communication channels."""
+    # Keep the original stdout for responses and send anything else that might
+    # get printed to stderr, so it cannot corrupt the communication channel.
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    serve(sys.stdin, responses)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import copy
+import functools
 import itertools
 import logging
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -28,6 +30,8 @@ from ansiblelint.requirements import Reqs
 from ansiblelint.stats import SummarizedResults, TagStats
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ansiblelint._internal.rules import BaseRule
     from ansiblelint.errors import MatchError
     from ansiblelint.file_utils import Lintable
@@ -74,6 +78,11 @@ class App:
 
         self.yamllint_config = load_yamllint_config(options.yamllint_file)
 
+    @functools.cached_property
+    def become_methods(self) -> list[str]:
+        """Return the names of the available become plugins."""
+        return sorted(self.runtime.plugins.become.keys())
+
     def render_matches(self, matches: list[MatchError]) -> None:
         """Display given matches (if they are not fixed)."""
         matches = [match for match in matches if not match.fixed]
@@ -110,15 +119,8 @@ class App:
                     console.print(self.formatter.apply(match))
 
         # If run under GitHub Actions we also want to emit output recognized by it.
-        if (
-            os.getenv("GITHUB_ACTIONS") == "true"
-            and os.getenv("GITHUB_WORKFLOW")
-            and os.getenv("GITHUB_ACTIONS_TEST", "false") == "false"
-        ):
-            _logger.info(
-                "GitHub Actions environment detected, adding annotations output...",
-            )
-            formatter = formatters.AnnotationsFormatter(self.options.cwd, True)
+        formatter = self.annotations_formatter()
+        if formatter:
             for match in itertools.chain(fatal_matches, ignored_matches):
                 console_stderr.print(
                     formatter.apply(match),
@@ -135,6 +137,19 @@ class App:
                 encoding="utf-8",
             )
 
+    def annotations_formatter(self) -> formatters.AnnotationsFormatter | None:
+        """Return the formatter of GitHub Actions annotations, if run under it."""
+        if (
+            os.getenv("GITHUB_ACTIONS") == "true"
+            and os.getenv("GITHUB_WORKFLOW")
+            and os.getenv("GITHUB_ACTIONS_TEST", "false") == "false"
+        ):
+            _logger.info(
+                "GitHub Actions environment detected, adding annotations output...",
+            )
+            return formatters.AnnotationsFormatter(self.options.cwd, True)
+        return None
+
     def count_results(self, matches: list[MatchError]) -> SummarizedResults:
         """Count failures and warnings in matches."""
         result = SummarizedResults()
@@ -272,7 +287,8 @@ class App:
         if not summary.failures and changed_files_count > 0:
             return RC.FIXED_VIOLATIONS
         if mark_as_success:
-            if not files_count:
+            # an incremental run is allowed to find no changes to lint
+            if not files_count and not self.options.changed_since:
                 # success without any file being analyzed is reported as failure
                 # to match match, preventing accidents where linter was running
                 # not doing anything due to misconfiguration.
@@ -372,6 +388,66 @@ class App:
         console_stderr.print(msg)
 
 
+class MatchStream:
+    """Display matches as soon as the linting of their file is done.
+
+    Used with the ndjson format, the matches are displayed by the formatter,
+    annotated under GitHub Actions and added to the SARIF file while the
+    remaining files are being linted. The SARIF file is written next to its
+    final location and only moved there once closed, so failed runs never
+    leave a truncated report behind.
+    """
+
+    def __init__(
+        self,
+        app: App,
+        prune: Callable[[list[MatchError]], list[MatchError]],
+    ) -> None:
+        """Start streaming, opening the SARIF file if requested."""
+        self.app = app
+        self.prune = prune
+        self.seen: set[MatchError] = set()
+        self.annotations = app.annotations_formatter()
+        self.sarif: formatters.SarifWriter | None = None
+        self.sarif_file: Path | None = None
+        if app.options.sarif_file:
+            sarif_file = self.sarif_file = Path(app.options.sarif_file)
+            # pylint: disable=consider-using-with
+            stream = tempfile.NamedTemporaryFile(  # ruff:ignore[open-file-with-context-handler]
+                mode="w",
+                encoding="utf-8",
+                dir=sarif_file.parent,
+                prefix=f".{sarif_file.name}.",
+                delete=False,
+            )
+            self.sarif = formatters.SarifWriter(stream, app.options.cwd, True)
+
+    def __call__(self, matches: list[MatchError]) -> None:
+        """Display the matches not displayed yet."""
+        new = [match for match in matches if match not in self.seen]
+        self.seen.update(new)
+        for match in self.prune(new):
+            console.print(self.app.formatter.apply(match), flush=True)
+            if self.annotations:
+                console_stderr.print(self.annotations.apply(match))
+            if self.sarif:
+                self.sarif.add(match)
+
+    def close(self, *, complete: bool = True) -> None:
+        """Finish the SARIF file, or discard it if linting did not complete."""
+        if not self.sarif or not self.sarif_file:
+            return
+        if complete:
+            self.sarif.close()
+        self.sarif.stream.close()
+        temp_file = Path(self.sarif.stream.name)
+        if complete:
+            temp_file.replace(self.sarif_file)
+        else:
+            temp_file.unlink(missing_ok=True)
+        self.sarif = None
+
+
 def choose_formatter_factory(
     options_list: Options,
 ) -> type[formatters.BaseFormatter[Any]]:
@@ -381,6 +457,8 @@ def choose_formatter_factory(
         r = formatters.QuietFormatter
     elif options_list.format in ("json", "codeclimate"):
         r = formatters.CodeclimateJSONFormatter
+    elif options_list.format == "ndjson":
+        r = formatters.NDJSONFormatter
     elif options_list.format == "sarif":
         r = formatters.SarifFormatter
     elif options_list.format == "pep8":
@@ -505,3 +583,10 @@ def get_app(*, offline: bool | None = None, cached: bool = False) -> App:
     app.runtime.enable_plugin_loader()
 
     return app
+
+
+def clear_app_cache() -> None:
+    """Forget the application instance cached by get_app."""
+    # pylint: disable=global-statement
+    global _CACHED_APP
+    _CACHED_APP = None
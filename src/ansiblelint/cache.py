@@ -0,0 +1,240 @@
+"""Persistent cache of linting results."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ansiblelint.version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ansiblelint.config import Options
+    from ansiblelint.rules import RulesCollection
+
+_logger = logging.getLogger(__name__)
+
+# Options that only change how results are reported, or which files are
+# linted, but not the results found inside a given file.
+_REPORTING_OPTIONS = (
+    "cache_dir",
+    "cache_results",
+    "changed_since",
+    "colored",
+    "configured",
+    "display_relative_path",
+    "exclude_paths",
+    "format",
+    "generate_ignore",
+    "include_graph",
+    "jobs",
+    "lintables",
+    "list_profiles",
+    "low_memory",
+    "list_rules",
+    "list_tags",
+    "profile_rules",
+    "quiet",
+    "sarif_file",
+    "serve",
+    "verbosity",
+    "version",
+    "write_exclude_list",
+    "write_list",
+)
+
+# Kinds of files whose rules also look at files next to them, like the galaxy
+# rule checking for meta/runtime.yml, which are not part of their keys.
+_UNCACHED_KINDS = frozenset({"galaxy", "role"})
+
+# Directories holding modules, and their utils, of the project itself, like
+# the ones next to playbooks or inside roles and collections.
+_LOCAL_MODULE_DIRS = (
+    "library",
+    "module_utils",
+    "*/library",
+    "*/module_utils",
+    "roles/*/library",
+    "roles/*/module_utils",
+    "plugins/modules",
+    "plugins/module_utils",
+)
+
+
+class ResultCache:
+    """Store the results of linting each file on disk.
+
+    Entries are addressed by a key combining the content of a file, the keys
+    of the files it includes and a salt that changes when the linter, its
+    rules, their configuration, including the yamllint and ansible ones, or
+    the installed dependencies change. As stale entries can never be
+    addressed again, they are not invalidated, but entries which were not
+    used for MAX_AGE seconds are removed when the cache is created.
+    """
+
+    MAX_AGE = 30 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        options: Options,
+        rules: RulesCollection,
+    ) -> None:
+        """Create the cache, computing the salt shared by all its keys."""
+        self.path = cache_dir / "results"
+        self.salt = self._hash(
+            json.dumps(
+                {
+                    "version": __version__,
+                    "options": {
+                        key: value
+                        for key, value in asdict(options).items()
+                        if key not in _REPORTING_OPTIONS
+                    },
+                    "rules": [_rule_fingerprint(rule) for rule in rules],
+                    "yamllint": _yamllint_fingerprint(rules),
+                    "dependencies": _dependencies_fingerprint(rules),
+                    "modules": _modules_fingerprint(rules, Path(options.project_dir)),
+                },
+                sort_keys=True,
+                default=str,
+            ),
+        )
+        self.prune()
+
+    def prune(self) -> None:
+        """Remove the entries not used recently, failing silently."""
+        oldest = time.time() - self.MAX_AGE
+        try:
+            entries = list(os.scandir(self.path))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < oldest:
+                    Path(entry.path).unlink()
+            except OSError as exc:  # pragma: no cover
+                _logger.debug("Unable to remove results cache entry: %s", exc)
+
+    @staticmethod
+    def _hash(*items: str | bytes) -> str:
+        digest = hashlib.sha256()
+        for item in items:
+            digest.update(item.encode("utf-8") if isinstance(item, str) else item)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def accepts(kind: str) -> bool:
+        """Return true if the results of files of this kind can be cached."""
+        return kind not in _UNCACHED_KINDS
+
+    def key(self, name: str, kind: str, content: bytes, children: Iterable[str]) -> str:
+        """Return the key of a file, given the keys of the files it includes."""
+        return self._hash(self.salt, name, kind, content, *sorted(children))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for key, if any."""
+        entry = self.path / f"{key}.json"
+        try:
+            data = json.loads(entry.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        # used entries are kept when pruning the cache
+        with contextlib.suppress(OSError):
+            entry.touch()
+        if not isinstance(data, dict):  # pragma: no cover
+            return None
+        return data
+
+    def set(self, key: str, data: dict[str, Any]) -> None:
+        """Store an entry, failing silently if the cache is not writable."""
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so concurrent runs never read
+            # partially written entries
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self.path,
+                delete=False,
+                suffix=".tmp",
+            ) as fh:
+                json.dump(data, fh)
+            Path(fh.name).replace(self.path / f"{key}.json")
+        except OSError as exc:
+            _logger.debug("Unable to write results cache entry: %s", exc)
+
+
+def _rule_fingerprint(rule: Any) -> list[Any]:
+    """Return data identifying a rule and the version of its code."""
+    try:
+        source = inspect.getfile(rule.__class__)
+        mtime = Path(source).stat().st_mtime_ns
+    except (OSError, TypeError):
+        source, mtime = "", 0
+    return [rule.id, sorted(rule.tags), source, mtime]
+
+
+def _yamllint_fingerprint(rules: RulesCollection) -> dict[str, Any]:
+    """Return the effective yamllint configuration used by the yaml rule."""
+    config = rules.app.yamllint_config
+    return {
+        "rules": config.rules,
+        "ignore": [
+            str(pattern.pattern) for pattern in getattr(config.ignore, "patterns", [])
+        ],
+    }
+
+
+def _modules_fingerprint(rules: RulesCollection, project_dir: Path) -> dict[str, int]:
+    """Return the modification times of the modules found outside collections.
+
+    The args rule validates tasks against the argument specs of these modules,
+    which are not part of the include graph.
+    """
+    runtime = rules.app.runtime
+    directories = [
+        *(project_dir.glob(pattern) for pattern in _LOCAL_MODULE_DIRS),
+        [Path(path) for path in runtime.config.default_module_path or []],
+        [Path(path) for path in runtime.config.default_module_utils_path or []],
+    ]
+    mtimes = {}
+    for directory in sorted({path for paths in directories for path in paths}):
+        for path in sorted(directory.rglob("*")):
+            try:
+                if path.is_file():
+                    mtimes[str(path)] = path.stat().st_mtime_ns
+            except OSError:  # pragma: no cover
+                continue
+    return mtimes
+
+
+def _dependencies_fingerprint(rules: RulesCollection) -> dict[str, Any]:
+    """Return data identifying the ansible version, configuration and collections."""
+    runtime = rules.app.runtime
+    manifests = {}
+    for collections_path in runtime.config.collections_paths or []:
+        for manifest in sorted(
+            Path(collections_path).glob("ansible_collections/*/*/MANIFEST.json"),
+        ):
+            try:
+                manifests[str(manifest)] = manifest.stat().st_mtime_ns
+            except OSError:  # pragma: no cover
+                continue
+    return {
+        "ansible": str(runtime.version),
+        # ansible.cfg changes how modules and collections are found
+        "config": dict(runtime.config.data),
+        "collections": manifests,
+    }
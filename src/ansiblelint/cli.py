@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 import os
 import sys
@@ -27,8 +28,6 @@ from ansiblelint.file_utils import (
 )
 from ansiblelint.loaders import IGNORE_FILE
 from ansiblelint.output import console_stderr
-from ansiblelint.schemas.main import validate_file_schema
-from ansiblelint.yaml_utils import clean_json
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
@@ -62,6 +61,18 @@ def expand_to_normalized_paths(
         config[paths_var] = normalized_paths
 
 
+def _non_negative_int(value: str) -> int:
+    """Parse a command line argument accepting zero or a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        msg = f"invalid non-negative int value: {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
 def _fatal_config_error(msg: str) -> None:
     """Log a fatal configuration error and terminate the process."""
     if any(
@@ -107,6 +118,11 @@ def load_config(
     # resolve symlinks in config path as we will only use the final location
     config_path = Path(config_path).resolve().as_posix()
 
+    # schema validation and yaml loading are only needed with a config file
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.schemas.main import validate_file_schema
+    from ansiblelint.yaml_utils import clean_json
+
     config_lintable = Lintable(
         config_path,
         kind="ansible-lint-config",
@@ -116,7 +132,8 @@ def load_config(
     for error in validate_file_schema(config_lintable):
         _fatal_config_error(f"Invalid configuration file {config_path}. {error}")
 
-    config = clean_json(config_lintable.data)
+    # parsed data is shared by all the lintables of the same file
+    config = clean_json(copy.deepcopy(config_lintable.data))
     if not isinstance(config, dict):
         msg = "Schema failed to properly validate the config file."
         raise TypeError(msg)
@@ -317,11 +334,14 @@ def get_cli_parser() -> argparse.ArgumentParser:
             "md",
             "json",
             "codeclimate",
+            "ndjson",
             "quiet",
             "pep8",
             "sarif",
         ],
-        help="stdout formatting, json being an alias for codeclimate. (default: %(default)s)",
+        help="stdout formatting, json being an alias for codeclimate, ndjson "
+        "displaying the violations of each file as soon as it is linted. "
+        "(default: %(default)s)",
     )
     parser.add_argument(
         "--sarif-file",
@@ -329,6 +349,13 @@ def get_cli_parser() -> argparse.ArgumentParser:
         type=Path,
         help="SARIF output file",
     )
+    parser.add_argument(
+        "--include-graph",
+        default=None,
+        type=Path,
+        help="write the graph of the files included by each other to a file, "
+        "using the DOT language when its extension is .dot, JSON otherwise",
+    )
     parser.add_argument(
         "-q",
         dest="quiet",
@@ -487,6 +514,55 @@ def get_cli_parser() -> argparse.ArgumentParser:
         default=None,
         help="Specify yamllint config file to use. By default it will look for '.yamllint', '.yamllint.yaml', '.yamllint.yml', '~/.config/yamllint/config' or environment variables XDG_CONFIG_HOME and YAMLLINT_CONFIG_FILE.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=_non_negative_int,
+        default=1,
+        help="Number of processes used to run the rules, 0 uses the number of "
+        "available CPUs. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-results",
+        dest="cache_results",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse the results of previous runs for files that did not change",
+    )
+    parser.add_argument(
+        "--low-memory",
+        dest="low_memory",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Release the data of each file once linted and bound the parsing "
+        "caches, using less memory on large projects at the cost of speed.",
+    )
+    parser.add_argument(
+        "--changed-since",
+        dest="changed_since",
+        metavar="REV",
+        default=None,
+        help="Only lint files changed since the given git revision, together "
+        "with the files including them.",
+    )
+    parser.add_argument(
+        "--serve",
+        dest="serve",
+        action="store_true",
+        default=False,
+        help="Run as a daemon answering lint requests made by ansible-lint-client "
+        "on a Unix socket, keeping the runtime loaded between requests. The "
+        "socket path can be changed using ANSIBLE_LINT_SOCKET.",
+    )
+    parser.add_argument(
+        "--profile-rules",
+        dest="profile_rules",
+        action="store_true",
+        default=False,
+        help="Report the time spent by each rule and linting phase on stderr. "
+        "Rules are run in a single process and cached results are ignored.",
+    )
     parser.add_argument(
         "--offline",
         dest="offline",
@@ -516,6 +592,8 @@ def merge_config(file_config: dict[Any, Any], cli_config: Options) -> Options:
         "strict",
         "use_default_rules",
         "offline",
+        "cache_results",
+        "low_memory",
     )
     # maps lists to their default config values
     lists_map = {
@@ -538,6 +616,7 @@ def merge_config(file_config: dict[Any, Any], cli_config: Options) -> Options:
         "project_dir": None,
         "profile": None,
         "sarif_file": None,
+        "include_graph": None,
     }
 
     if not file_config:
@@ -145,6 +145,8 @@ class Options:  # pylint: disable=too-many-instance-attributes
 
     # Public attributes
     cache_dir: Path | None = None
+    cache_results: bool = False
+    changed_since: str | None = None
     colored: bool = True
     configured: bool = False
     cwd: Path = Path()
@@ -182,6 +184,9 @@ class Options:  # pylint: disable=too-many-instance-attributes
     profile: str | None = None
     task_name_prefix: str = "{stem} | "
     sarif_file: Path | None = None
+    include_graph: Path | None = None
+    serve: bool = False
+    profile_rules: bool = False
     config_file: str | None = None
     generate_ignore: bool = False
     rulesdir: list[Path] = field(default_factory=list)
@@ -190,6 +195,8 @@ class Options:  # pylint: disable=too-many-instance-attributes
     list_profiles: bool = False  # display profiles command
     ignore_file: Path | None = None
     yamllint_file: Path | None = None
+    jobs: int = 1
+    low_memory: bool = False
     max_tasks: int = 100
     max_block_depth: int = 20
     # Refer to https://docs.ansible.com/projects/ansible/latest/reference_appendices/release_and_maintenance.html#ansible-core-support-matrix
@@ -0,0 +1,412 @@
+"""Long-running linter daemon and its client.
+
+Starting the linter means importing ansible, preparing the runtime
+environment and loading all rules, which takes seconds even for a single
+file. ``ansible-lint --serve`` does this once and answers the lint requests
+made by ``ansible-lint-client`` on a Unix socket. Each request is processed
+inside a forked child of the daemon, so requests start from an already warm
+interpreter while staying isolated from each other.
+
+The daemon also keeps the files parsed by previous requests, as entries
+are reused only while the modification time and size of the files are the
+same. The runtime environment is prepared again whenever the configuration
+used by a request differs from the previous one.
+
+This module must only import standard library modules at the top, so the
+client stays fast.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ansiblelint.config import Options
+
+_logger = logging.getLogger(__name__)
+
+# number of syntax check workers kept ready for the requests
+SYNTAX_CHECK_WORKERS = 2
+# environment variables that are expected to differ between client and daemon
+_IGNORED_ENV = ("ANSIBLE_DEVEL_WARNING", "ANSIBLE_LINT_SOCKET")
+
+
+def default_socket_path() -> Path:
+    """Return the path of the socket used by the daemon and its client.
+
+    The socket is placed in a directory only the current user can modify, as
+    anyone able to create it first would receive the lint requests.
+    """
+    if "ANSIBLE_LINT_SOCKET" in os.environ:
+        return Path(os.environ["ANSIBLE_LINT_SOCKET"])
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and Path(runtime_dir).is_dir():
+        return Path(runtime_dir) / "ansible-lint.sock"
+    return Path(tempfile.gettempdir()) / f"ansible-lint-{os.getuid()}" / "daemon.sock"
+
+
+def _check_socket_dir(path: Path) -> None:
+    """Raise PermissionError if other users can replace files inside path."""
+    info = path.stat()
+    if info.st_uid not in (0, os.getuid()) or (
+        info.st_mode & 0o022 and not info.st_mode & stat.S_ISVTX
+    ):
+        msg = f"Directory {path} can be modified by other users"
+        raise PermissionError(msg)
+
+
+def _check_socket(path: Path) -> None:
+    """Raise PermissionError unless the socket was created by the current user.
+
+    Otherwise another user could listen on it, receiving the environment
+    of the requests and answering them with any results.
+    """
+    _check_socket_dir(path.parent)
+    info = path.lstat()
+    if (
+        not stat.S_ISSOCK(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) & 0o077
+    ):
+        msg = f"Socket {path} is not private to the current user"
+        raise PermissionError(msg)
+
+
+def _ansible_env() -> dict[str, str]:
+    """Return the environment variables that can change the linting results."""
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith("ANSIBLE_") and key not in _IGNORED_ENV
+    }
+
+
+def _send(conn: socket.socket, data: dict[str, Any]) -> None:
+    conn.sendall(json.dumps(data).encode("utf-8") + b"\n")
+
+
+def _receive(conn: socket.socket) -> dict[str, Any]:
+    with conn.makefile("rb") as stream:
+        line = stream.readline()
+    if not line:
+        msg = "Connection closed without any data."
+        raise ValueError(msg)
+    data: dict[str, Any] = json.loads(line)
+    return data
+
+
+class LintServer:
+    """Answer lint requests received on a Unix socket."""
+
+    def __init__(self, socket_path: Path) -> None:
+        """Create the server, without starting it."""
+        self.socket_path = socket_path
+        self.config_key: str | None = None
+        # environment the daemon was started with, as the ansible configuration
+        # is loaded only once
+        self.env = _ansible_env()
+
+    def serve_forever(self) -> None:
+        """Listen on the socket and process requests, one at a time."""
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_socket_dir(self.socket_path.parent)
+        self._remove_stale_socket()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            # create the socket private, instead of restricting it once bound
+            umask = os.umask(0o177)
+            try:
+                server.bind(str(self.socket_path))
+            finally:
+                os.umask(umask)
+            try:
+                server.listen()
+                _logger.warning("Listening for lint requests on %s", self.socket_path)
+                while True:
+                    conn, _ = server.accept()
+                    with conn:
+                        self._process(server, conn)
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink()
+                return
+        msg = f"Another daemon is already listening on {self.socket_path}"
+        raise RuntimeError(msg)
+
+    def _process(self, server: socket.socket, conn: socket.socket) -> None:
+        """Process a single request, using a forked child."""
+        try:
+            request = _receive(conn)
+        except (OSError, ValueError) as exc:
+            _logger.warning("Ignored invalid request: %s", exc)
+            return
+        if request.get("env") != self.env:
+            _send(conn, {"error": "Environment differs from the one of the daemon."})
+            return
+        try:
+            os.chdir(request["cwd"])
+            self.prepare(request["argv"])
+        except (OSError, RuntimeError, SystemExit) as exc:
+            _send(conn, {"error": f"Unable to prepare the runtime: {exc}"})
+            self.config_key = None
+            return
+
+        reader, writer = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os.close(reader)
+            server.close()
+            _run_request(conn, request, writer)
+        os.close(writer)
+        with os.fdopen(reader, encoding="utf-8") as channel:
+            data = channel.read()
+        _, status = os.waitpid(pid, 0)
+        if status:
+            _logger.warning("Lint request failed with status %s", status)
+            # syntax check workers might have been left in the middle of a check
+            self.config_key = None
+            return
+        self._refresh_parsed_files(request["cwd"], json.loads(data or "[]"))
+
+    def prepare(self, argv: list[str]) -> None:
+        """Prepare the runtime for the configuration used by a request."""
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint._internal.syntax_check import close_workers, start_workers
+        from ansiblelint._mockings import _perform_mockings
+        from ansiblelint.app import clear_app_cache, get_app
+        from ansiblelint.config import options
+
+        config_key = _config_key(argv)
+        if config_key == self.config_key:
+            # the previous request removed the mocked roles while cleaning up
+            _perform_mockings(options)
+            return
+
+        from ansiblelint.__main__ import initialize_options, release_cache_dir_lock
+        from ansiblelint.rules import RulesCollection
+        from ansiblelint.runner import get_syntax_check_env
+
+        _logger.info("Preparing the runtime for a new configuration.")
+        close_workers()
+        clear_app_cache()
+        cache_dir_lock = initialize_options(argv)
+        try:
+            app = get_app(offline=None, cached=True)
+            # listing plugins needs running ansible-doc
+            _ = app.become_methods
+            # imports the rule modules used by the configuration
+            RulesCollection(
+                app=app,
+                rulesdirs=options.rulesdirs,
+                profile_name=options.profile,
+                options=options,
+            )
+        finally:
+            release_cache_dir_lock(cache_dir_lock)
+        start_workers(get_syntax_check_env(app), SYNTAX_CHECK_WORKERS)
+        self.config_key = config_key
+
+    @staticmethod
+    def _refresh_parsed_files(cwd: str, files: list[list[str]]) -> None:
+        """Parse again the files parsed by a request, if they changed."""
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.file_utils import Lintable
+
+        os.chdir(cwd)
+        for name, kind in files:
+            lintable = Lintable(name, kind=kind)  # type: ignore[arg-type]
+            if not lintable.path.is_file():
+                continue
+            with contextlib.suppress(Exception):
+                _ = lintable.data
+
+
+def _config_key(argv: list[str]) -> str:
+    """Return a key identifying the configuration used by a request."""
+    # pylint: disable=import-outside-toplevel
+    from dataclasses import asdict
+
+    from ansiblelint.cache import _REPORTING_OPTIONS
+    from ansiblelint.cli import get_config
+
+    with contextlib.redirect_stderr(io.StringIO()):
+        config: Options = get_config(argv)
+    project_dir = Path(config.project_dir).resolve()
+    stamps = {}
+    for name in (
+        "requirements.yml",
+        "collections/requirements.yml",
+        "galaxy.yml",
+        ".yamllint",
+        ".yamllint.yaml",
+        ".yamllint.yml",
+    ):
+        with contextlib.suppress(OSError):
+            stamps[name] = (project_dir / name).stat().st_mtime_ns
+    return json.dumps(
+        {
+            "options": {
+                key: value
+                for key, value in asdict(config).items()
+                # the formatter is created along with the application
+                if key not in _REPORTING_OPTIONS
+                or key in ("format", "display_relative_path")
+            },
+            "cwd": str(Path.cwd()),
+            "project_dir": str(project_dir),
+            "stamps": stamps,
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _run_request(
+    conn: socket.socket, request: dict[str, Any], writer: int
+) -> None:  # pragma: no cover
+    """Run the linter for a request, inside the forked child."""
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.__main__ import main
+    from ansiblelint.config import log_entries
+    from ansiblelint.utils import parsed_files
+
+    log_entries.clear()
+    returncode = 1
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        os.dup2(stdout.fileno(), sys.stdout.fileno())
+        os.dup2(stderr.fileno(), sys.stderr.fileno())
+        if request.get("stdin") is not None:
+            sys.stdin = io.StringIO(request["stdin"])
+        try:
+            returncode = main(["ansible-lint", *request["argv"]])
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                returncode = exc.code or 0
+            else:
+                print(exc.code, file=sys.stderr)  # ruff:ignore[print]
+        except KeyboardInterrupt:
+            returncode = 130
+        except BaseException:  # pylint: disable=broad-exception-caught # ruff:ignore[blind-except]
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            stdout.seek(0)
+            stderr.seek(0)
+            with contextlib.suppress(OSError):
+                _send(
+                    conn,
+                    {
+                        "returncode": returncode,
+                        "stdout": stdout.read().decode("utf-8", errors="replace"),
+                        "stderr": stderr.read().decode("utf-8", errors="replace"),
+                    },
+                )
+            with os.fdopen(writer, "w", encoding="utf-8") as channel:
+                json.dump(
+                    [
+                        [name, kind]
+                        for name, kind, _ in parsed_files()
+                        if kind != "None"
+                    ],
+                    channel,
+                )
+            # skip atexit handlers, which would stop the syntax check workers
+            # shared with the daemon
+            os._exit(0)
+
+
+def serve(argv: list[str]) -> int:
+    """Run the daemon until interrupted."""
+    server = LintServer(default_socket_path())
+    server.prepare([arg for arg in argv[1:] if arg != "--serve"])
+    # stop gracefully when terminated, removing the socket
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+    return 0
+
+
+def _run_locally(argv: list[str], stdin: str | None) -> int:
+    """Run the linter without the daemon."""
+    cmd = [sys.executable, "-m", "ansiblelint", *argv]
+    if stdin is None:
+        os.execv(sys.executable, cmd)  # ruff:ignore[start-process-with-no-shell]
+    return subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+        cmd, input=stdin, text=True, check=False
+    ).returncode
+
+
+def request_lint(
+    argv: list[str], stdin: str | None = None, socket_path: Path | None = None
+) -> dict[str, Any]:
+    """Ask the daemon to lint, returning its response.
+
+    PermissionError is raised, before sending anything, when the socket could
+    have been created by another user.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.output import should_do_markup
+
+    if not any(arg in ("--nocolor", "--force-color") for arg in argv):
+        argv = ["--force-color" if should_do_markup() else "--nocolor", *argv]
+    socket_path = socket_path or default_socket_path()
+    _check_socket(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        _send(
+            conn,
+            {
+                "argv": argv,
+                "cwd": str(Path.cwd()),
+                "env": _ansible_env(),
+                "stdin": stdin,
+            },
+        )
+        return _receive(conn)
+
+
+def client() -> None:
+    """Lint using the daemon, or without it when it is not running."""
+    argv = sys.argv[1:]
+    stdin = None
+    if not hasattr(socket, "AF_UNIX") or not default_socket_path().exists():
+        sys.exit(_run_locally(argv, stdin))
+    if "-" in argv or "/dev/stdin" in argv:
+        stdin = sys.stdin.read()
+    try:
+        response = request_lint(argv, stdin)
+    except PermissionError as exc:
+        response = {"error": f"{exc}."}
+    except (OSError, ValueError):
+        response = {"error": "Unable to reach the daemon."}
+    if "error" in response:
+        print(f"{response['error']} Running without it.", file=sys.stderr)  # ruff:ignore[print]
+        sys.exit(_run_locally(argv, stdin))
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["returncode"])
+
+
+if __name__ == "__main__":
+    client()
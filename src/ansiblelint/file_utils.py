@@ -2,33 +2,51 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import copy
+import fnmatch
+import itertools
 import logging
 import os
+import re
+import shutil
+import subprocess
 import sys
+import threading
 from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from functools import lru_cache
-from pathlib import Path
+from pathlib import Path, PurePath
 from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, Any, cast
 
 import pathspec
+import wcmatch.glob
 import wcmatch.pathlib
 from yaml.error import YAMLError
 
 from ansiblelint.config import ANSIBLE_OWNED_KINDS, BASE_KINDS, Options, options
 from ansiblelint.constants import CONFIG_FILENAMES, FileType, States
+from ansiblelint.profiling import profiler
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
     from ansiblelint.errors import MatchError
+    from ansiblelint.utils import Task
+
+    # .gitignore files found along a walk, with the folders containing them
+    _GitIgnores = tuple[tuple[Path, pathspec.GitIgnoreSpec], ...]
 
 
 _logger = logging.getLogger(__package__)
 
 ROLE_SUBDIRS = ("tasks", "meta", "vars", "defaults", "handlers")
+# number of paths and folders whose classification is remembered
+PATH_CACHE_SIZE = 16384
+KIND_GLOB_FLAGS = wcmatch.glob.GLOBSTAR | wcmatch.glob.BRACE | wcmatch.glob.DOTGLOB
+# characters making a shell pattern out of a path, for fnmatch
+_GLOB_MAGIC = re.compile(r"[*?[]")
 
 
 def _has_role_subdirs(path: Path) -> bool:
@@ -39,15 +57,23 @@ def _has_role_subdirs(path: Path) -> bool:
 def find_role_dir(path: Path) -> Path | None:
     """Return the innermost roles/ descendant that looks like a role root."""
     current = path if path.is_dir() else path.parent
-    found: Path | None = None
-    while current.name:
-        if (
-            "roles" in current.parts
-            and current.name != "roles"
-            and _has_role_subdirs(current)
-        ):
-            found = current
-        current = current.parent
+    # relative folders are only the same folder from the same working directory
+    return _find_role_dir(current, "" if current.is_absolute() else os.getcwd())
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _find_role_dir(directory: Path, cwd: str) -> Path | None:
+    """Find the role root of a folder, reusing the answers for its parents."""
+    if not directory.name:
+        return None
+    found = _find_role_dir(directory.parent, cwd)
+    if (
+        found is None
+        and "roles" in directory.parts
+        and directory.name != "roles"
+        and _has_role_subdirs(directory)
+    ):
+        found = directory
     return found
 
 
@@ -174,29 +200,123 @@ def _resolve_kind_glob_path(path: Path) -> wcmatch.pathlib.PurePath:
         return wcmatch.pathlib.PurePath(str(path.absolute().resolve()))
 
 
+class KindMatcher:
+    """Match paths against the glob patterns of file kinds, all at once.
+
+    The patterns are translated once into a single regular expression, whose
+    first matching alternative is the first matching kind.
+    """
+
+    def __init__(self, patterns: tuple[tuple[str, str], ...]) -> None:
+        """Compile the (kind, glob pattern) pairs, in the order they apply."""
+        self.kinds = [kind for kind, _ in patterns]
+        self.regexes = []
+        for _, pattern in patterns:
+            positive, _ = wcmatch.glob.translate(pattern, flags=KIND_GLOB_FLAGS)
+            self.regexes.append(re.compile("|".join(positive) or "(?!)"))
+        self.regex = re.compile(
+            "|".join(
+                f"(?P<kind{index}>{regex.pattern})"
+                for index, regex in enumerate(self.regexes)
+            )
+            or "(?!)",
+        )
+
+    def match(self, path: str) -> Iterator[str]:
+        """Yield the kinds whose pattern matches the path, in order."""
+        found = self.regex.fullmatch(path)
+        if found is None or found.lastgroup is None:
+            return
+        first = int(found.lastgroup.removeprefix("kind"))
+        yield self.kinds[first]
+        for index in range(first + 1, len(self.kinds)):
+            if self.regexes[index].fullmatch(path):
+                yield self.kinds[index]
+
+
+def _alternatives(regexes: Iterable[str]) -> re.Pattern[str]:
+    """Compile regular expressions into one matching any of them."""
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes) or "(?!)")
+
+
+class ExcludeMatcher:
+    """Match paths against the ``exclude_paths`` patterns, all at once.
+
+    A path is excluded when its absolute form starts with a pattern or
+    matches it as a shell pattern, or when the path matches it like
+    ``PurePath.match`` does, from the right. Patterns are translated once
+    into regular expressions and the verdict of each path is remembered.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        """Compile the patterns, in the absolute and relative forms to match."""
+        self.prefix = _alternatives(re.escape(pattern) for pattern in patterns)
+        self.glob = _alternatives(fnmatch.translate(pattern) for pattern in patterns)
+        # PurePath.match can only match absolute patterns against absolute
+        # paths, which the shell patterns above already do
+        relative = [
+            PurePath(pattern).parts
+            for pattern in patterns
+            if not os.path.isabs(pattern)
+        ]
+        # single part patterns match the file name
+        self.name = _alternatives(
+            fnmatch.translate(parts[0]) for parts in relative if len(parts) == 1
+        )
+        # literal patterns match the last parts of the path
+        self.tail = _alternatives(
+            "(?:^|/)" + "/".join(re.escape(part) for part in parts) + r"\Z"
+            for parts in relative
+            if len(parts) > 1 and not any(map(_GLOB_MAGIC.search, parts))
+        )
+        self.path_patterns = [
+            "/".join(parts)
+            for parts in relative
+            if len(parts) > 1 and any(map(_GLOB_MAGIC.search, parts))
+        ]
+        self._verdicts: dict[tuple[str, str, str], bool] = {}
+
+    def match_abspath(self, abs_path: str) -> bool:
+        """Return true if an absolute path starts with or matches a pattern."""
+        return bool(self.prefix.match(abs_path) or self.glob.match(abs_path))
+
+    def match(self, path: Path, abs_path: str, text: str = "") -> bool:
+        """Return true if a path is excluded, text being also matched by the patterns."""
+        key = (abs_path, str(path), text)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = bool(
+                self.match_abspath(abs_path)
+                or (path.parts and self.name.match(path.parts[-1]))
+                or self.tail.search(path.as_posix())
+                or any(path.match(pattern) for pattern in self.path_patterns)
+                or (text and self.glob.match(text))
+            )
+            self._verdicts[key] = verdict
+        return verdict
+
+
+def _kind_patterns(kinds: list[dict[str, str]]) -> tuple[tuple[str, str], ...]:
+    return tuple((str(k), v) for entry in kinds for k, v in entry.items())
+
+
+@lru_cache(maxsize=8)
+def _kind_matcher(patterns: tuple[tuple[str, str], ...]) -> KindMatcher:
+    return KindMatcher(patterns)
+
+
 def _match_kind_from_globs(
     pathex: wcmatch.pathlib.PurePath,
-    kinds: list[dict[str, str]],
+    patterns: tuple[tuple[str, str], ...],
     path: Path,
 ) -> FileType | None:
     """Return the first kind whose glob pattern matches path, if any."""
-    for entry in kinds:
-        for k, v in entry.items():
-            if not pathex.globmatch(
-                v,
-                flags=(
-                    wcmatch.pathlib.GLOBSTAR
-                    | wcmatch.pathlib.BRACE
-                    | wcmatch.pathlib.DOTGLOB
-                ),
-            ):
-                continue
-            matched_kind = str(k)
-            # Namespace folders under roles/ can match **/roles/*/ without
-            # being role roots themselves. See #5079.
-            if matched_kind == "role" and path.is_dir() and not _has_role_subdirs(path):
-                continue
-            return matched_kind  # type: ignore[return-value]
+    for matched_kind in _kind_matcher(patterns).match(str(pathex)):
+        # Namespace folders under roles/ can match **/roles/*/ without
+        # being role roots themselves. See #5079.
+        if matched_kind == "role" and path.is_dir() and not _has_role_subdirs(path):
+            continue
+        return matched_kind  # type: ignore[return-value]
     return None
 
 
@@ -229,9 +349,20 @@ def kind_from_path(path: Path, *, base: bool = False) -> FileType:
     When called with base=True, it will return the base file type instead
     of the explicit one. That is expected to return 'yaml' for any yaml files.
     """
-    pathex = _resolve_kind_glob_path(path)
     kinds = options.kinds if not base else BASE_KINDS
-    matched_kind = _match_kind_from_globs(pathex, kinds, path)
+    return _kind_from_path(os.path.abspath(path), _kind_patterns(kinds), base=base)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _kind_from_path(
+    name: str,
+    patterns: tuple[tuple[str, str], ...],
+    *,
+    base: bool,
+) -> FileType:
+    path = Path(name)
+    pathex = _resolve_kind_glob_path(path)
+    matched_kind = _match_kind_from_globs(pathex, patterns, path)
     if matched_kind is not None:
         return matched_kind
 
@@ -274,14 +405,15 @@ class Lintable:
             0  # Amount to offset line numbers by to get accurate position
         )
         self.matches: list[MatchError] = []
-
-        if isinstance(name, str):
-            name = Path(name)
-        is_relative = is_relative_to(name, str(name.cwd()))
-        name = name.resolve()
-        if is_relative:
-            name = name.relative_to(name.cwd())
-        name = normpath_path(name)
+        self._tasks: list[Task] | None = None
+
+        # same as normpath_path(), resolving the path only once
+        resolved = Path(name).resolve()
+        name = resolved
+        if resolved.is_relative_to(Path.cwd()):
+            name = resolved.relative_to(Path.cwd())
+        elif resolved.is_relative_to(Path.home()):
+            name = Path("~") / resolved.relative_to(Path.home())
         # we need to be sure that we expanduser() because otherwise a simple
         # test like .path.exists() will return unexpected results.
         self.path = name.expanduser()
@@ -289,6 +421,8 @@ class Lintable:
         self.name = self.filename = str(name)
 
         self._content = self._original_content = content
+        # content read from disk can be dropped by release and read again
+        self._content_from_disk = False
         self.updated = False
 
         # if the lintable is part of a role, we save role folder name
@@ -317,9 +451,9 @@ class Lintable:
         # We store absolute directory in dir
         if not self.dir:
             if self.kind == "role":
-                self.dir = str(self.path.resolve())
+                self.dir = str(resolved)
             else:
-                self.dir = str(self.path.parent.resolve())
+                self.dir = str(resolved.parent)
 
         # determine base file kind (yaml, xml, ini, ...)
         self.base_kind = base_kind or kind_from_path(self.path, base=True)
@@ -377,6 +511,7 @@ class Lintable:
     def _populate_content_cache_from_disk(self) -> None:
         # Can raise UnicodeDecodeError
         self._content = self.path.expanduser().resolve().read_text(encoding="utf-8")
+        self._content_from_disk = True
 
         if self._original_content is None:
             self._original_content = self._content
@@ -414,6 +549,20 @@ class Lintable:
         """Reset the internal content cache."""
         self._content = None
 
+    def release(self) -> None:
+        """Drop the parsed data and the content read from disk.
+
+        Both are loaded again when needed, which allows keeping many lintables
+        without keeping all their data in memory. Updated content and loading
+        failures are kept.
+        """
+        if self.state is not States.LOAD_FAILED:
+            self.state = States.NOT_LOADED
+        self._tasks = None
+        if self._content_from_disk and not self.updated:
+            self._content = self._original_content = None
+            self._content_from_disk = False
+
     def write(self, *, force: bool = False) -> None:
         """Write the value of ``Lintable.content`` to disk.
 
@@ -431,7 +580,13 @@ class Lintable:
         .. code:: python
 
             lintable.write(force=True)
+
+        Content embedded in its parent file, like the EXAMPLES of a plugin,
+        is never written, as it would replace the whole parent file.
         """
+        if self.parent is not None and self.parent.path == self.path:
+            _logger.debug("Not writing %s, embedded in its parent.", self.path)
+            return
         dump_filename = self.path.expanduser().resolve()
         if os.environ.get("ANSIBLE_LINT_WRITE_TMP", "0") == "1":
             dump_filename = dump_filename.with_suffix(
@@ -477,16 +632,17 @@ class Lintable:
             parse_yaml_linenumbers,
         )
 
-        self.state = parse_yaml_linenumbers(self)
-        if self.kind == "yaml":
-            self._guess_kind()
-        if "append_skipped_rules" not in globals():
-            # pylint: disable=import-outside-toplevel
-            from ansiblelint.skip_utils import append_skipped_rules
+        with profiler.phase("yaml load"):
+            self.state = parse_yaml_linenumbers(self)
+            if self.kind == "yaml":
+                self._guess_kind()
+            if "append_skipped_rules" not in globals():
+                # pylint: disable=import-outside-toplevel
+                from ansiblelint.skip_utils import append_skipped_rules
 
-        # pylint: disable=possibly-used-before-assignment
-        if self.state:
-            self.state = append_skipped_rules(self.state, self)
+            # pylint: disable=possibly-used-before-assignment
+            if self.state:
+                self.state = append_skipped_rules(self.state, self)
 
     @property
     def data(self) -> Any:
@@ -517,8 +673,82 @@ class Lintable:
                 self.exc = exc
         return self.state
 
+    @property
+    def tasks(self) -> list[Task]:
+        """Return the normalized tasks found inside the file.
+
+        The task index is built only once per lintable and shared by all the
+        rules, so each task is normalized a single time instead of once per
+        rule.
+        """
+        if self._tasks is None:
+            # pylint: disable=import-outside-toplevel
+            from ansiblelint.utils import task_in_list
+
+            self._tasks = list(
+                task_in_list(data=self.data, file=self, kind=str(self.kind))
+            )
+        return self._tasks
+
 
 # pylint: disable=redefined-outer-name
+class LintableRegistry:
+    """Hand out a single Lintable per file and kind during a linting run.
+
+    Files are usually reached many times, like task files included by several
+    plays or roles used by several playbooks. Reusing the same Lintable avoids
+    classifying them again, and lets the state recorded on them, like
+    stop_processing, be seen by everyone. Syntax checks running in other
+    threads can use it too.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._lintables: dict[tuple[str, FileType | None], Lintable] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(name: str | Path) -> str:
+        return os.path.realpath(os.path.expanduser(name))
+
+    def get(
+        self,
+        name: str | Path,
+        kind: FileType | None = None,
+        parent: Lintable | None = None,
+    ) -> Lintable:
+        """Return the Lintable of a file, creating it when needed.
+
+        The parent is only recorded when the Lintable is created, as the
+        first file including another one is the one used to resolve its own
+        includes.
+        """
+        path = self._key(name)
+        with self._lock:
+            lintable = self._lintables.get((path, kind))
+            if lintable is None:
+                lintable = Lintable(name, kind=kind)
+                if parent is not None:
+                    lintable.parent = parent
+                self.add(lintable, path)
+                self._lintables[path, kind] = lintable
+        return lintable
+
+    def add(self, lintable: Lintable, path: str | None = None) -> None:
+        """Make a Lintable the one returned for its file, unless there is one."""
+        path = path or self._key(lintable.path)
+        with self._lock:
+            self._lintables.setdefault((path, lintable.kind), lintable)
+            self._lintables.setdefault((path, None), lintable)
+
+
+def clear_path_caches() -> None:
+    """Forget the kinds and role folders found for paths, as files changed."""
+    _find_role_dir.cache_clear()
+    _kind_from_path.cache_clear()
+    _get_project_root_for_dir.cache_clear()
+
+
 def discover_lintables(options: Options) -> list[str]:
     """Find all files that we know how to lint.
 
@@ -533,6 +763,7 @@ def discover_lintables(options: Options) -> list[str]:
         for filename in get_all_files(
             *[Path(s) for s in options.lintables],
             exclude_paths=options.exclude_paths,
+            jobs=options.jobs,
         )
     ]
 
@@ -602,6 +833,37 @@ def path_is_inside(child: Path, parent: Path) -> bool:
     return True
 
 
+def get_changed_files(revision: str) -> set[Path]:
+    """Return the absolute paths of files changed since a git revision.
+
+    Committed, staged and unstaged changes are included, as well as untracked
+    files not ignored by git.
+    """
+    git_cmd = shutil.which("git")
+    if not git_cmd:
+        msg = "Unable to find files changed since a revision without git."
+        raise RuntimeError(msg)
+
+    def git(*args: str) -> list[str]:
+        result = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+            [git_cmd, *args],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            msg = f"Unable to find files changed since '{revision}': {result.stderr.strip()}"
+            raise RuntimeError(msg)
+        return [item.strip() for item in result.stdout.split("\0") if item.strip()]
+
+    top_level = Path(git("rev-parse", "--show-toplevel")[0])
+    names = [
+        *git("diff", "--name-only", "-z", revision, "--"),
+        *git("-C", str(top_level), "ls-files", "--others", "--exclude-standard", "-z"),
+    ]
+    return {(top_level / name).resolve() for name in names}
+
+
 def expand_dirs_in_lintables(lintables: set[Lintable]) -> None:
     """Return all recognized lintables within given directory."""
     should_expand = False
@@ -641,58 +903,212 @@ def _guess_parent(lintable: Lintable) -> Lintable | None:
     return None
 
 
+# files and folders never worth linting, whatever the ignore files say
+DEFAULT_EXCLUDES = (
+    ".ansible",
+    ".git",
+    ".tox",
+    ".mypy_cache",
+    "__pycache__",
+    ".DS_Store",
+    ".coverage",
+    ".pytest_cache",
+    ".ruff_cache",
+)
+
+
+def _git_files(path: Path) -> list[Path] | None:
+    """Return the files git knows about below a folder, tracked or not.
+
+    Files ignored by git are left out, using all the ignore files of the
+    repository. None is returned when the folder is not inside a repository.
+    """
+    git_cmd = shutil.which("git")
+    if not git_cmd:
+        return None
+    try:
+        result = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+            [
+                git_cmd,
+                "-C",
+                str(path),
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+            ],
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return [path / os.fsdecode(name) for name in result.stdout.split(b"\0") if name]
+
+
+def _scan_dir(
+    directory: Path,
+    base_spec: pathspec.GitIgnoreSpec,
+    gitignores: _GitIgnores,
+) -> tuple[list[Path], list[tuple[Path, _GitIgnores]]]:
+    """Return the files and the folders to visit found inside a folder."""
+    gitignore = directory / ".gitignore"
+    if gitignore.is_file():
+        _logger.info("Loading ignores from %s", gitignore)
+        with gitignore.open(encoding="UTF-8") as f:
+            gitignores = (
+                *gitignores,
+                (directory, pathspec.GitIgnoreSpec.from_lines(f.read().splitlines())),
+            )
+    files: list[Path] = []
+    folders: list[tuple[Path, _GitIgnores]] = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError as exc:
+        _logger.debug("Unable to list %s: %s", directory, exc)
+        return files, folders
+    for entry in entries:
+        item = directory / entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if _is_ignored(item, is_dir=is_dir, base_spec=base_spec, gitignores=gitignores):
+            _logger.debug("Excluded: %s", item)
+        elif is_dir:
+            if not _is_symlink_loop(entry):
+                folders.append((item, gitignores))
+        elif entry.is_file():
+            files.append(item)
+    return files, folders
+
+
+def _is_ignored(
+    item: Path,
+    *,
+    is_dir: bool,
+    base_spec: pathspec.GitIgnoreSpec,
+    gitignores: _GitIgnores,
+) -> bool:
+    """Check if a file or folder is excluded or ignored by a .gitignore file."""
+    name = pathspec.util.append_dir_sep(item) if is_dir else str(item)
+    if base_spec.match_file(name):
+        return True
+    # the nearest .gitignore matching the item decides, like git does
+    for directory, spec in reversed(gitignores):
+        relative = item.relative_to(directory)
+        result = spec.check_file(
+            pathspec.util.append_dir_sep(relative) if is_dir else str(relative),
+        )
+        if result.include is not None:
+            return result.include
+    return False
+
+
+def _is_symlink_loop(entry: os.DirEntry[str]) -> bool:
+    """Check if a folder is a symlink pointing to one of its parent folders."""
+    if not entry.is_symlink():
+        return False
+    target = os.path.realpath(entry.path)
+    parent = os.path.realpath(os.path.dirname(entry.path))
+    return parent == target or parent.startswith(target + os.sep)
+
+
+def _walk_files(
+    root: Path,
+    base_spec: pathspec.GitIgnoreSpec,
+    jobs: int = 1,
+) -> list[Path]:
+    """Retrieve all the files below a folder, level by level."""
+    all_files: list[Path] = []
+    level: list[tuple[Path, _GitIgnores]] = [(root, ())]
+    workers = jobs if jobs > 0 else os.cpu_count() or 1
+    with ExitStack() as stack:
+        mapper: Callable[..., Iterable[Any]] = map
+        if workers > 1:
+            mapper = stack.enter_context(
+                concurrent.futures.ThreadPoolExecutor(max_workers=workers),
+            ).map
+        while level:
+            results = mapper(
+                _scan_dir,
+                [directory for directory, _ in level],
+                itertools.repeat(base_spec),
+                [gitignores for _, gitignores in level],
+            )
+            level = []
+            for files, folders in results:
+                all_files.extend(files)
+                level.extend(folders)
+    return all_files
+
+
+def _in_excluded_dir(
+    directory: Path,
+    base_spec: pathspec.GitIgnoreSpec,
+    verdicts: dict[Path, bool],
+) -> bool:
+    """Return true if a folder or one of its parents is excluded.
+
+    Verdicts are remembered for each folder, so the files of excluded
+    folders, like vendored collections, are not matched one by one.
+    """
+    verdict = verdicts.get(directory)
+    if verdict is None:
+        verdict = directory != directory.parent and (
+            _in_excluded_dir(directory.parent, base_spec, verdicts)
+            or base_spec.match_file(pathspec.util.append_dir_sep(directory))
+        )
+        verdicts[directory] = verdict
+    return verdict
+
+
 def get_all_files(
     *paths: Path,
     exclude_paths: list[str] | None = None,
+    jobs: int = 1,
 ) -> list[Path]:
-    """Recursively retrieve all files from given folders."""
+    """Recursively retrieve all files from given folders.
+
+    Inside a git repository, git is asked for the files it tracks or would
+    track, so all its ignore files are honored. Elsewhere the folders are
+    walked, honoring the .gitignore files found along the way. Folders are
+    listed by several threads when jobs is not one, 0 using all the CPUs.
+    Folders in which git finds no file at all, like ignored ones given
+    explicitly, are walked too.
+    """
     all_files: list[Path] = []
-    exclude_paths = [] if exclude_paths is None else exclude_paths
+    base_spec = pathspec.GitIgnoreSpec.from_lines(
+        [*DEFAULT_EXCLUDES, *(exclude_paths or [])],
+    )
 
-    def is_excluded(path_to_check: Path) -> bool:
-        """Check if a file is exclude by current specs."""
-        return any(
-            spec.match_file(pathspec.util.append_dir_sep(path_to_check))
-            for spec in pathspecs
-        )
+    # folders can decide for their files unless patterns include files again
+    excluded_dirs: dict[Path, bool] | None = (
+        None if any(pattern.include is False for pattern in base_spec.patterns) else {}
+    )
 
     for path in paths:
-        pathspecs = [
-            pathspec.GitIgnoreSpec.from_lines(
-                [
-                    ".ansible",
-                    ".git",
-                    ".tox",
-                    ".mypy_cache",
-                    "__pycache__",
-                    ".DS_Store",
-                    ".coverage",
-                    ".pytest_cache",
-                    ".ruff_cache",
-                    *exclude_paths,
-                ],
-            ),
-        ]
-        gitignore = path / ".gitignore"
-        if gitignore.exists():
-            with gitignore.open(encoding="UTF-8") as f:
-                _logger.info("Loading ignores from %s", gitignore)
-                pathspecs.append(
-                    pathspec.GitIgnoreSpec.from_lines(f.read().splitlines()),
-                )
-
-        # Iterate over all items in the directory
         if path.is_file():
             all_files.append(path)
-        else:
-            for item in sorted(path.iterdir()):
-                if is_excluded(item):
+            continue
+        found: list[Path] = []
+        git_files = _git_files(path) if path.is_dir() else None
+        if git_files:
+            for item in git_files:
+                if (
+                    excluded_dirs is not None
+                    and _in_excluded_dir(item.parent, base_spec, excluded_dirs)
+                ) or base_spec.match_file(str(item)):
                     _logger.debug("Excluded: %s", item)
-                    continue
-                if item.is_file():
-                    all_files.append(item)
-                # If it's a directory, recursively call the function
                 elif item.is_dir():
-                    all_files.extend(get_all_files(item, exclude_paths=exclude_paths))
+                    # submodules and nested repositories
+                    found.extend(_walk_files(item, base_spec, jobs))
+                elif item.is_file():
+                    found.append(item)
+        elif path.is_dir():
+            found = _walk_files(path, base_spec, jobs)
+        all_files.extend(sorted(found))
 
     return all_files
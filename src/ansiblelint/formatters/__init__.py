@@ -6,7 +6,7 @@ import hashlib
 import json
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import IO, TYPE_CHECKING, Any, Generic, TypeVar
 
 from ansiblelint.config import options
 from ansiblelint.version import __version__
@@ -146,38 +146,36 @@ class CodeclimateJSONFormatter(BaseFormatter[Any]):
             msg = f"The {self.__class__} was expecting a list of MatchError."
             raise TypeError(msg)
 
-        result = []
-        for match in matches:
-            issue: dict[str, Any] = {}
-            issue["type"] = "issue"
-            issue["check_name"] = match.tag or match.rule.id  # rule-id[subrule-id]
-            issue["categories"] = match.rule.tags
-            if match.rule.url:
-                # https://github.com/codeclimate/platform/issues/68
-                issue["url"] = match.rule.url
-            issue["severity"] = self._remap_severity(match)
-            issue["description"] = self.escape(str(match.message))
-            issue["fingerprint"] = hashlib.sha256(
-                repr(match).encode("utf-8"),
-            ).hexdigest()
-            issue["location"] = {}
-            issue["location"]["path"] = self._format_path(match.filename or "")
-            if match.column:
-                issue["location"]["positions"] = {}
-                issue["location"]["positions"]["begin"] = {}
-                issue["location"]["positions"]["begin"]["line"] = match.lineno
-                issue["location"]["positions"]["begin"]["column"] = match.column
-            else:
-                issue["location"]["lines"] = {}
-                issue["location"]["lines"]["begin"] = match.lineno
-            if match.details:
-                issue["content"] = {}
-                issue["content"]["body"] = match.details
-            # Append issue to result list
-            result.append(issue)
-
         # Keep it single line due to https://github.com/ansible/ansible-navigator/issues/1490
-        return json.dumps(result, sort_keys=False)
+        return json.dumps([self._to_issue(match) for match in matches], sort_keys=False)
+
+    def _to_issue(self, match: MatchError) -> dict[str, Any]:
+        issue: dict[str, Any] = {}
+        issue["type"] = "issue"
+        issue["check_name"] = match.tag or match.rule.id  # rule-id[subrule-id]
+        issue["categories"] = match.rule.tags
+        if match.rule.url:
+            # https://github.com/codeclimate/platform/issues/68
+            issue["url"] = match.rule.url
+        issue["severity"] = self._remap_severity(match)
+        issue["description"] = self.escape(str(match.message))
+        issue["fingerprint"] = hashlib.sha256(
+            repr(match).encode("utf-8"),
+        ).hexdigest()
+        issue["location"] = {}
+        issue["location"]["path"] = self._format_path(match.filename or "")
+        if match.column:
+            issue["location"]["positions"] = {}
+            issue["location"]["positions"]["begin"] = {}
+            issue["location"]["positions"]["begin"]["line"] = match.lineno
+            issue["location"]["positions"]["begin"]["column"] = match.column
+        else:
+            issue["location"]["lines"] = {}
+            issue["location"]["lines"]["begin"] = match.lineno
+        if match.details:
+            issue["content"] = {}
+            issue["content"]["body"] = match.details
+        return issue
 
     @staticmethod
     def _remap_severity(match: MatchError) -> str:
@@ -192,6 +190,24 @@ class CodeclimateJSONFormatter(BaseFormatter[Any]):
         return "major"
 
 
+class NDJSONFormatter(CodeclimateJSONFormatter):
+    """Formatter for emitting violations as newline-delimited JSON.
+
+    Each violation is written as a Codeclimate issue on its own line, so the
+    output can be consumed while the linting is still running.
+    """
+
+    def apply(self, match: MatchError) -> str:
+        return json.dumps(self._to_issue(match), sort_keys=False)
+
+    def format_result(self, matches: list[MatchError]) -> str:
+        """Format a list of match errors as JSON lines."""
+        if not isinstance(matches, list):
+            msg = f"The {self.__class__} was expecting a list of MatchError."
+            raise TypeError(msg)
+        return "\n".join(self.apply(match) for match in matches)
+
+
 class SarifFormatter(BaseFormatter[Any]):
     """Formatter for emitting violations in SARIF report format.
 
@@ -213,27 +229,14 @@ class SarifFormatter(BaseFormatter[Any]):
             msg = f"The {self.__class__} was expecting a list of MatchError."
             raise TypeError(msg)
 
-        root_path = Path(str(self.base_dir)).as_uri()
-        root_path = root_path + "/" if not root_path.endswith("/") else root_path
         rules, results = self._extract_results(matches)
 
-        tool = {
-            "driver": {
-                "name": self.TOOL_NAME,
-                "version": __version__,
-                "informationUri": self.TOOL_URL,
-                "rules": rules,
-            },
-        }
-
         runs = [
             {
-                "tool": tool,
+                "tool": self._tool(rules),
                 "columnKind": "utf16CodeUnits",
                 "results": results,
-                "originalUriBaseIds": {
-                    self.BASE_URI_ID: {"uri": root_path},
-                },
+                "originalUriBaseIds": self._original_uri_base_ids(),
             },
         ]
 
@@ -245,6 +248,21 @@ class SarifFormatter(BaseFormatter[Any]):
         # Keep it single line due to https://github.com/ansible/ansible-navigator/issues/1490
         return json.dumps(report, sort_keys=False)
 
+    def _tool(self, rules: list[Any]) -> dict[str, Any]:
+        return {
+            "driver": {
+                "name": self.TOOL_NAME,
+                "version": __version__,
+                "informationUri": self.TOOL_URL,
+                "rules": rules,
+            },
+        }
+
+    def _original_uri_base_ids(self) -> dict[str, Any]:
+        root_path = Path(str(self.base_dir)).as_uri()
+        root_path = root_path + "/" if not root_path.endswith("/") else root_path
+        return {self.BASE_URI_ID: {"uri": root_path}}
+
     def _extract_results(
         self,
         matches: list[MatchError],
@@ -347,3 +365,45 @@ class SarifFormatter(BaseFormatter[Any]):
             return match.level
 
         return "note"
+
+
+class SarifWriter(SarifFormatter):
+    """Write a SARIF report incrementally, as violations are found.
+
+    Results are written as soon as they are added, while the rules they refer
+    to are written when the report is closed, after the results.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        base_dir: str | Path,
+        display_relative_path: bool,
+    ) -> None:
+        """Start the report."""
+        super().__init__(base_dir, display_relative_path)
+        self.stream = stream
+        self.rules: dict[str, Any] = {}
+        self.count = 0
+        self.stream.write(
+            f'{{"$schema": {json.dumps(self.SARIF_SCHEMA)}, '
+            f'"version": {json.dumps(self.SARIF_SCHEMA_VERSION)}, '
+            '"runs": [{"columnKind": "utf16CodeUnits", '
+            f'"originalUriBaseIds": {json.dumps(self._original_uri_base_ids())}, '
+            '"results": [',
+        )
+
+    def add(self, match: MatchError) -> None:
+        """Write the result of a violation."""
+        if match.tag not in self.rules:
+            self.rules[match.tag] = self._to_sarif_rule(match)
+        result = json.dumps(self._to_sarif_result(match))
+        self.stream.write(f", {result}" if self.count else result)
+        self.stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the report, adding the rules of the violations found."""
+        tool = json.dumps(self._tool(list(self.rules.values())))
+        self.stream.write(f'], "tool": {tool}}}]}}')
+        self.stream.flush()
@@ -1,13 +1,23 @@
 """Utils to generate rules documentation."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ansiblelint.config import PROFILES
 from ansiblelint.constants import RULE_DOC_URL
 from ansiblelint.output import Markdown
-from ansiblelint.rules import RulesCollection, TransformMixin
+
+if TYPE_CHECKING:
+    from ansiblelint.rules import RulesCollection
 
 
 def rules_as_str(rules: RulesCollection) -> str:
     """Return rules as string."""
+    # listing profiles does not need the rules, which import ansible
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.rules import TransformMixin
+
     result = ""
     for rule in rules.alphabetical():
         if issubclass(rule.__class__, TransformMixin):
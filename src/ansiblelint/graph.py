@@ -0,0 +1,84 @@
+"""Graph of the files included by each other, as found by the runner."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ansiblelint.file_utils import Lintable
+
+
+class IncludeGraph:
+    """Files included by each lintable, like roles, tasks or playbooks.
+
+    The graph is filled while the runner discovers the children of each
+    lintable and can be exported as JSON or as a Graphviz DOT file.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty graph."""
+        self.children: dict[Lintable, list[Lintable]] = {}
+
+    def __contains__(self, lintable: Lintable) -> bool:
+        """Return true if the children of lintable were already found."""
+        return lintable in self.children
+
+    def __len__(self) -> int:
+        """Return the number of lintables with known children."""
+        return len(self.children)
+
+    def add(self, lintable: Lintable, children: list[Lintable]) -> None:
+        """Record the children of a lintable."""
+        self.children[lintable] = children
+
+    def get(self, lintable: Lintable) -> list[Lintable]:
+        """Return the known children of a lintable."""
+        return self.children.get(lintable, [])
+
+    def edges(self) -> list[tuple[str, str]]:
+        """Return the sorted and unique (parent, child) name pairs."""
+        return sorted({
+            (parent.name, child.name)
+            for parent, children in self.children.items()
+            for child in children
+        })
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the graph as a JSON serializable dictionary."""
+        nodes: dict[str, str] = {}
+        for parent, children in self.children.items():
+            for lintable in (parent, *children):
+                nodes.setdefault(lintable.name, str(lintable.kind))
+        return {
+            "nodes": [
+                {"name": name, "kind": kind} for name, kind in sorted(nodes.items())
+            ],
+            "edges": [
+                {"parent": parent, "child": child} for parent, child in self.edges()
+            ],
+        }
+
+    def to_dot(self) -> str:
+        """Return the graph in the Graphviz DOT language."""
+        lines = ["digraph includes {"]
+        lines.extend(
+            f"  {json.dumps(node['name'])} [kind={json.dumps(node['kind'])}];"
+            for node in self.to_dict()["nodes"]
+        )
+        lines.extend(
+            f"  {json.dumps(parent)} -> {json.dumps(child)};"
+            for parent, child in self.edges()
+        )
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Write the graph to a file, as DOT if its suffix is ``.dot``."""
+        if path.suffix == ".dot":
+            content = self.to_dot()
+        else:
+            content = json.dumps(self.to_dict(), indent=2) + "\n"
+        path.write_text(content, encoding="utf-8")
@@ -0,0 +1,62 @@
+"""Helpers deciding how linting work is spread over threads and processes."""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from functools import cache
+from pathlib import Path
+
+
+def can_fork() -> bool:
+    """Return true if rules can be run inside forked worker processes."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+@cache
+def threads() -> int:
+    """Determine how many threads to use.
+
+    Inside containers we want to respect limits imposed.
+
+    When present /sys/fs/cgroup/cpu.max can contain something like:
+    $ podman/docker run -it --rm --cpus 1.5 ubuntu:latest cat /sys/fs/cgroup/cpu.max
+    150000 100000
+    # "max 100000" is returned when no limits are set.
+
+    See: https://github.com/python/cpython/issues/80235
+    See: https://github.com/python/cpython/issues/70879
+    """
+    os_cpu_count = multiprocessing.cpu_count()
+    # Cgroup CPU bandwidth limit available in Linux since 2.6 kernel
+
+    cpu_max_fname = Path("/sys/fs/cgroup/cpu.max")
+    cfs_quota_fname = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+    cfs_period_fname = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+    if cpu_max_fname.exists():
+        # cgroup v2
+        # https://www.kernel.org/doc/html/latest/admin-guide/cgroup-v2.html
+        with cpu_max_fname.open(encoding="utf-8") as fh:  # pragma: no cover
+            cpu_quota_us, cpu_period_us = fh.read().strip().split()
+    elif cfs_quota_fname.exists() and cfs_period_fname.exists():
+        # cgroup v1
+        # https://www.kernel.org/doc/html/latest/scheduler/sched-bwc.html#management
+        with cfs_quota_fname.open(encoding="utf-8") as fh:  # pragma: no cover
+            cpu_quota_us = fh.read().strip()
+        with cfs_period_fname.open(encoding="utf-8") as fh:  # pragma: no cover
+            cpu_period_us = fh.read().strip()
+    else:
+        # No Cgroup CPU bandwidth limit (e.g. non-Linux platform)
+        cpu_quota_us = "max"
+        cpu_period_us = "100000"  # unused, for consistency with default values
+
+    if cpu_quota_us == "max":
+        # No active Cgroup quota on a Cgroup-capable platform
+        return os_cpu_count
+    cpu_quota_us_int = int(cpu_quota_us)
+    cpu_period_us_int = int(cpu_period_us)
+    if cpu_quota_us_int > 0 and cpu_period_us_int > 0:
+        return math.ceil(cpu_quota_us_int / cpu_period_us_int)
+    # Setting a negative cpu_quota_us value is a valid way to disable
+    # cgroup CPU bandwidth limits
+    return os_cpu_count
@@ -0,0 +1,112 @@
+"""Measure where the linting time goes, as reported by ``--profile-rules``."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@dataclass
+class Timing:
+    """Cumulative wall time and number of calls of a measured operation."""
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class Profiler:
+    """Collect timings of rule methods and linting phases, when enabled.
+
+    Measurements are exclusive: the time spent inside a measurement nested in
+    another one, like loading a file while running a rule, is only counted
+    by the nested one, so all the timings add up to the measured time.
+    """
+
+    def __init__(self) -> None:
+        """Create a disabled profiler."""
+        self.enabled = False
+        self.rules: dict[tuple[str, str], Timing] = {}
+        self.phases: dict[str, Timing] = {}
+        # time spent in nested measurements, for each running measurement
+        self._nested = threading.local()
+
+    def reset(self) -> None:
+        """Forget all the collected timings."""
+        self.rules.clear()
+        self.phases.clear()
+
+    @contextmanager
+    def _measure(self, timing: Timing) -> Generator[None, None, None]:
+        stack: list[float] | None = getattr(self._nested, "stack", None)
+        if stack is None:
+            stack = self._nested.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            timing.calls += 1
+            timing.seconds += elapsed - stack.pop()
+            if stack:
+                stack[-1] += elapsed
+
+    @contextmanager
+    def rule(self, rule_id: str, method: str) -> Generator[None, None, None]:
+        """Measure a call to a match method of a rule."""
+        if not self.enabled:
+            yield
+            return
+        with self._measure(self.rules.setdefault((rule_id, method), Timing())):
+            yield
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Measure a linting phase."""
+        if not self.enabled:
+            yield
+            return
+        with self._measure(self.phases.setdefault(name, Timing())):
+            yield
+
+    def report(self) -> str:
+        """Return the collected timings, slowest first."""
+        lines = [
+            "# Rule timings",
+            f"{'rule':<28} {'method':<12} {'calls':>8} {'seconds':>9}",
+        ]
+        for (rule_id, method), timing in sorted(
+            self.rules.items(), key=lambda item: -item[1].seconds
+        ):
+            lines.append(
+                f"{rule_id:<28} {method:<12} {timing.calls:>8} {timing.seconds:>9.3f}"
+            )
+        lines.extend([
+            "",
+            "# Phase timings",
+            f"{'phase':<41} {'calls':>8} {'seconds':>9}",
+        ])
+        for name, timing in sorted(
+            self.phases.items(), key=lambda item: -item[1].seconds
+        ):
+            lines.append(f"{name:<41} {timing.calls:>8} {timing.seconds:>9.3f}")
+        total = sum(
+            timing.seconds
+            for timings in (self.rules, self.phases)
+            for timing in timings.values()
+        )
+        lines.extend([
+            "",
+            "Timings exclude the nested phases and rules, so they add up to the",
+            f"total measured time of {total:.3f} seconds.",
+        ])
+        return "\n".join(lines)
+
+
+profiler = Profiler()
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import inspect
+import json
 import logging
 import re
 import sys
 from collections import defaultdict
-from collections.abc import Iterable, Iterator, MutableMapping, MutableSequence
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+)
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -28,6 +36,7 @@ from ansiblelint.config import options as default_options
 from ansiblelint.constants import RULE_DOC_URL, SKIPPED_RULES_KEY
 from ansiblelint.errors import MatchError
 from ansiblelint.file_utils import Lintable, expand_paths_vars
+from ansiblelint.profiling import profiler
 
 if TYPE_CHECKING:
     from ruamel.yaml.comments import CommentedMap, CommentedSeq
@@ -53,6 +62,12 @@ RE_JINJA_STATEMENT = re.compile(r"{%.+?%}", re.DOTALL)
 RE_JINJA_COMMENT = re.compile(r"{#.+?#}", re.DOTALL)
 
 
+# kinds of files in which the default AnsibleLintRule.matchtasks looks for
+# tasks, generic yaml files are included as they can be identified as
+# playbooks once loaded
+_TASKS_KINDS = ("handlers", "tasks", "playbook", "yaml")
+
+
 def _should_skip_play(play: Any, rule_id: str) -> bool:
     if play is None or not hasattr(play, "get"):
         return True
@@ -162,6 +177,8 @@ class AnsibleLintRule(BaseRule):
             )
             if self.id in rule_id_list:
                 continue
+            if self.line_pattern and not re.search(self.line_pattern, line):
+                continue
 
             result = self.match(line)
             if not result:
@@ -192,11 +209,7 @@ class AnsibleLintRule(BaseRule):
         ):
             return matches
 
-        for task in ansiblelint.utils.task_in_list(
-            data=file.data,
-            kind=file.kind,
-            file=file,
-        ):
+        for task in file.tasks:
             if task.error is not None:
                 # normalize_task converts AnsibleParserError to MatchError
                 return [task.error]
@@ -208,10 +221,14 @@ class AnsibleLintRule(BaseRule):
             ):
                 continue
 
+            # Tasks are shared between rules, so the raw task is exposed only
+            # to the rules that asked for it.
             if self.needs_raw_task:
                 task.normalized_task["__raw_task__"] = task.raw_task
-
-            result = self.matchtask(task, file=file)
+            try:
+                result = self.matchtask(task, file=file)
+            finally:
+                task.normalized_task.pop("__raw_task__", None)
             if not result:
                 continue
 
@@ -349,10 +366,209 @@ class TransformMixin:
         return target
 
 
+class LineScanner:
+    """Call the ``match`` method of many rules during a single pass over lines.
+
+    Each file is split once and the ``noqa`` comments of each line are parsed
+    once, instead of once for each rule using the default ``matchlines``.
+    """
+
+    def __init__(self, rules: list[AnsibleLintRule]) -> None:
+        """Prepare the scanner for the given line based rules."""
+        self.rules = rules
+        self.patterns = {
+            rule: re.compile(rule.line_pattern) for rule in rules if rule.line_pattern
+        }
+        # lines not matching any of the patterns only need the other rules
+        self.combined = (
+            re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in self.patterns.values())
+            )
+            if self.patterns
+            else None
+        )
+        self.unpatterned = [rule for rule in rules if rule not in self.patterns]
+
+    # named like the rule method, so create_matcherror finds the match type
+    def matchlines(self, file: Lintable) -> dict[BaseRule, list[MatchError]]:
+        """Return the matches found by each rule inside the lines of a file."""
+        matches: dict[BaseRule, list[MatchError]] = {rule: [] for rule in self.rules}
+        failed: set[BaseRule] = set()
+        # arrays are 0-based, line numbers are 1-based
+        # so use prev_line_no as the counter
+        for prev_line_no, line in enumerate(file.content.split("\n")):
+            if line.lstrip().startswith("#"):
+                continue
+            rules = (
+                self.rules
+                if self.combined is None or self.combined.search(line)
+                else self.unpatterned
+            )
+            if not rules:
+                continue
+            rule_id_list = ansiblelint.skip_utils.get_rule_skips_from_line(
+                line,
+                lintable=file,
+            )
+            for rule in rules:
+                if rule in failed or rule.id in rule_id_list:
+                    continue
+                pattern = self.patterns.get(rule)
+                if pattern is not None and not pattern.search(line):
+                    continue
+                try:
+                    result = rule.match(line)
+                except Exception as exc:  # pylint: disable=broad-except
+                    _logger.warning(
+                        "Ignored exception from %s.matchlines while processing %s: %s",
+                        rule.__class__.__name__,
+                        file,
+                        exc,
+                    )
+                    _logger.debug("Ignored exception details", exc_info=True)
+                    failed.add(rule)
+                    continue
+                if not result:
+                    continue
+                matches[rule].append(
+                    rule.create_matcherror(
+                        message=result if isinstance(result, str) else "",
+                        lineno=prev_line_no + 1,
+                        details=line,
+                        filename=file,
+                    )
+                )
+        for failed_rule in failed:
+            matches[failed_rule] = []
+        return matches
+
+
+def _is_rule_selected(  # pylint: disable=too-many-arguments
+    rule_id: str,
+    rule_tags: Iterable[str],
+    ids: Iterable[str],
+    *,
+    has_dynamic_tags: bool,
+    tags: set[str],
+    skip_list: list[str],
+) -> bool:
+    """Return true if a rule is selected by the tags and not skipped."""
+    is_targeted = any(t.startswith(f"{rule_id}[") for t in tags)
+
+    if (
+        tags
+        and not has_dynamic_tags
+        and set(rule_tags).union([rule_id]).isdisjoint(tags)
+        and not is_targeted
+    ):
+        return False
+
+    if tags and not is_targeted and set(rule_tags).union(ids).isdisjoint(tags):
+        return False
+
+    rule_definition = set(rule_tags) | {rule_id}
+    return rule_definition.isdisjoint(skip_list)
+
+
+def _file_methods(rule: BaseRule, kind: str, base_kind: str) -> dict[str, bool]:
+    """Return the match methods of a rule which can report something for a kind of file.
+
+    Methods mapped to ``False`` are default ``AnsibleLintRule`` methods whose
+    hooks (``matchtask`` or ``matchplay``) are not implemented by the rule,
+    so they can only report the loading errors shared by all the rules.
+    """
+    cls = type(rule)
+    methods = {}
+    if cls.matchlines is not BaseRule.matchlines and not (
+        cls.matchlines is AnsibleLintRule.matchlines and cls.match is BaseRule.match
+    ):
+        methods["matchlines"] = True
+    if cls.matchtasks is AnsibleLintRule.matchtasks:
+        if kind in _TASKS_KINDS and base_kind == "text/yaml":
+            methods["matchtasks"] = cls.matchtask is not BaseRule.matchtask
+    elif cls.matchtasks is not BaseRule.matchtasks:
+        methods["matchtasks"] = True
+    if cls.matchyaml is AnsibleLintRule.matchyaml:
+        if base_kind == "text/yaml":
+            methods["matchyaml"] = cls.matchplay is not BaseRule.matchplay
+    elif cls.matchyaml is not BaseRule.matchyaml:
+        methods["matchyaml"] = True
+    return methods
+
+
+# lists the rules of a rules directory, so only the modules of the rules
+# that can run need to be imported
+RULE_MANIFEST = "manifest.json"
+
+
+def _rule_modules(directory: Path) -> list[Path]:
+    """Return the rule modules found inside a directory."""
+    return sorted(
+        f
+        for f in directory.glob("*.py")
+        if "__" not in f.stem and f.stem not in "conftest"
+    )
+
+
+def _module_digests(directory: Path) -> dict[str, str]:
+    return {
+        f.stem: hashlib.sha256(f.read_bytes()).hexdigest()
+        for f in _rule_modules(directory)
+    }
+
+
+def build_rule_manifest(directory: Path) -> dict[str, Any]:
+    """Return the manifest of the rules defined inside a directory.
+
+    All the rule modules are imported in order to describe their rules.
+    """
+    rules = sorted(
+        load_plugins([str(directory)], use_manifest=False), key=lambda r: r.id
+    )
+    return {
+        "modules": _module_digests(directory),
+        "rules": [
+            {
+                "id": rule.id,
+                "module": Path(inspect.getfile(type(rule))).stem,
+                "tags": list(rule.tags),
+                "ids": list(rule.ids()),
+                "has_dynamic_tags": rule.has_dynamic_tags,
+                "unloadable": rule.unloadable,
+            }
+            for rule in rules
+        ],
+    }
+
+
+def load_rule_manifest(directory: Path) -> list[dict[str, Any]] | None:
+    """Return the rules listed by the manifest of a directory.
+
+    None is returned when there is no manifest or when it does not match the
+    rule modules found inside the directory anymore.
+    """
+    try:
+        with (directory / RULE_MANIFEST).open(encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("modules") != _module_digests(directory):
+        _logger.debug("Ignoring outdated rule manifest of %s", directory)
+        return None
+    return cast("list[dict[str, Any]]", manifest["rules"])
+
+
 def load_plugins(
     dirs: list[str],
+    select: Callable[[dict[str, Any]], bool] | None = None,
+    *,
+    use_manifest: bool = True,
 ) -> Iterator[AnsibleLintRule]:
-    """Yield a rule class."""
+    """Yield a rule class.
+
+    When a directory has a manifest, only the modules of the rules accepted
+    by ``select``, given their manifest entry, are imported.
+    """
 
     def all_subclasses(cls: type) -> set[type]:
         result: set[type] = set()
@@ -365,15 +581,24 @@ def load_plugins(
         return result
 
     orig_sys_path = sys.path.copy()
+    # rules left out by select, which can still be defined by imported modules
+    unselected: set[str] = set()
 
     for directory in dirs:
         if directory not in sys.path:
             sys.path.append(str(directory))
 
-        # load all modules in the directory
-        for f in Path(directory).glob("*.py"):
-            if "__" not in f.stem and f.stem not in "conftest":
-                import_module(f"{f.stem}")
+        modules = [f.stem for f in _rule_modules(Path(directory))]
+        entries = load_rule_manifest(Path(directory)) if use_manifest else None
+        if entries is not None and select is not None:
+            selected = {entry["module"] for entry in entries if select(entry)}
+            unselected.update(
+                entry["id"] for entry in entries if entry["module"] not in selected
+            )
+            modules = [module for module in modules if module in selected]
+        # load the modules of the directory
+        for module in modules:
+            import_module(module)
     # restore sys.path
     sys.path = orig_sys_path
 
@@ -389,6 +614,7 @@ def load_plugins(
             in [Path(x).absolute() for x in dirs]
             and issubclass(rule, BaseRule)
             and rule.id not in rules
+            and rule.id not in unselected
         ):
             rules[rule.id] = rule()
     for rule in rules.values():  # type: ignore[assignment]
@@ -401,7 +627,7 @@ class RulesCollection:
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
-        app: App,
+        app: App | None,
         rulesdirs: list[str] | list[Path] | None = None,
         options: Options | None = None,
         profile_name: str | None = None,
@@ -417,13 +643,21 @@ class RulesCollection:
         else:
             self.options = options
         self.profile = []
-        self.app = app
+        self._app = app
 
         if profile_name:
             self.profile = PROFILES[profile_name]
         rulesdirs_str = [] if rulesdirs is None else [str(r) for r in rulesdirs]
         self.rulesdirs = expand_paths_vars(rulesdirs_str)
         self.rules: list[BaseRule] = []
+        # indexes built on first use, reset whenever a rule is registered
+        self._rules_by_id: dict[str, BaseRule] | None = None
+        self._dispatch: dict[
+            tuple[str, str, bool, frozenset[str], tuple[str, ...]],
+            list[tuple[BaseRule, tuple[str, ...] | None]],
+        ] = {}
+        # line scanners of the dispatch tables, by identity of the table
+        self._line_scanners: dict[int, LineScanner | None] = {}
         # internal rules included in order to expose them for docs as they are
         # not directly loaded by our rule loader.
         self.rules.extend(
@@ -436,7 +670,11 @@ class RulesCollection:
         )
         for rule in self.rules:
             rule._collection = self  # ruff:ignore[private-member-access]
-        for rule in load_plugins(rulesdirs_str):
+        profile_rules = _profile_rules(profile_name) if profile_name else None
+        for rule in load_plugins(
+            rulesdirs_str,
+            lambda entry: self._may_run(entry, profile_rules, conditional=conditional),
+        ):
             self.register(rule, conditional=conditional)
         self.rules = sorted(self.rules)
 
@@ -447,6 +685,59 @@ class RulesCollection:
                 self.rules, profile_name, self.options.enable_list
             )
 
+    @property
+    def app(self) -> App:
+        """Return the application, preparing it on first use if none was given.
+
+        Listing the rules does not need it, which avoids preparing the ansible
+        environment.
+        """
+        if self._app is None:
+            # pylint: disable=import-outside-toplevel
+            from ansiblelint.app import get_app
+
+            self._app = get_app(offline=None, cached=True)
+        return self._app
+
+    def _may_run(
+        self,
+        entry: dict[str, Any],
+        profile_rules: dict[str, str] | None,
+        *,
+        conditional: bool,
+    ) -> bool:
+        """Return true if a rule listed by a manifest can run with the options.
+
+        This mirrors ``register``, the profile filter and ``_should_run_rule``,
+        so the modules of the other rules do not need to be imported.
+        """
+        options = self.options
+        if options.list_rules or options.list_tags:
+            return True
+        # needed by the runner or by the skip_list checks
+        if entry["unloadable"] or "unskippable" in entry["tags"]:
+            return True
+        if profile_rules is not None:
+            if (
+                entry["id"] not in profile_rules
+                and entry["id"] not in options.enable_list
+            ):
+                return False
+        elif (
+            conditional
+            and "opt-in" in entry["tags"]
+            and entry["id"] not in options.enable_list
+        ):
+            return False
+        return _is_rule_selected(
+            entry["id"],
+            entry["tags"],
+            entry["ids"],
+            has_dynamic_tags=entry["has_dynamic_tags"],
+            tags=set(options.tags),
+            skip_list=options.skip_list,
+        )
+
     def register(self, obj: AnsibleLintRule, *, conditional: bool = False) -> None:
         """Register a rule."""
         # We skip opt-in rules which were not manually enabled.
@@ -463,6 +754,9 @@ class RulesCollection:
             ],
         ):
             self.rules.append(obj)
+            self._rules_by_id = None
+            self._dispatch.clear()
+            self._line_scanners.clear()
 
     def __iter__(self) -> Iterator[BaseRule]:
         """Return the iterator over the rules in the RulesCollection."""
@@ -481,9 +775,12 @@ class RulesCollection:
         if not isinstance(item, str):
             msg = f"Expected str but got {type(item)} when trying to access rule by it's id"
             raise TypeError(msg)
-        for rule in self.rules:
-            if rule.id == item:
-                return rule
+        if self._rules_by_id is None:
+            self._rules_by_id = {}
+            for rule in self.rules:
+                self._rules_by_id.setdefault(rule.id, rule)
+        if item in self._rules_by_id:
+            return self._rules_by_id[item]
         msg = f"Rule {item} is not present inside this collection."
         raise ValueError(msg)
 
@@ -496,26 +793,97 @@ class RulesCollection:
         """Determine whether a rule should be executed."""
         if rule.id == "syntax-check":
             return False
+        return _is_rule_selected(
+            rule.id,
+            rule.tags,
+            rule.ids(),
+            has_dynamic_tags=rule.has_dynamic_tags,
+            tags=tags,
+            skip_list=skip_list,
+        )
 
-        is_targeted = any(t.startswith(f"{rule.id}[") for t in tags)
-
-        if (
-            tags
-            and not rule.has_dynamic_tags
-            and set(rule.tags).union([rule.id]).isdisjoint(tags)
-            and not is_targeted
-        ):
-            return False
+    def _dispatch_table(
+        self,
+        file: Lintable,
+        tags: set[str],
+        skip_list: list[str],
+        *,
+        is_dir: bool,
+    ) -> list[tuple[BaseRule, tuple[str, ...] | None]]:
+        """Return the rules to run against a file, with the match methods to call.
 
-        if (
-            tags
-            and not is_targeted
-            and set(rule.tags).union(list(rule.ids().keys())).isdisjoint(tags)
-        ):
-            return False
+        Tables are computed once for each kind of file, tags and skip list.
+        Rules are listed with ``None`` instead of methods when they override
+        ``getmatches`` or when the file is a directory.
+        """
+        kind, base_kind = str(file.kind), str(file.base_kind)
+        key = (
+            kind,
+            base_kind,
+            is_dir,
+            frozenset(tags),
+            tuple(skip_list),
+        )
+        if key in self._dispatch:
+            return self._dispatch[key]
 
-        rule_definition = set(rule.tags) | {rule.id}
-        return rule_definition.isdisjoint(skip_list)
+        selected: list[tuple[BaseRule, dict[str, bool] | None]] = []
+        for rule in self.rules:
+            if not self._should_run_rule(rule, tags, skip_list):
+                continue
+            if type(rule).getmatches is not BaseRule.getmatches:
+                selected.append((rule, None))
+            elif is_dir:
+                if type(rule).matchdir is not BaseRule.matchdir:
+                    selected.append((rule, None))
+            else:
+                selected.append((rule, _file_methods(rule, kind, base_kind)))
+
+        # loading errors are reported by every default method, so one of these
+        # is kept when none of the rules calling it is
+        covered = {
+            name
+            for rule, methods in selected
+            for name, needed in (methods or {}).items()
+            if needed and getattr(type(rule), name) is getattr(AnsibleLintRule, name)
+        }
+        table: list[tuple[BaseRule, tuple[str, ...] | None]] = []
+        for rule, methods in selected:
+            if methods is None:
+                table.append((rule, None))
+                continue
+            names = []
+            for name, needed in methods.items():
+                if not needed:
+                    if name in covered:
+                        continue
+                    covered.add(name)
+                names.append(name)
+            if names:
+                table.append((rule, tuple(names)))
+        self._dispatch[key] = table
+        return table
+
+    def _line_scanner(
+        self, table: list[tuple[BaseRule, tuple[str, ...] | None]]
+    ) -> LineScanner | None:
+        """Return the scanner of the rules only matching lines with ``match``.
+
+        Tables are kept by ``_dispatch``, so their identity does not change
+        until they are all cleared along with the scanners.
+        """
+        key = id(table)
+        if key not in self._line_scanners:
+            rules = [
+                rule
+                for rule, methods in table
+                if methods
+                and "matchlines" in methods
+                and isinstance(rule, AnsibleLintRule)
+                and type(rule).matchlines is AnsibleLintRule.matchlines
+            ]
+            self._line_scanners[key] = LineScanner(rules) if rules else None
+        return self._line_scanners[key]
 
     def _filter_matches(
         self,
@@ -558,7 +926,8 @@ class RulesCollection:
         if skip_list is None:
             skip_list = []
 
-        if not file.path.is_dir():
+        is_dir = file.path.is_dir()
+        if not is_dir:
             try:
                 if file.content is not None:  # loads the file content
                     pass
@@ -572,9 +941,20 @@ class RulesCollection:
                     ),
                 ]
 
-        for rule in self.rules:
-            if self._should_run_rule(rule, tags, skip_list):
+        table = self._dispatch_table(file, tags, skip_list, is_dir=is_dir)
+        # profiling measures the lines matched by each rule separately
+        scanner = None if is_dir or profiler.enabled else self._line_scanner(table)
+        line_matches = scanner.matchlines(file) if scanner else {}
+        for rule, methods in table:
+            if methods is None:
                 matches.extend(rule.getmatches(file))
+                continue
+            if rule in line_matches:
+                matches.extend(line_matches[rule])
+                methods = tuple(name for name in methods if name != "matchlines")
+                if not methods:
+                    continue
+            matches.extend(rule.getmatches(file, methods=methods))
 
         return self._filter_matches(matches, tags, skip_list)
 
@@ -626,21 +1006,31 @@ class RulesCollection:
         return result
 
 
+def _profile_rules(profile: str) -> dict[str, str]:
+    """Return the rules of a profile and of the profiles it extends.
+
+    Rules are mapped to the name of the profile including them.
+    """
+    included: dict[str, str] = {}
+    extends = profile
+    while extends:
+        for rule in PROFILES[extends]["rules"]:
+            included.setdefault(rule, extends)
+        extends = PROFILES[extends].get("extends", None)
+    return included
+
+
 def filter_rules_with_profile(
     rule_col: list[BaseRule],
     profile: str,
     enable_list: list[str] | None = None,
 ) -> None:
     """Unload rules that are not part of the specified profile."""
-    included = set()
+    included = _profile_rules(profile)
     enabled = set(enable_list or [])
-    extends = profile
     total_rules = len(rule_col)
-    while extends:
-        for rule in PROFILES[extends]["rules"]:
-            _logger.debug("Activating rule `%s` due to profile `%s`", rule, extends)
-            included.add(rule)
-        extends = PROFILES[extends].get("extends", None)
+    for rule_id, name in included.items():
+        _logger.debug("Activating rule `%s` due to profile `%s`", rule_id, name)
     for rule in rule_col.copy():
         if rule.unloadable:
             continue
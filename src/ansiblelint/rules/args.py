@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import atexit
 import contextlib
+import copy
 import importlib.util
+import inspect
 import io
 import json
 import logging
@@ -12,6 +14,8 @@ import re
 import shutil
 import sys
 import tempfile
+from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 # pylint: disable=preferred-module
@@ -21,6 +25,8 @@ from unittest.mock import patch
 # pylint: disable=reimported
 import ansible.module_utils.basic as mock_ansible_module
 from ansible.module_utils import basic
+from ansible.module_utils.common.arg_spec import ModuleArgumentSpecValidator
+from ansible.module_utils.errors import UnsupportedError
 
 from ansiblelint.rules import AnsibleLintRule, RulesCollection
 from ansiblelint.text import has_jinja
@@ -28,6 +34,8 @@ from ansiblelint.utils import load_plugin
 from ansiblelint.yaml_utils import clean_json
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from ansible.plugins.loader import PluginLoadContext
 
     from ansiblelint.errors import MatchError
@@ -90,13 +98,57 @@ class ValidationPassedError(Exception):
 class CustomAnsibleModule(basic.AnsibleModule):
     """Mock AnsibleModule class."""
 
+    # arguments received by the last instance, used to build argument validators
+    arguments: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize AnsibleModule mock."""
         kwargs["no_log"] = True
+        with contextlib.suppress(TypeError, copy.Error):
+            CustomAnsibleModule.arguments = copy.deepcopy((args, kwargs))
         super().__init__(*args, **kwargs)  # type: ignore[no-untyped-call]
         raise ValidationPassedError
 
 
+@dataclass
+class _ModuleInfo:
+    """Module imported for options validation."""
+
+    module: ModuleType
+    # modification time of the module file when it was imported
+    mtime: int = 0
+    # set once the module main function revealed its argument spec
+    validator: ModuleArgumentSpecValidator | None = None
+
+
+# modules already imported, indexed by their path, and imported again when
+# their file changes, as long-running processes like the daemon reuse them
+_modules: dict[str | None, _ModuleInfo] = {}
+
+
+def _argument_spec_validator(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> ModuleArgumentSpecValidator:
+    """Create the validator AnsibleModule would use for the same arguments."""
+    arguments = (
+        inspect
+        .signature(basic.AnsibleModule.__init__)
+        .bind(None, *args, **kwargs)
+        .arguments
+    )
+    argument_spec = arguments["argument_spec"]
+    if arguments.get("add_file_common_args"):
+        argument_spec = {**basic.FILE_COMMON_ARGUMENTS, **argument_spec}
+    return ModuleArgumentSpecValidator(  # type: ignore[no-untyped-call]
+        argument_spec,
+        arguments.get("mutually_exclusive"),
+        arguments.get("required_together"),
+        arguments.get("required_one_of"),
+        arguments.get("required_if"),
+        arguments.get("required_by"),
+    )
+
+
 class ArgsRule(AnsibleLintRule):
     """Validating module arguments."""
 
@@ -170,82 +222,129 @@ class ArgsRule(AnsibleLintRule):
             for key in workarounds_drop_map[loaded_module.resolved_fqcn]:
                 module_args.pop(key, None)
 
-        with mock.patch.object(
-            mock_ansible_module,
-            "AnsibleModule",
-            CustomAnsibleModule,
-        ):
-            if not loaded_module.plugin_resolved_name:
-                _logger.warning(
-                    "Unable to load module %s at %s:%s for options validation",
-                    module_name,
-                    file.filename if file else None,
-                    task.line,
-                )
-                return []
-            spec = importlib.util.spec_from_file_location(
-                name=loaded_module.plugin_resolved_name,
-                location=loaded_module.plugin_resolved_path,
+        if not loaded_module.plugin_resolved_name:
+            _logger.warning(
+                "Unable to load module %s at %s:%s for options validation",
+                module_name,
+                file.filename if file else None,
+                task.line,
             )
-            if not spec:
-                assert file is not None
-                _logger.warning(
-                    "Unable to load module %s at %s:%s for options validation",
-                    module_name,
-                    file.filename,
-                    task.line,
-                )
-                return []
-            assert spec.loader is not None
-            module = importlib.util.module_from_spec(spec)
-            previous_module = sys.modules.get(spec.name)
-            sys.modules[spec.name] = module
-            try:
+            return []
+        module_info = self._load_module(loaded_module)
+        if module_info is None:
+            _logger.warning(
+                "Unable to load module %s at %s:%s for options validation",
+                module_name,
+                file.filename if file else None,
+                task.line,
+            )
+            return []
+        if not hasattr(module_info.module, "main"):
+            # skip validation for module options that are implemented as action plugin
+            # as the option values can be changed in action plugin and are not passed
+            # through `ArgumentSpecValidator` class as in case of modules.
+            return []
+
+        if module_info.validator:
+            failed_msg = self._validate_args(module_info.validator, module_args)
+        else:
+            failed_msg = self._run_module(module_info, module_args)
+        if failed_msg:
+            results.extend(
+                self._parse_failed_msg(failed_msg, task, module_name, file),
+            )
+        return self._sanitize_results(results, module_name)
+
+    @staticmethod
+    def _load_module(loaded_module: PluginLoadContext) -> _ModuleInfo | None:
+        """Import a module file, reusing it for all the tasks using the module."""
+        path = loaded_module.plugin_resolved_path
+        try:
+            mtime = Path(path).stat().st_mtime_ns if path else 0
+        except OSError:
+            mtime = 0
+        if path in _modules and _modules[path].mtime == mtime:
+            return _modules[path]
+        spec = importlib.util.spec_from_file_location(
+            name=str(loaded_module.plugin_resolved_name),
+            location=path,
+        )
+        if not spec:
+            return None
+        assert spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        previous_module = sys.modules.get(spec.name)
+        sys.modules[spec.name] = module
+        try:
+            with mock.patch.object(
+                mock_ansible_module,
+                "AnsibleModule",
+                CustomAnsibleModule,
+            ):
                 spec.loader.exec_module(module)
-            finally:
-                if previous_module is None:
-                    sys.modules.pop(spec.name, None)
-                else:
-                    sys.modules[spec.name] = previous_module
-
-            try:  # ruff:ignore[too-many-statements-in-try-clause]
-                if not hasattr(module, "main"):
-                    # skip validation for module options that are implemented as action plugin
-                    # as the option values can be changed in action plugin and are not passed
-                    # through `ArgumentSpecValidator` class as in case of modules.
-                    return []
-
-                buffer = io.BytesIO(
-                    json.dumps({
-                        "ANSIBLE_MODULE_ARGS": clean_json(module_args)
-                    }).encode()
-                )
-                with (
-                    patch.object(
-                        sys, "stdin", io.TextIOWrapper(buffer, encoding="utf-8")
-                    ),
-                    patch.object(sys, "argv", [""]),
-                ):
-                    fio = io.StringIO()
-                    failed_msg = ""
-                    # Warning: avoid running anything while stdout is redirected
-                    # as what happens may be very hard to debug.
-                    with contextlib.redirect_stdout(fio):
-                        # pylint: disable=protected-access
-                        basic._ANSIBLE_ARGS = None  # ruff:ignore[private-member-access]
-                        try:
-                            module.main()
-                        except SystemExit:
-                            failed_msg = fio.getvalue()
-                    if failed_msg:
-                        results.extend(
-                            self._parse_failed_msg(failed_msg, task, module_name, file),
-                        )
-
-                sanitized_results = self._sanitize_results(results, module_name)
-            except ValidationPassedError:
-                return []
-            return sanitized_results
+        finally:
+            if previous_module is None:
+                sys.modules.pop(spec.name, None)
+            else:
+                sys.modules[spec.name] = previous_module
+        _modules[path] = _ModuleInfo(module=module, mtime=mtime)
+        return _modules[path]
+
+    @staticmethod
+    def _run_module(module_info: _ModuleInfo, module_args: dict[str, Any]) -> str:
+        """Run the module main function, returning its failure message.
+
+        The module is interrupted as soon as AnsibleModule validated the
+        arguments, and the argument spec it received is kept, so the following
+        tasks using the same module can be validated without running it.
+        """
+        buffer = io.BytesIO(
+            json.dumps({"ANSIBLE_MODULE_ARGS": clean_json(module_args)}).encode()
+        )
+        CustomAnsibleModule.arguments = None
+        with (
+            mock.patch.object(
+                mock_ansible_module,
+                "AnsibleModule",
+                CustomAnsibleModule,
+            ),
+            patch.object(sys, "stdin", io.TextIOWrapper(buffer, encoding="utf-8")),
+            patch.object(sys, "argv", [""]),
+        ):
+            fio = io.StringIO()
+            failed_msg = ""
+            # Warning: avoid running anything while stdout is redirected
+            # as what happens may be very hard to debug.
+            with contextlib.redirect_stdout(fio):
+                # pylint: disable=protected-access
+                basic._ANSIBLE_ARGS = None  # ruff:ignore[private-member-access]
+                try:
+                    module_info.module.main()
+                except SystemExit:
+                    failed_msg = fio.getvalue()
+                except ValidationPassedError:
+                    pass
+        if CustomAnsibleModule.arguments is not None:
+            args, kwargs = CustomAnsibleModule.arguments
+            module_info.validator = _argument_spec_validator(args, kwargs)
+        return failed_msg
+
+    @staticmethod
+    def _validate_args(
+        validator: ModuleArgumentSpecValidator, module_args: dict[str, Any]
+    ) -> str:
+        """Validate arguments like AnsibleModule does, returning its failure message."""
+        # arguments go through JSON like they would when passed to the module
+        params = json.loads(json.dumps(clean_json(module_args)))
+        result = validator.validate(params)  # type: ignore[no-untyped-call]
+        try:
+            error = result.errors[0]
+        except IndexError:
+            return ""
+        msg = result.errors.msg
+        if isinstance(error, UnsupportedError):
+            msg = f"Unsupported parameters for ({Path(basic.__file__).name}) module: {msg}"
+        return json.dumps({"msg": msg})
 
     # pylint: disable=unused-argument
     def _sanitize_results(
@@ -404,3 +503,42 @@ if "pytest" in sys.modules:
 
         assert len(results) == 1
         assert "value of default must be one of" in results[0].message
+
+    def test_args_module_validator_reused(
+        default_rules_collection: RulesCollection,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that modules are not executed again once their spec is known."""
+        # rules collection loads its own copy of this module
+        modules: dict[str | None, _ModuleInfo] = {}
+        monkeypatch.setattr(
+            sys.modules[default_rules_collection["args"].__module__],
+            "_modules",
+            modules,
+        )
+        failure = "examples/playbooks/rule-args-module-fail.yml"
+        expected = [
+            repr(match)
+            for match in Runner(failure, rules=default_rules_collection).run()
+        ]
+        module_info = next(
+            info
+            for path, info in modules.items()
+            if path and path.endswith("/modules/git.py")
+        )
+        assert module_info.validator is not None
+
+        def fail() -> None:
+            msg = "module should not be executed"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(module_info.module, "main", fail)
+        results = Runner(failure, rules=default_rules_collection).run()
+        assert [repr(match) for match in results] == expected
+
+        # modules whose file changed are imported again
+        path = next(path for path, info in modules.items() if info is module_info)
+        module_info.mtime -= 1
+        results = Runner(failure, rules=default_rules_collection).run()
+        assert [repr(match) for match in results] == expected
+        assert modules[path] is not module_info
@@ -27,7 +27,7 @@ from ansiblelint.text import has_jinja
 from ansiblelint.types import AnsibleTemplateSyntaxError
 from ansiblelint.utils import (  # type: ignore[attr-defined]
     Templar,
-    parse_yaml_from_file,
+    parse_yaml_from_lintable,
     template,
 )
 from ansiblelint.yaml_utils import deannotate, nested_items_path
@@ -366,7 +366,7 @@ class JinjaRule(AnsibleLintRule, TransformMixin):
         results: list[MatchError] = []
 
         if str(file.kind) == "vars":
-            data = parse_yaml_from_file(str(file.path))
+            data = parse_yaml_from_lintable(file)
             if not isinstance(data, Mapping):
                 return results
             for key, v, _path in nested_items_path(data):
@@ -92,9 +92,7 @@ class ValidateSchemaRule(AnsibleLintRule):
             raise RuntimeError(msg)
         if not self._field_checks:
             self._field_checks = {
-                "become_method": sorted(
-                    self._collection.app.runtime.plugins.become.keys(),
-                ),
+                "become_method": self._collection.app.become_methods,
             }
         return self._field_checks
 
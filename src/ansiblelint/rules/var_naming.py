@@ -20,7 +20,7 @@ from ansiblelint.rules import AnsibleLintRule, RulesCollection
 from ansiblelint.runner import Runner
 from ansiblelint.skip_utils import get_rule_skips_from_line
 from ansiblelint.text import has_jinja, is_fqcn, is_fqcn_or_name
-from ansiblelint.utils import parse_yaml_from_file
+from ansiblelint.utils import parse_yaml_from_lintable
 
 if TYPE_CHECKING:
     from ansiblelint.app import App
@@ -323,7 +323,7 @@ class VariableNamingRule(AnsibleLintRule):
         raw_results: list[MatchError] = []
 
         if str(file.kind) == "vars" and file.data:
-            meta_data = parse_yaml_from_file(str(file.path))
+            meta_data = parse_yaml_from_lintable(file)
             if not isinstance(meta_data, dict):
                 msg = f"Content if vars file {file} is not a dictionary."
                 raise TypeError(msg)
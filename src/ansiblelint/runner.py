@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import builtins
 import concurrent.futures
 import contextlib
+import copy
 import json
 import logging
-import math
 import multiprocessing
 import multiprocessing.pool
 import os
@@ -14,14 +15,11 @@ import re
 import subprocess
 import tempfile
 import warnings
-from dataclasses import dataclass
-from fnmatch import fnmatch
-from functools import cache
+from collections import deque
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, Any
 
-from ansible.errors import AnsibleError
 from ansible.parsing.splitter import split_args
 from ansible.plugins.loader import add_all_plugin_dirs
 from ansible_compat.runtime import AnsibleWarning
@@ -30,15 +28,30 @@ from yaml.parser import ParserError
 from yaml.scanner import ScannerError
 
 import ansiblelint.utils
+from ansiblelint._internal.syntax_check import can_use_workers, run_syntax_check
+from ansiblelint.cache import ResultCache
 from ansiblelint.constants import States
-from ansiblelint.errors import LintWarning, MatchError, WarnSource
+from ansiblelint.errors import (
+    LintWarning,
+    MatchError,
+    RuleMatchTransformMeta,
+    WarnSource,
+)
 from ansiblelint.file_utils import (
+    ExcludeMatcher,
     Lintable,
+    LintableRegistry,
+    clear_path_caches,
     expand_dirs_in_lintables,
     expand_paths_vars,
+    get_changed_files,
     normpath,
+    path_is_inside,
 )
+from ansiblelint.graph import IncludeGraph
 from ansiblelint.logger import timed_info
+from ansiblelint.parallel import can_fork, threads
+from ansiblelint.profiling import profiler
 from ansiblelint.rules.syntax_check import OUTPUT_PATTERNS
 from ansiblelint.text import strip_ansi_escape
 from ansiblelint.types import (  # pyright: ignore[reportAttributeAccessIssue]
@@ -49,12 +62,13 @@ from ansiblelint.utils import (
     PLAYBOOK_DIR,
     HandleChildren,
     extend_with_roles,
+    parse_examples,
     parse_examples_from_plugin,
     template,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterable
 
     from ansiblelint._internal.rules import BaseRule
     from ansiblelint.app import App
@@ -73,6 +87,170 @@ class LintResult:
     files: set[Lintable]
 
 
+# pylint: disable=too-many-instance-attributes
+@dataclass(frozen=True)
+class MatchRecord:
+    """Picklable representation of a match found while running rules."""
+
+    rule_id: str
+    severity: str
+    message: str
+    tag: str
+    lineno: int
+    column: int | None
+    details: str
+    filename: str
+    kind: FileType | None
+    match_type: str | None
+    transform_meta: RuleMatchTransformMeta | None
+    # True when the match belongs to the lintable the rules were run against
+    own: bool
+
+    @classmethod
+    def from_match(cls, match: MatchError, lintable: Lintable) -> MatchRecord:
+        """Create a record from a match found while processing lintable."""
+        own = match.lintable is lintable
+        return cls(
+            rule_id=match.rule.id,
+            severity=match.rule.severity,
+            message=match.message,
+            tag=match.tag,
+            # line offset is applied again when the match is recreated
+            lineno=match.lineno - match.lintable.line_offset if own else match.lineno,
+            column=match.column,
+            details=match.details,
+            filename=match.lintable.name,
+            kind=match.lintable.kind,
+            match_type=match.match_type,
+            transform_meta=match.transform_meta,
+            own=own,
+        )
+
+    def to_match(self, rules: RulesCollection, lintable: Lintable) -> MatchError:
+        """Recreate the match inside the main process."""
+        rule = copy.copy(rules[self.rule_id])
+        rule.severity = self.severity
+        match = MatchError(
+            message=self.message,
+            lintable=lintable if self.own else Lintable(self.filename, kind=self.kind),
+            tag=self.tag,
+            lineno=self.lineno,
+            column=self.column,
+            details=self.details,
+            rule=rule,
+            transform_meta=self.transform_meta,
+        )
+        match.match_type = self.match_type
+        return match
+
+
+@dataclass(frozen=True)
+class WarningRecord:
+    """Picklable representation of a warning raised while running rules."""
+
+    category: type[Warning]
+    message: str
+    filename: str | None = None
+    lineno: int = 1
+    tag: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation of the record."""
+        return {**asdict(self), "category": self.category.__name__}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WarningRecord:
+        """Create a record from its JSON serializable representation."""
+        category = data["category"]
+        return cls(
+            **{
+                **data,
+                "category": (
+                    LintWarning
+                    if category == LintWarning.__name__
+                    else getattr(builtins, category, Warning)
+                ),
+            },
+        )
+
+    def warn(self, lintable: Lintable) -> None:
+        """Raise the warning again inside the main process."""
+        if self.filename is None:
+            warnings.warn(self.message, category=self.category, stacklevel=1)
+            return
+        warnings.warn(
+            message=self.message,
+            category=self.category,
+            source=WarnSource(
+                filename=(
+                    lintable
+                    if self.filename == lintable.name
+                    else Lintable(self.filename)
+                ),
+                lineno=self.lineno,
+                tag=self.tag,
+                message=self.message,
+            ),
+            stacklevel=0,
+        )
+
+
+# State inherited by forked rules workers, see Runner._run_rules_in_processes
+_worker_state: tuple[RulesCollection, list[Lintable], set[str], list[str]] | None = None
+
+
+def _rules_worker(index: int) -> tuple[list[MatchRecord], list[WarningRecord]]:
+    """Run all rules against one lintable inside a worker process."""
+    if _worker_state is None:  # pragma: no cover
+        msg = "Rules worker was started without being initialized."
+        raise RuntimeError(msg)
+    rules, lintables, tags, skip_list = _worker_state
+    return _run_rules_recorded(rules, lintables[index], tags, skip_list)
+
+
+def _examples_worker(path: str) -> tuple[int, str, str] | None:
+    """Extract the EXAMPLES of a plugin file inside a worker process.
+
+    Files which cannot be parsed are left to the runner, which reports them.
+    """
+    try:
+        return parse_examples(Path(path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+def _run_rules_recorded(
+    rules: RulesCollection,
+    lintable: Lintable,
+    tags: set[str],
+    skip_list: list[str],
+) -> tuple[list[MatchRecord], list[WarningRecord]]:
+    """Run all rules against one lintable, returning records of the results."""
+    with warnings.catch_warnings(record=True) as captured_warnings:
+        warnings.simplefilter("always")
+        matches = rules.run(lintable, tags=tags, skip_list=skip_list)
+    warning_records = []
+    for warn in captured_warnings:
+        if isinstance(warn.source, WarnSource):
+            warning_records.append(
+                WarningRecord(
+                    category=warn.category,
+                    message=warn.source.message or warn.category.__name__,
+                    filename=warn.source.filename.name,
+                    lineno=warn.source.lineno,
+                    tag=warn.source.tag,
+                ),
+            )
+        else:
+            warning_records.append(
+                WarningRecord(category=warn.category, message=str(warn.message)),
+            )
+    return (
+        [MatchRecord.from_match(match, lintable) for match in matches],
+        warning_records,
+    )
+
+
 class Runner:
     """Runner class performs the linting process."""
 
@@ -88,10 +266,30 @@ class Runner:
         checked_files: set[Lintable] | None = None,
         project_dir: str | None = None,
         _skip_ansible_syntax_check: bool = False,
+        jobs: int = 1,
+        result_cache: ResultCache | None = None,
+        changed_files: set[Path] | None = None,
+        report: Callable[[list[MatchError]], None] | None = None,
+        low_memory: bool = False,
     ) -> None:
         """Initialize a Runner instance."""
         self.rules = rules
+        # release the data of each file once it was used
+        self.low_memory = low_memory
+        # receives the matches of each file as soon as they are found
+        self.report = report
+        self.changed_files = changed_files
+        # paths of the lintables affected by changed_files, when given
+        self.affected_paths: set[Path] | None = None
+        self.jobs = jobs or threads()
+        self.result_cache = result_cache
+        self._cache_keys: dict[Lintable, str] = {}
+        # EXAMPLES extracted from the plugin files, see _extract_plugin_examples
+        self._plugin_examples: dict[Lintable, tuple[int, str, str]] = {}
+        # files included by each lintable, as found by find_children
+        self.include_graph = IncludeGraph()
         self.lintables: set[Lintable] = set()
+        self.registry = LintableRegistry()
         self.project_dir = os.path.abspath(project_dir) if project_dir else None
         self.skip_ansible_syntax_check = _skip_ansible_syntax_check
 
@@ -108,8 +306,10 @@ class Runner:
         # Assure consistent type and configure given lintables as explicit (so
         # excludes paths would not apply on them).
         for item in lintables:
-            if not isinstance(item, Lintable):
-                item = Lintable(item)
+            if isinstance(item, Lintable):
+                self.registry.add(item)
+            else:
+                item = self.registry.get(item)
             item.explicit = True
             self.lintables.add(item)
 
@@ -119,6 +319,8 @@ class Runner:
             expanded = list(self.lintables)
             extend_with_roles(expanded)
             self.lintables.update(expanded)
+        for item in self.lintables:
+            self.registry.add(item)
 
         self.tags = tags
         self.skip_list = skip_list
@@ -140,13 +342,10 @@ class Runner:
             self.exclude_paths = paths + [os.path.abspath(p) for p in paths]
         else:
             self.exclude_paths = []
+        self.exclude_matcher = ExcludeMatcher(self.exclude_paths)
 
     def is_excluded(self, lintable: Lintable) -> bool:
         """Verify if a file path should be excluded."""
-        # Any will short-circuit as soon as something returns True, but will
-        # be poor performance for the case where the path under question is
-        # not excluded.
-
         # Exclusions should be evaluated only using absolute paths in order
         # to work correctly.
 
@@ -162,13 +361,7 @@ class Runner:
             )
             return True
 
-        return any(
-            abs_path.startswith(path)
-            or lintable.path.match(path)
-            or fnmatch(str(abs_path), path)
-            or fnmatch(str(lintable), path)
-            for path in self.exclude_paths
-        )
+        return self.exclude_matcher.match(lintable.path, abs_path, str(lintable))
 
     def run(self) -> list[MatchError]:
         """Execute the linting process."""
@@ -195,7 +388,7 @@ class Runner:
                         match = MatchError(
                             message=warn.source.message or warn.category.__name__,
                             rule=self.rules["warning"],
-                            lintable=Lintable(warn.source.filename.filename),
+                            lintable=self.registry.get(warn.source.filename.filename),
                             tag=warn.source.tag,
                             lineno=warn.source.lineno,
                         )
@@ -205,7 +398,7 @@ class Runner:
                                 warn.message if isinstance(warn.message, str) else "?"
                             ),
                             rule=self.rules["warning"],
-                            lintable=Lintable(str(warn.source)),
+                            lintable=self.registry.get(str(warn.source)),
                         )
                     matches.append(match)
                     continue
@@ -216,13 +409,17 @@ class Runner:
                     warn.category.__name__,
                     warn.message,
                 )
+        # matches found outside the rules phase, already reported ones are
+        # ignored by the receiver
+        self._report(matches)
         return sorted(matches)
 
+    def _report(self, matches: list[MatchError]) -> None:
+        if self.report is not None and matches:
+            self.report(self._filter_excluded_matches(matches))
+
     def _is_lintable_excluded_by_paths(self, lintable: Lintable) -> bool:
-        abs_path = str(lintable.abspath)
-        return any(
-            abs_path.startswith(p) or fnmatch(abs_path, p) for p in self.exclude_paths
-        )
+        return self.exclude_matcher.match_abspath(str(lintable.abspath))
 
     def _build_load_failure_match(self, lintable: Lintable) -> MatchError:
         exc = lintable.exc
@@ -361,50 +558,298 @@ class Runner:
         for match in matches:
             if not match.lintable.failed():
                 continue
+            # lintables are shared through the registry
             match.lintable.stop_processing = True
-            # Look into making lintables singletons to avoid having to update them
-            for lintable in self.lintables:
-                if lintable == match.lintable:
-                    lintable.stop_processing = True
-                    break
 
     def _run_rules_phase(
         self,
         files: list[Lintable],
         matches: list[MatchError],
     ) -> None:
-        matches.extend(
-            self._emit_matches([file for file in files if not file.failed()])
+        with profiler.phase("includes"):
+            self._extract_plugin_examples()
+            matches.extend(
+                self._emit_matches([file for file in files if not file.failed()])
+            )
+        self._run_rules_on(self.lintables, matches)
+        self.checked_files.update(
+            lintable for lintable in self.lintables if self._is_affected(lintable)
+        )
+
+    def _can_pipeline(self) -> bool:
+        """Return true if the rules can run while the syntax checks are running.
+
+        Rules running inside forked processes or being profiled still wait
+        for all the syntax checks. So do rules using the results cache, as
+        cache keys depend on the whole include graph, which is only complete
+        once all the syntax checks are done.
+        """
+        return not (
+            self.skip_ansible_syntax_check
+            or profiler.enabled
+            or self.result_cache is not None
+            or (self.jobs > 1 and can_fork())
+        )
+
+    def _syntax_check_blockers(
+        self, files: list[Lintable]
+    ) -> dict[Lintable, set[Lintable]]:
+        """Return the syntax checked files which can fail each lintable.
+
+        The syntax check of a playbook or role loads the files it includes, so
+        its errors can be reported on any of them.
+        """
+        blockers: dict[Lintable, set[Lintable]] = {}
+        # the children are found using their own registry, so the lintables
+        # are created in the same order as without running checks
+        registry = LintableRegistry()
+        for file in files:
+            pending = [file]
+            while pending:
+                lintable = pending.pop()
+                checks = blockers.setdefault(lintable, set())
+                if file in checks:
+                    continue
+                checks.add(file)
+                pending.extend(self._peek_children(lintable, registry))
+        return blockers
+
+    def _run_pipelined(self, matches: list[MatchError]) -> None:
+        """Run the syntax checks in background threads while running the rules.
+
+        The includes are found in the same order as by _run_rules_phase, so
+        files reached from several parents get the same kind. Finding them
+        stops at the first lintable a running syntax check can still fail,
+        until that check is done, and the rules run against the lintables
+        found so far meanwhile.
+        """
+        files = self._collect_syntax_check_files()
+        pending = deque(self.lintables)
+        visited: set[Lintable] = set()
+        # matches to report and to mark failed files with, by the next batch
+        batch = matches.copy()
+        matches.clear()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads()) as executor:
+            running = {
+                executor.submit(
+                    self._get_ansible_syntax_check_matches,
+                    lintable=file,
+                    app=self.app,
+                ): file
+                for file in files
+            }
+            blockers = self._syntax_check_blockers(files)
+            # number of running syntax checks which can fail each lintable
+            waiting = {lintable: len(checks) for lintable, checks in blockers.items()}
+            blocked: dict[Lintable, list[Lintable]] = {}
+            for lintable, checks in blockers.items():
+                for check in checks:
+                    blocked.setdefault(check, []).append(lintable)
+
+            def is_ready(lintable: Lintable) -> bool:
+                return not waiting.get(lintable)
+
+            while True:
+                seen = set(visited)
+                batch.extend(self._emit_matches([], pending, visited, is_ready))
+                self._run_rules_on(visited - seen, batch)
+                matches.extend(batch)
+                batch = []
+                if not running:
+                    break
+                finished, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in finished:
+                    file = running.pop(future)
+                    batch.extend(self._filter_excluded_matches(future.result()))
+                    for lintable in blocked[file]:
+                        waiting[lintable] -= 1
+        self.checked_files.update(
+            lintable for lintable in self.lintables if self._is_affected(lintable)
         )
+
+    def _run_rules_on(
+        self,
+        candidates: Iterable[Lintable],
+        matches: list[MatchError],
+    ) -> None:
+        """Run the rules against the candidates which still need to be linted."""
         self._mark_failed_lintables_stop_processing(matches)
 
-        for file in self.lintables:
-            if (
+        lintables = [
+            file
+            for file in candidates
+            if not (
                 file in self.checked_files
+                or not self._is_affected(file)
                 or not file.kind
                 or file.failed()
                 or file.stop_processing
-            ):
-                continue
-            _logger.debug(
-                "Examining %s of type %s",
-                normpath(file.path),
-                file.kind,
             )
+        ]
+        if self.result_cache:
+            lintables = [
+                file for file in lintables if not self._replay_cached(file, matches)
+            ]
+        self._report(matches)
 
-            matches.extend(
-                self.rules.run(file, tags=set(self.tags), skip_list=self.skip_list),
+        if self.jobs > 1 and len(lintables) > 1 and can_fork():
+            matches.extend(self._run_rules_in_processes(lintables))
+        else:
+            for file in lintables:
+                _logger.debug(
+                    "Examining %s of type %s",
+                    normpath(file.path),
+                    file.kind,
+                )
+                if self.result_cache:
+                    result = _run_rules_recorded(
+                        self.rules, file, set(self.tags), self.skip_list
+                    )
+                    self._store_cached(file, result)
+                    file_matches = self._replay(file, *result)
+                else:
+                    file_matches = self.rules.run(
+                        file, tags=set(self.tags), skip_list=self.skip_list
+                    )
+                if self.low_memory:
+                    file.release()
+                self._report(file_matches)
+                matches.extend(file_matches)
+
+    def _run_rules_in_processes(self, lintables: list[Lintable]) -> list[MatchError]:
+        """Run rules against lintables using a pool of forked processes.
+
+        Workers inherit the already initialized rules collection and return
+        picklable records that are turned back into matches, so they are
+        deduplicated and sorted like the ones produced by a serial run.
+        """
+        global _worker_state  # pylint: disable=global-statement
+        processes = min(self.jobs, len(lintables))
+        _logger.debug(
+            "Examining %s files using %s processes", len(lintables), processes
+        )
+        matches: list[MatchError] = []
+        _worker_state = (self.rules, lintables, set(self.tags), self.skip_list)
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=processes) as pool:
+                # results come back in order, each one as soon as it is ready
+                results = pool.imap(_rules_worker, range(len(lintables)), chunksize=1)
+                for lintable, result in zip(lintables, results, strict=True):
+                    if self.result_cache:
+                        self._store_cached(lintable, result)
+                    file_matches = self._replay(lintable, *result)
+                    if self.low_memory:
+                        lintable.release()
+                    self._report(file_matches)
+                    matches.extend(file_matches)
+        finally:
+            _worker_state = None
+        return matches
+
+    def _replay(
+        self,
+        lintable: Lintable,
+        match_records: list[MatchRecord],
+        warning_records: list[WarningRecord],
+    ) -> list[MatchError]:
+        """Recreate the matches and warnings recorded for a lintable."""
+        for warning_record in warning_records:
+            warning_record.warn(lintable)
+        return [record.to_match(self.rules, lintable) for record in match_records]
+
+    def _cache_key(self, lintable: Lintable, visiting: frozenset[Lintable]) -> str:
+        """Return the results cache key of a lintable.
+
+        The key of a file depends on the keys of the files it includes, so
+        changing an included file also invalidates the results of its parents.
+        """
+        if self.result_cache is None:  # pragma: no cover
+            msg = "Results cache is not enabled."
+            raise RuntimeError(msg)
+        key = self._cache_keys.get(lintable)
+        if key is None:
+            visiting = visiting | {lintable}
+            key = self.result_cache.key(
+                name=lintable.name,
+                kind=str(lintable.kind),
+                content=(
+                    lintable.content.encode("utf-8") if lintable.path.is_file() else b""
+                ),
+                children=(
+                    self._cache_key(child, visiting)
+                    for child in self.include_graph.get(lintable)
+                    if child not in visiting
+                ),
             )
+            self._cache_keys[lintable] = key
+        return key
 
-        self.checked_files.update(self.lintables)
+    def _replay_cached(self, lintable: Lintable, matches: list[MatchError]) -> bool:
+        """Add the cached results of a lintable to matches, if available."""
+        if self.result_cache is None or not self.result_cache.accepts(
+            str(lintable.kind)
+        ):
+            return False
+        try:
+            entry = self.result_cache.get(self._cache_key(lintable, frozenset()))
+            if entry is None:
+                return False
+            match_records = [MatchRecord(**data) for data in entry["matches"]]
+            warning_records = [
+                WarningRecord.from_dict(data) for data in entry["warnings"]
+            ]
+        except (OSError, UnicodeDecodeError, KeyError, TypeError) as exc:
+            _logger.debug("Ignoring cached results of %s: %s", lintable, exc)
+            return False
+        _logger.debug("Using cached results of %s", lintable)
+        matches.extend(self._replay(lintable, match_records, warning_records))
+        return True
+
+    def _store_cached(
+        self,
+        lintable: Lintable,
+        result: tuple[list[MatchRecord], list[WarningRecord]],
+    ) -> None:
+        """Store the results of a lintable inside the cache."""
+        if self.result_cache is None or not self.result_cache.accepts(
+            str(lintable.kind)
+        ):
+            return
+        match_records, warning_records = result
+        try:
+            key = self._cache_key(lintable, frozenset())
+        except (OSError, UnicodeDecodeError) as exc:
+            _logger.debug("Unable to cache results of %s: %s", lintable, exc)
+            return
+        self.result_cache.set(
+            key,
+            {
+                # transforms are not run when the cache is used
+                "matches": [
+                    asdict(replace(record, transform_meta=None))
+                    for record in match_records
+                ],
+                "warnings": [record.to_dict() for record in warning_records],
+            },
+        )
 
     def _run(self) -> list[MatchError]:
         """Run the linting (inner loop)."""
         matches: list[MatchError] = []
 
         self._remove_excluded_and_preprocess(matches)
-        files = self._run_syntax_check_phase(matches)
-        self._run_rules_phase(files, matches)
+        if self.changed_files is not None:
+            self._select_changed_lintables()
+            matches = [match for match in matches if self._is_affected(match.lintable)]
+        if self._can_pipeline():
+            self._run_pipelined(matches)
+        else:
+            with profiler.phase("syntax check"):
+                files = self._run_syntax_check_phase(matches)
+            with profiler.phase("rules"):
+                self._run_rules_phase(files, matches)
 
         matches = self._filter_excluded_matches(matches)
         return sorted(set(matches))
@@ -466,24 +911,28 @@ class Runner:
             if app.options.extra_vars:
                 cmd.extend(["--extra-vars", json.dumps(app.options.extra_vars)])
 
-            # To reduce noisy warnings like
-            # CryptographyDeprecationWarning: Blowfish has been deprecated
-            # https://github.com/paramiko/paramiko/issues/2038
-            env = app.runtime.environ.copy()
-            env["PYTHONWARNINGS"] = "ignore"
-            # Avoid execution failure if user customized any_unparsed_is_failed setting
-            # https://github.com/ansible/ansible-lint/issues/3650
-            env["ANSIBLE_INVENTORY_ANY_UNPARSED_IS_FAILED"] = "False"
-
-            run = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
-                cmd,
-                stdin=subprocess.PIPE,
-                capture_output=True,
-                shell=False,  # needed when command is a list
-                text=True,
-                check=False,
-                env=env,
-            )
+            env = get_syntax_check_env(app)
+
+            run = None
+            if can_use_workers():
+                try:
+                    run = run_syntax_check(cmd, env)
+                except (OSError, RuntimeError, ValueError) as exc:
+                    _logger.debug(
+                        "Syntax check worker failed, running %s instead: %s",
+                        cmd[0],
+                        exc,
+                    )
+            if run is None:
+                run = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    capture_output=True,
+                    shell=False,  # needed when command is a list
+                    text=True,
+                    check=False,
+                    env=env,
+                )
 
         if run.returncode != 0:
             message = None
@@ -519,7 +968,7 @@ class Runner:
                         # avoids creating a new lintable object if the filename
                         # is matching as this might prevent Lintable.failed()
                         # feature from working well.
-                        filename = Lintable(groups["filename"])
+                        filename = self.registry.get(groups["filename"])
                     else:
                         filename = lintable
                     column = int(groups.get("column", 1))
@@ -574,35 +1023,164 @@ class Runner:
             and match.tag not in match.lintable.line_skips[match.lineno]
         ]
 
-    def _emit_matches(self, files: list[Lintable]) -> Generator[MatchError, None, None]:
-        visited: set[Lintable] = set()
-        while visited != self.lintables:
-            for lintable in self.lintables - visited:
-                visited.add(lintable)
-                if lintable.failed():
-                    continue
-                if not lintable.path.exists():
+    def _emit_matches(
+        self,
+        files: list[Lintable],
+        pending: deque[Lintable] | None = None,
+        visited: set[Lintable] | None = None,
+        ready: Callable[[Lintable], bool] | None = None,
+    ) -> Generator[MatchError, None, None]:
+        """Find the children of the lintables, adding them to the lintables.
+
+        Each lintable is visited once, in order, using a worklist to which the
+        newly found children are added. Visiting stops at the first lintable
+        which is not ready, leaving it in pending, so a later call with the
+        same pending and visited continues from it.
+        """
+        if pending is None:
+            pending = deque(self.lintables)
+        if visited is None:
+            visited = set()
+        while pending:
+            lintable = pending.popleft()
+            if lintable in visited:
+                continue
+            if ready is not None and not ready(lintable):
+                pending.appendleft(lintable)
+                return
+            visited.add(lintable)
+            if lintable.failed():
+                continue
+            if not lintable.path.exists():
+                continue
+            try:
+                children = self._find_children_cached(lintable)
+            except MatchError as exc:
+                if not exc.filename:  # pragma: no branch
+                    exc.filename = str(lintable.path)
+                exc.rule = self.rules["load-failure"]
+                yield exc
+                continue
+            except AttributeError:
+                yield MatchError(
+                    lintable=lintable,
+                    rule=self.rules["load-failure"],
+                )
+                continue
+            for child in children:
+                if self.is_excluded(child):
                     continue
-                try:
-                    children = self.find_children(lintable)
-                    for child in children:
-                        if self.is_excluded(child):
-                            continue
-                        self.lintables.add(child)
-                        files.append(child)
-                except MatchError as exc:
-                    if not exc.filename:  # pragma: no branch
-                        exc.filename = str(lintable.path)
-                    exc.rule = self.rules["load-failure"]
-                    yield exc
-                except AttributeError:
-                    yield MatchError(
-                        lintable=lintable,
-                        rule=self.rules["load-failure"],
-                    )
+                if child not in self.lintables:
+                    self.lintables.add(child)
+                    pending.append(child)
+                files.append(child)
+
+    def _extract_plugin_examples(self) -> None:
+        """Extract the EXAMPLES of the plugin files using forked processes.
+
+        Parsing python code is CPU bound, so it only runs in parallel inside
+        processes. Without them plugin_children parses each file when needed.
+        """
+        plugins = [
+            lintable
+            for lintable in self.lintables
+            if lintable.kind == "plugin"
+            and lintable not in self.include_graph
+            and not lintable.failed()
+        ]
+        if self.jobs < 2 or len(plugins) < 2 or not can_fork():
+            return
+        processes = min(self.jobs, len(plugins))
+        with multiprocessing.get_context("fork").Pool(processes=processes) as pool:
+            results = pool.map(
+                _examples_worker, [str(plugin.path) for plugin in plugins]
+            )
+        for plugin, examples in zip(plugins, results, strict=True):
+            if examples is not None:
+                self._plugin_examples[plugin] = examples
+
+    def _find_children_cached(self, lintable: Lintable) -> list[Lintable]:
+        """Return the children of a lintable, recording them in include_graph."""
+        if lintable not in self.include_graph:
+            self.include_graph.add(lintable, self.find_children(lintable))
+        return self.include_graph.get(lintable)
+
+    def _peek_children(
+        self, lintable: Lintable, registry: LintableRegistry | None = None
+    ) -> list[Lintable]:
+        """Return the children of a lintable, ignoring the errors.
 
-    def find_children(self, lintable: Lintable) -> list[Lintable]:
-        """Traverse children of a single file or folder."""
+        The errors are found again, and reported, when _emit_matches looks
+        for the children of the lintable. Children found using another
+        registry are not recorded in include_graph.
+        """
+        if lintable.failed() or not lintable.path.exists():
+            return []
+        try:
+            if registry is not None:
+                return self.find_children(lintable, registry)
+            return self._find_children_cached(lintable)
+        except MatchError as exc:
+            # creating the error marked its lintable as failed
+            with contextlib.suppress(ValueError):
+                exc.lintable.matches.remove(exc)
+        except AttributeError:
+            pass
+        return []
+
+    def _is_affected(self, lintable: Lintable) -> bool:
+        """Return true if lintable should be linted given the changed files."""
+        return (
+            self.affected_paths is None
+            or lintable.path.resolve() in self.affected_paths
+        )
+
+    def _select_changed_lintables(self) -> None:
+        """Keep only the lintables affected by the changed files.
+
+        A lintable is affected when it changed, when it includes an affected
+        lintable or, for roles, when any file inside the role changed.
+        """
+        changed = {path.resolve() for path in self.changed_files or ()}
+        parents: dict[Path, set[Path]] = {}
+        for lintable in self.lintables:
+            for child in self._peek_children(lintable):
+                parents.setdefault(child.path.resolve(), set()).add(
+                    lintable.path.resolve()
+                )
+
+        affected = set(changed)
+        for path in {lintable.path.resolve() for lintable in self.lintables} | set(
+            parents
+        ):
+            if path.is_dir() and any(path_is_inside(item, path) for item in changed):
+                affected.add(path)
+
+        pending = list(affected)
+        while pending:
+            for parent in parents.get(pending.pop(), ()):
+                if parent not in affected:
+                    affected.add(parent)
+                    pending.append(parent)
+
+        self.affected_paths = affected
+        self.lintables = {
+            lintable for lintable in self.lintables if self._is_affected(lintable)
+        }
+        _logger.info(
+            "Found %d lintables affected by %d changed files.",
+            len(self.lintables),
+            len(changed),
+        )
+
+    def find_children(
+        self, lintable: Lintable, registry: LintableRegistry | None = None
+    ) -> list[Lintable]:
+        """Traverse children of a single file or folder.
+
+        The children are taken from the registry of the runner, unless
+        another one is given.
+        """
         playbook_ds: AnsibleJSON
         if not lintable.path.exists():
             return []
@@ -616,12 +1194,12 @@ class Runner:
         elif lintable.kind not in ("playbook", "tasks"):
             return []
         else:
-            try:
-                playbook_ds = ansiblelint.utils.parse_yaml_from_file(str(lintable.path))
-            except AnsibleError as exc:
+            # reuse the data already loaded for the rules
+            playbook_ds = lintable.data
+            if playbook_ds == States.LOAD_FAILED:
                 raise MatchError(
                     lintable=lintable, rule=self.rules["load-failure"]
-                ) from exc
+                ) from lintable.exc
         results = []
         # playbook_ds can be an AnsibleUnicode string, which we consider invalid
         if isinstance(playbook_ds, str):
@@ -633,6 +1211,7 @@ class Runner:
                 item,
                 lintable.kind,
                 playbook_dir,
+                registry,
             ):
                 # We avoid processing parametrized children
                 path_str = str(child.path)
@@ -659,11 +1238,14 @@ class Runner:
         item: tuple[str, Any],
         parent_type: FileType,
         playbook_dir: str,
+        registry: LintableRegistry | None = None,
     ) -> list[Lintable]:
         """Flatten the traversed play tasks."""
         # pylint: disable=unused-argument
         basedir = lintable.path.parent
-        handlers = HandleChildren(self.rules, app=self.app)
+        handlers = HandleChildren(
+            self.rules, app=self.app, registry=registry or self.registry
+        )
 
         delegate_map: dict[
             str,
@@ -699,8 +1281,15 @@ class Runner:
         return []
 
     def plugin_children(self, lintable: Lintable) -> list[Lintable]:
-        """Collect lintable sections from plugin file."""
-        offset, content, content_type = parse_examples_from_plugin(lintable)
+        """Collect lintable sections from plugin file.
+
+        The examples are kept in memory, sharing the path of the plugin, and
+        their line numbers are realigned with it using line_offset.
+        """
+        if lintable in self._plugin_examples:
+            offset, content, content_type = self._plugin_examples.pop(lintable)
+        else:
+            offset, content, content_type = parse_examples_from_plugin(lintable)
         if not content or content_type != "yaml":
             # No (YAML) examples, nothing to see here
             return []
@@ -712,77 +1301,44 @@ class Runner:
             parent=lintable,
         )
         examples.line_offset = offset
-
-        # pylint: disable=consider-using-with
-        examples.file = NamedTemporaryFile(  # ruff:ignore[open-file-with-context-handler]
-            mode="w+",
-            suffix=f"_{lintable.path.name}.yaml",
-            encoding="utf-8",
-        )
-        examples.file.write(content)
-        examples.file.flush()
-        examples.filename = examples.file.name
-        examples.path = Path(examples.file.name)
         return [examples]
 
 
-@cache
-def threads() -> int:
-    """Determine how many threads to use.
-
-    Inside containers we want to respect limits imposed.
-
-    When present /sys/fs/cgroup/cpu.max can contain something like:
-    $ podman/docker run -it --rm --cpus 1.5 ubuntu:latest cat /sys/fs/cgroup/cpu.max
-    150000 100000
-    # "max 100000" is returned when no limits are set.
-
-    See: https://github.com/python/cpython/issues/80235
-    See: https://github.com/python/cpython/issues/70879
-    """
-    os_cpu_count = multiprocessing.cpu_count()
-    # Cgroup CPU bandwidth limit available in Linux since 2.6 kernel
-
-    cpu_max_fname = "/sys/fs/cgroup/cpu.max"
-    cfs_quota_fname = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
-    cfs_period_fname = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
-    if os.path.exists(cpu_max_fname):
-        # cgroup v2
-        # https://www.kernel.org/doc/html/latest/admin-guide/cgroup-v2.html
-        with open(cpu_max_fname, encoding="utf-8") as fh:  # pragma: no cover
-            cpu_quota_us, cpu_period_us = fh.read().strip().split()
-    elif os.path.exists(cfs_quota_fname) and os.path.exists(cfs_period_fname):
-        # cgroup v1
-        # https://www.kernel.org/doc/html/latest/scheduler/sched-bwc.html#management
-        with open(cfs_quota_fname, encoding="utf-8") as fh:  # pragma: no cover
-            cpu_quota_us = fh.read().strip()
-        with open(cfs_period_fname, encoding="utf-8") as fh:  # pragma: no cover
-            cpu_period_us = fh.read().strip()
-    else:
-        # No Cgroup CPU bandwidth limit (e.g. non-Linux platform)
-        cpu_quota_us = "max"
-        cpu_period_us = "100000"  # unused, for consistency with default values
-
-    if cpu_quota_us == "max":
-        # No active Cgroup quota on a Cgroup-capable platform
-        return os_cpu_count
-    cpu_quota_us_int = int(cpu_quota_us)
-    cpu_period_us_int = int(cpu_period_us)
-    if cpu_quota_us_int > 0 and cpu_period_us_int > 0:
-        return math.ceil(cpu_quota_us_int / cpu_period_us_int)
-    # Setting a negative cpu_quota_us value is a valid way to disable
-    # cgroup CPU bandwidth limits
-    return os_cpu_count
-
-
-def get_matches(rules: RulesCollection, options: Options) -> LintResult:
+def get_syntax_check_env(app: App) -> dict[str, str]:
+    """Return the environment used to run ansible-playbook syntax checks."""
+    # To reduce noisy warnings like
+    # CryptographyDeprecationWarning: Blowfish has been deprecated
+    # https://github.com/paramiko/paramiko/issues/2038
+    env = app.runtime.environ.copy()
+    env["PYTHONWARNINGS"] = "ignore"
+    # Avoid execution failure if user customized any_unparsed_is_failed setting
+    # https://github.com/ansible/ansible-lint/issues/3650
+    env["ANSIBLE_INVENTORY_ANY_UNPARSED_IS_FAILED"] = "False"
+    return env
+
+
+def get_matches(
+    rules: RulesCollection,
+    options: Options,
+    report: Callable[[list[MatchError]], None] | None = None,
+) -> LintResult:
     """Get matches for given rules and options.
 
     :param rules: Rules to use for linting.
     :param options: Options to use for linting.
+    :param report: Called with the matches of each file, as soon as found.
     :returns: LintResult containing matches and checked files.
     """
-    lintables = ansiblelint.utils.get_lintables(opts=options, args=options.lintables)
+    # files might have been added or removed since a previous run
+    clear_path_caches()
+    ansiblelint.utils.clear_resolution_caches()
+    ansiblelint.utils.limit_parse_caches(
+        ansiblelint.utils.LOW_MEMORY_CACHE_SIZE if options.low_memory else None
+    )
+    with profiler.phase("discovery"):
+        lintables = ansiblelint.utils.get_lintables(
+            opts=options, args=options.lintables
+        )
 
     for rule in rules:
         if "unskippable" in rule.tags:
@@ -802,18 +1358,49 @@ def get_matches(rules: RulesCollection, options: Options) -> LintResult:
         checked_files=checked_files,
         project_dir=options.project_dir,
         _skip_ansible_syntax_check=options._skip_ansible_syntax_check,  # ruff:ignore[private-member-access]
+        # transforms need the task objects which are not passed back by workers
+        # or stored inside the results cache, while profiling needs all the
+        # rules to run inside this process
+        jobs=1 if options.write_list or options.profile_rules else options.jobs,
+        result_cache=(
+            ResultCache(options.cache_dir, options, rules)
+            if options.cache_results
+            and options.cache_dir
+            and not options.write_list
+            and not options.profile_rules
+            else None
+        ),
+        changed_files=(
+            get_changed_files(options.changed_since) if options.changed_since else None
+        ),
+        report=(
+            (lambda found: report(_restore_filenames(found, lintables)))
+            if report
+            else None
+        ),
+        low_memory=options.low_memory,
     )
     matches.extend(runner.run())
+    if options.include_graph:
+        runner.include_graph.write(Path(options.include_graph))
 
     # Assure we do not print duplicates and the order is consistent
-    matches = sorted(set(matches))
+    matches = _restore_filenames(sorted(set(matches)), lintables)
+
+    return LintResult(matches=matches, files=checked_files)
+
 
-    # Convert reported filenames into human readable ones, so we hide the
-    # fact we used temporary files when processing input from stdin.
+def _restore_filenames(
+    matches: list[MatchError], lintables: list[Lintable]
+) -> list[MatchError]:
+    """Convert reported filenames into human readable ones.
+
+    This hides the fact we used temporary files when processing input from
+    stdin.
+    """
     for match in matches:
         for lintable in lintables:
             if match.filename == lintable.filename:
                 match.filename = lintable.name
                 break
-
-    return LintResult(matches=matches, files=checked_files)
+    return matches
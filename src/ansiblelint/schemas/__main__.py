@@ -1,19 +1,21 @@
 """Module containing cached JSON schemas."""
 
 import argparse
+import base64
 import json
 import logging
 import os
 import sys
+import threading
 import time
 import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
-from http.client import HTTPException
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from pathlib import Path
 from typing import Any
-from urllib.error import HTTPError
-from urllib.request import Request
+from urllib.parse import unquote, urljoin, urlsplit
 
 _logger = logging.getLogger(__package__)
 
@@ -45,32 +47,207 @@ def get_schema(kind: str) -> Any:
 _schema_cache = SchemaCacheDict()
 
 
-def _fetch_and_store_schema(
-    request: Request,
+# Seconds allowed for each network operation of a schema request
+SCHEMA_REQUEST_TIMEOUT = 10
+# Schemas downloaded at the same time
+SCHEMA_REFRESH_WORKERS = 8
+_MAX_REDIRECTS = 5
+
+
+class _ConnectionPool:
+    """HTTP connections kept open by each thread, one for each host.
+
+    Like urllib, hosts are reached through the proxies configured by the
+    environment, unless bypassed by ``no_proxy``.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.proxies = urllib.request.getproxies()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[HTTPConnection] = []
+
+    def get(self, scheme: str, host: str) -> tuple[HTTPConnection, str, dict[str, str]]:
+        """Return the connection of the current thread to a host.
+
+        Also returns the prefix of the request targets and the headers of the
+        requests forwarded by a proxy.
+        """
+        connections: dict[
+            tuple[str, str], tuple[HTTPConnection, str, dict[str, str]]
+        ] = getattr(self._local, "connections", {})
+        self._local.connections = connections
+        route = connections.get((scheme, host))
+        if route is None:
+            route = self._connect(scheme, host)
+            connections[scheme, host] = route
+            with self._lock:
+                self._connections.append(route[0])
+        return route
+
+    def _connect(
+        self, scheme: str, host: str
+    ) -> tuple[HTTPConnection, str, dict[str, str]]:
+        cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        proxy = self.proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return cls(host, timeout=self.timeout), "", {}
+        proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        proxy_host = proxy_parts.netloc.rpartition("@")[2]
+        headers = {}
+        if proxy_parts.username:
+            credentials = (
+                f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+            )
+            headers["Proxy-Authorization"] = (
+                f"Basic {base64.b64encode(credentials.encode()).decode('ascii')}"
+            )
+        if scheme == "https":
+            connection = HTTPSConnection(proxy_host, timeout=self.timeout)
+            connection.set_tunnel(host, headers=headers)
+            return connection, "", {}
+        # plain requests are forwarded by the proxy
+        return (
+            HTTPConnection(proxy_host, timeout=self.timeout),
+            f"http://{host}",
+            headers,
+        )
+
+    def close(self) -> None:
+        """Close all the connections."""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+
+def _fetch_schema(pool: _ConnectionPool, url: str, etag: str) -> tuple[int, str, str]:
+    """Download a schema, returning the response status, etag and content.
+
+    Redirects are followed, and requests failing on a connection closed by
+    the server since its previous use are made again on a new connection.
+    """
+    headers = {"If-None-Match": f'"{etag}"'} if etag else {}
+    for _ in range(_MAX_REDIRECTS):
+        parts = urlsplit(url)
+        connection, prefix, proxy_headers = pool.get(parts.scheme, parts.netloc)
+        target = prefix + parts.path + (f"?{parts.query}" if parts.query else "")
+        request_headers = {**headers, **proxy_headers}
+        reused = connection.sock is not None
+        try:
+            connection.request("GET", target, headers=request_headers)
+            response = connection.getresponse()
+            content = response.read()
+        except (ConnectionError, HTTPException):
+            connection.close()
+            if not reused:
+                raise
+            connection.request("GET", target, headers=request_headers)
+            response = connection.getresponse()
+            content = response.read()
+        if response.status in (301, 302, 303, 307, 308):
+            url = urljoin(url, response.headers["location"])
+            continue
+        return (
+            response.status,
+            (response.headers["etag"] or "").strip('"'),
+            content.decode("utf-8").rstrip(),
+        )
+    msg = f"Too many redirects for {url}"
+    raise HTTPException(msg)
+
+
+def _store_schema(
     kind: str,
     path: Path,
     data: dict[str, Any],
-    schema: dict[str, Any],
+    etag: str,
+    content: str,
 ) -> int:
-    """Fetch a schema from URL and save it to disk. Returns 1 if changed, 0 otherwise."""
-    with urllib.request.urlopen(request, timeout=10) as response:  # ruff:ignore[suspicious-url-open-usage]
-        if response.status == 200:  # pragma: no cover
-            content = response.read().decode("utf-8").rstrip()
-            etag = response.headers["etag"].strip('"')
-            changed = 0
-            if etag != data.get("etag", "") or not schema:
-                JSON_SCHEMAS[kind]["etag"] = etag
-                changed = 1
-            with path.open("w", encoding="utf-8") as f_out:
-                _logger.info("Schema %s was updated", kind)
-                f_out.write(content)
-                f_out.write("\n")  # prettier/editors
-                f_out.truncate()
-                os.fsync(f_out.fileno())
-                if kind in _schema_cache:  # pragma: no cover
-                    del _schema_cache[kind]
-            return changed
-    return 0  # pragma: no cover
+    """Save a downloaded schema to disk. Returns 1 if changed, 0 otherwise."""
+    changed = 0
+    if etag != data.get("etag", "") or not path.exists():
+        data["etag"] = etag
+        changed = 1
+    with path.open("w", encoding="utf-8") as f_out:
+        _logger.info("Schema %s was updated", kind)
+        f_out.write(content)
+        f_out.write("\n")  # prettier/editors
+        f_out.truncate()
+        os.fsync(f_out.fileno())
+        if kind in _schema_cache:  # pragma: no cover
+            del _schema_cache[kind]
+    return changed
+
+
+def _refresh(
+    schemas: dict[str, dict[str, Any]],
+    directory: Path,
+    timeout: float = SCHEMA_REQUEST_TIMEOUT,
+) -> int:
+    """Download the schemas into a directory, all at once.
+
+    Schemas which cannot be downloaded keep their last-known good copy.
+    Returns number of changed schemas.
+    """
+    for data in schemas.values():
+        url = data["url"]
+        if "#" in url:  # pragma: no cover
+            msg = f"Schema URLs cannot contain # due to python-jsonschema limitation: {url}"
+            raise RuntimeError(msg)
+        if not url.startswith(("http:", "https:")):  # pragma: no cover
+            msg = f"Unexpected url schema: {url}"
+            raise ValueError(msg)
+
+    changed = 0
+    pool = _ConnectionPool(timeout)
+    try:
+        with ThreadPoolExecutor(max_workers=SCHEMA_REFRESH_WORKERS) as executor:
+            futures = {
+                kind: executor.submit(
+                    _fetch_schema,
+                    pool,
+                    data["url"],
+                    data.get("etag", "")
+                    if (directory / f"{kind}.json").exists()
+                    else "",
+                )
+                for kind, data in schemas.items()
+            }
+            for kind, future in futures.items():
+                _logger.debug("Refreshing %s schema ...", kind)
+                try:
+                    status, etag, content = future.result()
+                except (
+                    ConnectionError,
+                    OSError,
+                    HTTPException,
+                    UnicodeDecodeError,
+                ) as exc:
+                    # In case of networking issues or bad responses, we use
+                    # last-known good
+                    _logger.debug(
+                        "Skipped schema refresh due to unexpected exception: %s (%s)",
+                        exc,
+                        kind,
+                    )
+                    continue
+                if status == 304:
+                    _logger.debug("Schema %s is not modified", kind)
+                elif status != 200:
+                    _logger.debug(
+                        "Skipped schema refresh due to HTTP status %s (%s)",
+                        status,
+                        kind,
+                    )
+                else:
+                    changed += _store_schema(
+                        kind, directory / f"{kind}.json", schemas[kind], etag, content
+                    )
+    finally:
+        pool.close()
+    return changed
 
 
 def refresh_schemas(min_age_seconds: int = 3600 * 24) -> int:
@@ -91,39 +268,7 @@ def refresh_schemas(min_age_seconds: int = 3600 * 24) -> int:
         return -1
     _logger.debug("Checking for updated schemas...")
 
-    changed = 0
-    for kind, data in JSON_SCHEMAS.items():
-        try:
-            schema = get_schema(kind)
-        except OSError:
-            _logger.exception(
-                "Error getting schema %s", kind, stack_info=False, stacklevel=2
-            )
-            schema = {}
-        url = data["url"]
-        if "#" in url:  # pragma: no cover
-            msg = f"Schema URLs cannot contain # due to python-jsonschema limitation: {url}"
-            raise RuntimeError(msg)
-        path = Path(__file__).parent.resolve() / f"{kind}.json"
-        _logger.debug("Refreshing %s schema ...", kind)
-        if not url.startswith(("http:", "https:")):  # pragma: no cover
-            msg = f"Unexpected url schema: {url}"
-            raise ValueError(msg)
-        request = Request(url)  # ruff:ignore[suspicious-url-open-usage]
-        etag = data.get("etag", "")
-        if not path.exists():
-            etag = ""
-        if etag:
-            request.add_header("If-None-Match", f'"{data.get("etag")}"')
-        try:
-            changed += _fetch_and_store_schema(request, kind, path, data, schema)
-        except (ConnectionError, OSError, HTTPException) as exc:
-            if isinstance(exc, HTTPError) and getattr(exc, "code", None) == 304:
-                _logger.debug("Schema %s is not modified", url)
-                continue
-            # In case of networking issues, we just stop and use last-known good
-            _logger.debug("Skipped schema refresh due to unexpected exception: %s", exc)
-            break
+    changed = _refresh(JSON_SCHEMAS, Path(__file__).parent.resolve())
     if changed:  # pragma: no cover
         with store_file.open("w", encoding="utf-8") as f_out:
             # formatting should match our .prettierrc.yaml
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import re
@@ -11,14 +12,19 @@ import yaml
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 
+from ansiblelint.constants import ANNOTATION_KEYS, States
 from ansiblelint.loaders import yaml_load_safe
 from ansiblelint.schemas.__main__ import JSON_SCHEMAS, _schema_cache
 
 _logger = logging.getLogger(__package__)
+# validators of each kind of file, along with the schema they were created for
+_validators: dict[str, tuple[dict[Any, Any], Validator]] = {}
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from jsonschema.protocols import Validator
+
     from ansiblelint.file_utils import Lintable
 
 
@@ -78,12 +84,57 @@ def _format_validation_message(
     return message
 
 
+def get_validator(kind: str) -> Validator:
+    """Return the validator for a kind of file, created once for each schema."""
+    schema = _schema_cache[kind]
+    cached = _validators.get(kind)
+    # refreshed schemas are replaced inside the schema cache
+    if cached is None or cached[0] is not schema:
+        cached = (schema, Draft202012Validator(schema))
+        _validators[kind] = cached
+    return cached[1]
+
+
+def _json_key(key: Any) -> str:
+    """Return a mapping key as it would be serialized to JSON."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, bool | int | float):
+        return json.dumps(key)
+    msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    raise TypeError(msg)
+
+
+def _to_json_data(data: Any) -> Any:
+    """Return loaded YAML data as it would be after a JSON round trip.
+
+    Our own annotations are removed, while encrypted values and types not
+    supported by JSON, like dates, are refused.
+    """
+    if isinstance(data, dict):
+        return {
+            _json_key(key): _to_json_data(value)
+            for key, value in data.items()
+            if key not in ANNOTATION_KEYS
+        }
+    if isinstance(data, list | tuple):
+        return [_to_json_data(item) for item in data]
+    if (data is None or isinstance(data, str | bool | int | float)) and not getattr(
+        data, "__ENCRYPTED__", False
+    ):
+        return data
+    msg = f"Object of type {data.__class__.__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
 def _validate_json_data(
     json_data: Any,
     schema: dict[Any, Any],
+    validator: Validator | None = None,
 ) -> str | None:
     """Validate JSON data against schema, return message or None if valid."""
-    validator = Draft202012Validator(schema)
+    if validator is None:
+        validator = Draft202012Validator(schema)
     try:
         error = next(validator.iter_errors(json_data))
     except StopIteration:
@@ -93,20 +144,37 @@ def _validate_json_data(
     return _format_validation_message(error, schema)
 
 
+def _load_json_data(file: Lintable) -> Any:
+    """Return the data of a file, reusing the data already loaded by the linter.
+
+    Files holding multiple documents, which the linter loads as a plain list,
+    and data which cannot be represented as JSON are loaded again, so they
+    fail the same way as when the file was loaded on its own.
+    """
+    yaml_data = file.data
+    # pylint: disable=unidiomatic-typecheck
+    if not isinstance(yaml_data, States) and type(yaml_data) is not list:
+        with contextlib.suppress(TypeError):
+            return _to_json_data(yaml_data)
+    return json.loads(json.dumps(yaml_load_safe(file.content)))
+
+
 def validate_file_schema(file: Lintable) -> list[str]:
     """Return list of JSON validation errors found."""
     schema: dict[Any, Any] = {}
     if file.kind not in JSON_SCHEMAS:
         return [f"Unable to find JSON Schema '{file.kind}' for '{file.path}' file."]
     try:
-        yaml_data = yaml_load_safe(file.content)
-        json_data = json.loads(json.dumps(yaml_data))
+        json_data = _load_json_data(file)
         schema = _schema_cache[file.kind]
-        message = _validate_json_data(json_data, schema)
+        message = _validate_json_data(json_data, schema, get_validator(str(file.kind)))
         if message is None:
             return []
     except yaml.constructor.ConstructorError as exc:
         return [f"Failed to load YAML file '{file.path}': {exc.problem}"]
+    except TypeError as exc:
+        # also raised for values encrypted with vault
+        return [f"Failed to load YAML file '{file.path}': {exc}"]
     except ValidationError as exc:  # pragma: no cover
         message = exc.message
         documentation_url = _find_documentation_url(schema)
@@ -27,7 +27,7 @@ import logging
 import re
 import warnings
 from collections.abc import Mapping, MutableMapping, Sequence
-from functools import cache
+from functools import cache, lru_cache
 from itertools import product
 from typing import TYPE_CHECKING, Any
 
@@ -145,6 +145,12 @@ def load_data(file_text: str) -> Any:
         return yaml.load_all(file_text)
 
 
+def set_load_data_cache_size(maxsize: int | None) -> None:
+    """Change how many parsed texts are kept by ``load_data``, None meaning all."""
+    global load_data  # pylint: disable=global-statement
+    load_data = lru_cache(maxsize=maxsize)(load_data.__wrapped__)
+
+
 def _apply_skipped_rules_to_metadata(  # type: ignore[no-any-unimported]
     pyyaml_data: AnsibleBaseYAMLObject,
     skipped_rules: Sequence[Any],
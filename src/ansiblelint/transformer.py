@@ -4,13 +4,15 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 from typing import TYPE_CHECKING, cast
 
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ansiblelint.file_utils import Lintable
+from ansiblelint.parallel import can_fork, threads
 from ansiblelint.rules import TransformMixin
-from ansiblelint.yaml_utils import FormattedYAML, get_path_to_play, get_path_to_task
+from ansiblelint.yaml_utils import FormattedYAML, LinePathIndex
 
 if TYPE_CHECKING:
     from ansiblelint.config import Options
@@ -21,6 +23,27 @@ if TYPE_CHECKING:
 __all__ = ["Transformer"]
 
 _logger = logging.getLogger(__name__)
+# state inherited by forked workers, as transforms and matches are not picklable
+_worker_state: tuple[Transformer, list[Lintable]] | None = None
+
+
+def _transform_worker(
+    index: int,
+) -> tuple[str | None, list[tuple[bool, list[str | int]]]]:
+    """Transform a file inside a forked worker, returning what changed."""
+    if _worker_state is None:  # pragma: no cover
+        msg = "Worker state was not initialized."
+        raise RuntimeError(msg)
+    transformer, files = _worker_state
+    file = files[index]
+    transformer.transform_file(file)
+    return (
+        file.content if file.updated else None,
+        [
+            (match.fixed, match.yaml_path)
+            for match in transformer.matches_per_file[file]
+        ],
+    )
 
 
 class Transformer:
@@ -50,6 +73,7 @@ class Transformer:
         """Initialize a Transformer instance."""
         self.write_set = self.effective_write_set(options.write_list)
         self.write_exclude_set = self.effective_write_set(options.write_exclude_list)
+        self.jobs = options.jobs or threads()
 
         self.matches: list[MatchError] = result.matches
         self.files: set[Lintable] = result.files
@@ -89,54 +113,86 @@ class Transformer:
         return set(write_list)
 
     def run(self) -> None:
-        """For each file, read it, execute transforms on it, then write it."""
-        for file, matches in self.matches_per_file.items():
-            # str() convinces mypy that "text/yaml" is a valid Literal.
-            # Otherwise, it thinks base_kind is one of playbook, meta, tasks, ...
-            file_is_yaml = str(file.base_kind) == "text/yaml"
+        """For each file, read it, execute transforms on it, then write it.
 
-            try:
-                data: str = file.content
-            except (UnicodeDecodeError, IsADirectoryError):  # pragma: no cover
-                # we hit a binary file (eg a jar or tar.gz) or a directory
-                data = ""
-                file_is_yaml = False
-
-            ruamel_data: CommentedMap | CommentedSeq | None = None
-            if file_is_yaml:
-                # We need a fresh YAML() instance for each load because ruamel.yaml
-                # stores intermediate state during load which could affect loading
-                # any other files. (Based on suggestion from ruamel.yaml author)
-                yaml = FormattedYAML(
-                    # Ansible only uses YAML 1.1, but others files should use newer 1.2 (ruamel.yaml defaults to 1.2)
-                    version=(1, 1) if file.is_owned_by_ansible() else None,
+        Files are independent from each other, so they are transformed by
+        forked workers when multiple jobs are allowed.
+        """
+        files = list(self.matches_per_file)
+        if self.jobs > 1 and len(files) > 1 and can_fork():
+            self._run_in_processes(files)
+            return
+        for file in files:
+            self.transform_file(file)
+            if file.updated:
+                file.write()
+
+    def _run_in_processes(self, files: list[Lintable]) -> None:
+        """Transform files using a pool of forked processes."""
+        global _worker_state  # pylint: disable=global-statement
+        processes = min(self.jobs, len(files))
+        _logger.debug("Transforming %s files using %s processes", len(files), processes)
+        _worker_state = (self, files)
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=processes) as pool:
+                results = pool.map(_transform_worker, range(len(files)), chunksize=1)
+        finally:
+            _worker_state = None
+        for file, (content, match_states) in zip(files, results, strict=True):
+            for match, (fixed, yaml_path) in zip(
+                self.matches_per_file[file], match_states, strict=True
+            ):
+                match.fixed = fixed
+                match.yaml_path = yaml_path
+            if content is not None:
+                file.content = content
+            if file.updated:
+                file.write()
+
+    def transform_file(self, file: Lintable) -> None:
+        """Read a file and execute transforms on it, without writing it."""
+        matches = self.matches_per_file[file]
+        # str() convinces mypy that "text/yaml" is a valid Literal.
+        # Otherwise, it thinks base_kind is one of playbook, meta, tasks, ...
+        file_is_yaml = str(file.base_kind) == "text/yaml"
+
+        try:
+            data: str = file.content
+        except (UnicodeDecodeError, IsADirectoryError):  # pragma: no cover
+            # we hit a binary file (eg a jar or tar.gz) or a directory
+            data = ""
+            file_is_yaml = False
+
+        ruamel_data: CommentedMap | CommentedSeq | None = None
+        if file_is_yaml:
+            # We need a fresh YAML() instance for each load because ruamel.yaml
+            # stores intermediate state during load which could affect loading
+            # any other files. (Based on suggestion from ruamel.yaml author)
+            yaml = FormattedYAML(
+                # Ansible only uses YAML 1.1, but others files should use newer 1.2 (ruamel.yaml defaults to 1.2)
+                version=(1, 1) if file.is_owned_by_ansible() else None,
+            )
+
+            ruamel_data = yaml.load(data)
+            if not isinstance(ruamel_data, CommentedMap | CommentedSeq):
+                # This is an empty vars file or similar which loads as None.
+                # It is not safe to write this file or data-loss is likely.
+                # Only maps and sequences can preserve comments. Skip it.
+                _logger.debug(
+                    "Ignored reformatting %s because current implementation in ruamel.yaml would drop comments. See https://sourceforge.net/p/ruamel-yaml/tickets/460/",
+                    file,
                 )
+                return
 
-                ruamel_data = yaml.load(data)
-                if not isinstance(ruamel_data, CommentedMap | CommentedSeq):
-                    # This is an empty vars file or similar which loads as None.
-                    # It is not safe to write this file or data-loss is likely.
-                    # Only maps and sequences can preserve comments. Skip it.
-                    _logger.debug(
-                        "Ignored reformatting %s because current implementation in ruamel.yaml would drop comments. See https://sourceforge.net/p/ruamel-yaml/tickets/460/",
-                        file,
-                    )
-                    continue
-
-                if self.write_set != {"none"}:
-                    self._do_transforms(
-                        file, ruamel_data or data, file_is_yaml, matches
-                    )
-
-                _logger.debug("%s %s, version=%s", self.DUMP_MSG, file, yaml.version)
-                # noinspection PyUnboundLocalVariable
-                file.content = yaml.dumps(ruamel_data)
-
-            elif self.write_set != {"none"}:  # pragma: no cover
+            if self.write_set != {"none"}:
                 self._do_transforms(file, ruamel_data or data, file_is_yaml, matches)
 
-            if file.updated:
-                file.write()
+            _logger.debug("%s %s, version=%s", self.DUMP_MSG, file, yaml.version)
+            # noinspection PyUnboundLocalVariable
+            file.content = yaml.dumps(ruamel_data)
+
+        elif self.write_set != {"none"}:  # pragma: no cover
+            self._do_transforms(file, ruamel_data or data, file_is_yaml, matches)
 
     def _do_transforms(
         self,
@@ -146,6 +202,11 @@ class Transformer:
         matches: list[MatchError],
     ) -> None:
         """Do Rule-Transforms handling any last-minute MatchError inspections."""
+        index = (
+            LinePathIndex(file, cast("CommentedMap | CommentedSeq", data))
+            if file_is_yaml
+            else None
+        )
         for match in sorted(matches):
             match_id = f"{match.tag}/{match.match_type} {match.filename}:{match.lineno}"
             if not isinstance(match.rule, TransformMixin):
@@ -161,16 +222,15 @@ class Transformer:
             if rule_definition.isdisjoint(self.write_set) and self.write_set != {"all"}:
                 _logger.debug("%s %s", self.FIX_NE_MSG, match_id)
                 continue
-            if file_is_yaml and not match.yaml_path:
-                data = cast("CommentedMap | CommentedSeq", data)
+            if index and not match.yaml_path:
                 if match.match_type == "play":
-                    match.yaml_path = get_path_to_play(file, match.lineno, data)
+                    match.yaml_path = index.get_path_to_play(match.lineno)
                 elif match.task or file.kind in (
                     "tasks",
                     "handlers",
                     "playbook",
                 ):
-                    match.yaml_path = get_path_to_task(file, match.lineno, data)
+                    match.yaml_path = index.get_path_to_task(match.lineno)
 
             _logger.debug("%s %s", self.FIX_APPLY_MSG, match_id)
             try:
@@ -32,6 +32,7 @@ import json
 import logging
 import os
 import re
+from collections import OrderedDict
 from collections.abc import (
     ItemsView,
     Iterable,
@@ -41,7 +42,7 @@ from collections.abc import (
     Sequence,
 )
 from dataclasses import MISSING, dataclass, field
-from functools import cache, lru_cache
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -60,7 +61,6 @@ from ansible import constants as ansible_constants
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.parsing.dataloader import DataLoader
 from ansible.parsing.mod_args import ModuleArgsParser
-from ansible.parsing.plugin_docs import read_docstring
 from ansible.parsing.splitter import split_args
 from ansible.parsing.vault import PromptVaultSecret
 from ansible.parsing.yaml.loader import AnsibleLoader
@@ -93,8 +93,14 @@ from ansiblelint.constants import (
     FileType,
 )
 from ansiblelint.errors import MatchError
-from ansiblelint.file_utils import Lintable, discover_lintables, find_role_dir
-from ansiblelint.skip_utils import is_nested_task
+from ansiblelint.file_utils import (
+    PATH_CACHE_SIZE,
+    Lintable,
+    LintableRegistry,
+    discover_lintables,
+    find_role_dir,
+)
+from ansiblelint.skip_utils import is_nested_task, set_load_data_cache_size
 from ansiblelint.text import has_jinja, is_fqcn, removeprefix
 from ansiblelint.types import (
     AnsibleBaseYAMLObject,  # pyright: ignore[reportAttributeAccessIssue]
@@ -126,6 +132,18 @@ _SYNTAX_CHECK_FAILED = "syntax_check_failed"
 # Vault secrets are resolved on first use and cached for the process lifetime.
 _vault_secrets: list[tuple[str, Any]] | None = None
 
+# Files parsed by parse_yaml_linenumbers, along with the modification time and
+# size they had, so long-running processes notice when files change on disk.
+# Least recently used files come first, and are dropped when a limit is set.
+_parsed_files: OrderedDict[  # type: ignore[no-any-unimported]
+    tuple[str, str, Path],
+    tuple[tuple[int, int] | None, AnsibleBaseYAMLObject | None],
+] = OrderedDict()
+_parsed_files_limit: int | None = None
+
+# Number of parsed files kept in memory by --low-memory
+LOW_MEMORY_CACHE_SIZE = 64
+
 
 def _configured_vault_secrets() -> list[tuple[str, Any]] | None:
     """Load vault secrets from Ansible configuration, or None when unavailable."""
@@ -206,6 +224,25 @@ def parse_yaml_from_file(filepath: str) -> AnsibleJSON:
     raise TypeError(msg)
 
 
+def parse_yaml_from_lintable(lintable: Lintable) -> AnsibleJSON:
+    """Return YAML object of a lintable, reusing its already loaded data.
+
+    Unlike ``Lintable.data``, the returned object does not contain our own
+    annotations (``__line__``, ``__file__``, ``skipped_rules``), so consumers
+    can rely on it as if it was loaded by Ansible, without having to parse
+    the file again. Files that could not be loaded by our own loader, like
+    fully vault encrypted ones, are still loaded using Ansible DataLoader.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.yaml_utils import deannotate
+
+    data = lintable.data
+    if isinstance(data, Mapping | Sequence) and not isinstance(data, str):
+        result: AnsibleJSON = deannotate(data)
+        return result
+    return parse_yaml_from_file(str(lintable.path))
+
+
 def path_dwim(basedir: str, given: str) -> str:
     """Convert a given path do-what-I-mean style."""
     dataloader = _make_dataloader()
@@ -232,8 +269,23 @@ def _resolve_include_path(
     file_name: str,
 ) -> str:
     """Resolve a task include path, accounting for nested include context."""
-    search_basedirs = _include_search_basedirs(lintable, basedir)
+    return _resolve_include_path_in(
+        tuple(_include_search_basedirs(lintable, basedir)), file_name, os.getcwd()
+    )
+
 
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _resolve_include_path_in(
+    search_basedirs: tuple[str, ...],
+    file_name: str,
+    cwd: str,  # ruff:ignore[unused-function-argument]
+) -> str:
+    """Resolve a task include path, searching the given basedirs first.
+
+    Results are remembered, as the same files are included from many places.
+    """
+    # pylint: disable=unused-argument # cwd is part of the cache key, for relative paths
+    basedir = search_basedirs[0]
     for search_basedir in search_basedirs:
         for candidate in (
             path_dwim(search_basedir, file_name),
@@ -271,12 +323,23 @@ def ansible_templar(basedir: Path, templatevars: Any) -> Templar:
     if basedir.name == "tasks":
         basedir = basedir.parent
 
-    dataloader = _make_dataloader()
-    dataloader.set_basedir(str(basedir))
-    templar = Templar(dataloader, variables=templatevars)
+    templar = _pooled_templar(str(basedir))
+    templar.available_variables = templatevars or {}
     return templar
 
 
+@lru_cache(maxsize=128)
+def _pooled_templar(basedir: str) -> Templar:
+    """Return a Templar reused for all the templates found inside a directory.
+
+    Creating a Templar needs a new DataLoader and its vault secrets, which is
+    too slow to be done for each templated string.
+    """
+    dataloader = _make_dataloader()
+    dataloader.set_basedir(basedir)
+    return Templar(dataloader)
+
+
 def mock_filter(left: Any, *args: Any, **kwargs: Any) -> Any:  # ruff:ignore[unused-function-argument]
     """Mock a filter that can take any combination of args and kwargs.
 
@@ -292,6 +355,10 @@ def mock_filter(left: Any, *args: Any, **kwargs: Any) -> Any:  # ruff:ignore[unu
     return left
 
 
+_LOOKUP_ENVIRONMENT = Environment(autoescape=True)
+
+
+@lru_cache(maxsize=4096)
 def has_lookup_function_calls(varname: str) -> bool:
     """Check if a template string contains lookup, query, or q function calls using AST parsing.
 
@@ -304,8 +371,7 @@ def has_lookup_function_calls(varname: str) -> bool:
     lookup_names = {"lookup", "query", "q"}
 
     try:
-        env = Environment(autoescape=True)
-        ast_tree = env.parse(varname)
+        ast_tree = _LOOKUP_ENVIRONMENT.parse(varname)
 
         for node in ast_tree.find_all(nodes.Call):
             if isinstance(node.node, nodes.Name) and node.node.name in lookup_names:
@@ -458,6 +524,11 @@ def set_collections_basedir(basedir: Path) -> None:
     # fmt: on
 
 
+# maximum number of template outcomes remembered by ``template``
+TEMPLATE_CACHE_SIZE = 4096
+_template_outcomes: OrderedDict[tuple[str, ...], tuple[bool, Any]] = OrderedDict()
+
+
 def template(
     basedir: Path,
     value: Any,
@@ -467,21 +538,73 @@ def template(
     fail_on_undefined: bool = False,
     **kwargs: str,
 ) -> Any:
-    """Attempt rendering a value with known vars."""
-    try:
-        value = ansible_template(
-            basedir.resolve(),
-            value,
-            variables,
-            **dict(kwargs, fail_on_undefined=fail_on_undefined),
-        )
-        # Hack to skip the following exception when using to_json filter on a variable. # ruff:ignore[line-contains-hack]
-        # I guess the filter doesn't like empty vars...
-    except (AnsibleError, ValueError, RepresenterError, ImportError):
+    """Attempt rendering a value with known vars.
+
+    Outcomes of rendering strings are remembered, as the same strings, like
+    ``{{ item }}``, are usually found many times inside a project.
+    """
+    basedir = basedir.resolve()
+    template_kwargs = dict(kwargs, fail_on_undefined=fail_on_undefined)
+    key = _template_key(basedir, value, variables, template_kwargs)
+    outcome = _template_outcomes.get(key) if key else None
+    if outcome is not None and (outcome[0] or not fail_on_error):
+        _template_outcomes.move_to_end(key)  # type: ignore[arg-type]
+    else:
+        try:
+            outcome = (
+                True,
+                ansible_template(basedir, value, variables, **template_kwargs),
+            )
+            # Hack to skip the following exception when using to_json filter on a variable. # ruff:ignore[line-contains-hack]
+            # I guess the filter doesn't like empty vars...
+        except (AnsibleError, ValueError, RepresenterError, ImportError):
+            # failures are remembered without their exception, which is raised
+            # again by rendering the value for the callers needing it
+            _remember_template_outcome(key, (False, None))
+            if fail_on_error:
+                raise
+            return value
+        _remember_template_outcome(key, outcome)
+
+    succeeded, result = outcome
+    if not succeeded:
         # templating failed, so just keep value as is.
-        if fail_on_error:
-            raise
-    return value
+        return value
+    return result if isinstance(result, str) else copy.deepcopy(result)
+
+
+def _remember_template_outcome(
+    key: tuple[str, ...] | None,
+    outcome: tuple[bool, Any],
+) -> None:
+    """Remember the outcome of rendering a string, if it can be cached."""
+    if key:
+        _template_outcomes[key] = outcome
+        if len(_template_outcomes) > TEMPLATE_CACHE_SIZE:
+            _template_outcomes.popitem(last=False)
+
+
+def _template_key(
+    basedir: Path,
+    value: Any,
+    variables: Any,
+    kwargs: dict[str, Any],
+) -> tuple[str, ...] | None:
+    """Return the key of the outcome of rendering a string, if it can be cached."""
+    if not isinstance(value, str):
+        return None
+    try:
+        variables_key = json.dumps(variables, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return (
+        str(basedir),
+        value,
+        variables_key,
+        json.dumps(kwargs, sort_keys=True),
+        # mocked filters change the outcome of templates using them
+        ",".join(options.mock_filters),
+    )
 
 
 @dataclass
@@ -490,6 +613,7 @@ class HandleChildren:
 
     rules: RulesCollection = field(init=True, repr=False)
     app: App
+    registry: LintableRegistry = field(default_factory=LintableRegistry, repr=False)
 
     def include_children(
         self,
@@ -520,10 +644,7 @@ class HandleChildren:
             return []
 
         result = _resolve_include_path(lintable, basedir, file)
-        child = Lintable(result, kind=parent_type)
-        child.parent = lintable
-
-        return [child]
+        return [self.registry.get(result, kind=parent_type, parent=lintable)]
 
     def taskshandlers_children(
         self,
@@ -553,6 +674,7 @@ class HandleChildren:
                     k,
                     parent_type,
                     lintable=lintable,
+                    registry=self.registry,
                 )
                 results.append(children)
                 continue
@@ -591,7 +713,7 @@ class HandleChildren:
         """Verify that the task handler action is valid for role include."""
         module = th_action["__ansible_module__"]
 
-        lintable = Lintable(
+        lintable = self.registry.get(
             self.rules.options.lintables[0] if self.rules.options.lintables else ".",
         )
         if "name" not in th_action:
@@ -680,14 +802,14 @@ class HandleChildren:
             if not is_collection and self._recheck_playbook_with_extra_vars(
                 possible_path
             ):
-                return [Lintable(possible_path, kind=parent_type)]
+                return [self.registry.get(possible_path, kind=parent_type)]
             return (
                 _SYNTAX_CHECK_FAILED,
                 f"Failed to load {name} playbook due to failing syntax check.",
             )
         if is_collection:
             return []  # don't lint foreign playbook
-        return [Lintable(possible_path, kind=parent_type)]
+        return [self.registry.get(possible_path, kind=parent_type)]
 
     def import_playbook_children(
         self,
@@ -754,72 +876,107 @@ class HandleChildren:
         role_path = self._rolepath(basedir, role)
         if not role_path:  # pragma: no branch
             return []
+        return [self.registry.get(file) for file in _role_files(role_path, os.getcwd())]
 
-        results = []
-
-        for kind in ["tasks", "meta", "handlers", "vars", "defaults"]:
-            current_path = os.path.join(role_path, kind)
-            for folder, _, files in os.walk(current_path):
-                for file in files:
-                    file_ignorecase = file.lower()
-                    if file_ignorecase.endswith((".yml", ".yaml")):
-                        results.append(Lintable(os.path.join(folder, file)))
+    def _rolepath(self, basedir: str, role: str) -> str | None:
+        return _find_role_path(
+            basedir,
+            role,
+            tuple(self.app.runtime.config.default_roles_path),
+            tuple(self.app.runtime.config.collections_paths),
+            os.getcwd(),
+        )
 
-        return results
 
-    def _rolepath(self, basedir: str, role: str) -> str | None:
-        role_path = None
-        namespace_name, collection_name, *role_name = parse_fqcn(role)
-
-        possible_paths = [
-            # if included from a playbook
-            path_dwim(basedir, os.path.join("roles", role_name[-1])),
-            path_dwim(basedir, role_name[-1]),
-            # if included from roles/[role]/meta/main.yml
-            path_dwim(basedir, os.path.join("..", "..", "..", "roles", role_name[-1])),
-            path_dwim(basedir, os.path.join("..", "..", role_name[-1])),
-            # if checking a role in the current directory
-            path_dwim(basedir, os.path.join("..", role_name[-1])),
-        ]
-        if len(role_name) > 1:
-            # This ignores deeper structures than 1 level
-            possible_paths.append(path_dwim(basedir, os.path.join("roles", *role_name)))
-            possible_paths.append(path_dwim(basedir, os.path.join(*role_name)))
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _role_files(
+    role_path: str,
+    cwd: str,  # ruff:ignore[unused-function-argument]
+) -> tuple[str, ...]:
+    """Return the YAML files of a role, which are remembered."""
+    # pylint: disable=unused-argument # cwd is part of the cache key, for relative paths
+    results = []
+    for kind in ["tasks", "meta", "handlers", "vars", "defaults"]:
+        current_path = os.path.join(role_path, kind)
+        for folder, _, files in os.walk(current_path):
+            for file in files:
+                file_ignorecase = file.lower()
+                if file_ignorecase.endswith((".yml", ".yaml")):
+                    results.append(os.path.join(folder, file))
+    return tuple(results)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _find_role_path(
+    basedir: str,
+    role: str,
+    roles_paths: tuple[str, ...],
+    collections_paths: tuple[str, ...],
+    cwd: str,  # ruff:ignore[unused-function-argument]
+) -> str | None:
+    """Return the path of a role used from basedir.
+
+    Results are remembered, as the same roles are usually used by many
+    playbooks and roles of a project.
+    """
+    # pylint: disable=unused-argument # cwd is part of the cache key, for relative paths
+    role_path = None
+    namespace_name, collection_name, *role_name = parse_fqcn(role)
+
+    possible_paths = [
+        # if included from a playbook
+        path_dwim(basedir, os.path.join("roles", role_name[-1])),
+        path_dwim(basedir, role_name[-1]),
+        # if included from roles/[role]/meta/main.yml
+        path_dwim(basedir, os.path.join("..", "..", "..", "roles", role_name[-1])),
+        path_dwim(basedir, os.path.join("..", "..", role_name[-1])),
+        # if checking a role in the current directory
+        path_dwim(basedir, os.path.join("..", role_name[-1])),
+    ]
+    if len(role_name) > 1:
+        # This ignores deeper structures than 1 level
+        possible_paths.append(path_dwim(basedir, os.path.join("roles", *role_name)))
+        possible_paths.append(path_dwim(basedir, os.path.join(*role_name)))
+        possible_paths.append(path_dwim(basedir, os.path.join("..", "..", *role_name)))
+
+    for loc in roles_paths:
+        loc = os.path.expanduser(loc)
+        possible_paths.append(path_dwim(loc, role_name[-1]))
+
+    if namespace_name and collection_name:
+        for loc in collections_paths:
+            loc = os.path.expanduser(loc)
             possible_paths.append(
-                path_dwim(basedir, os.path.join("..", "..", *role_name))
+                path_dwim(
+                    loc,
+                    os.path.join(
+                        "ansible_collections",
+                        namespace_name,
+                        collection_name,
+                        "roles",
+                        role_name[-1],
+                    ),
+                ),
             )
 
-        for loc in self.app.runtime.config.default_roles_path:
-            loc = os.path.expanduser(loc)
-            possible_paths.append(path_dwim(loc, role_name[-1]))
-
-        if namespace_name and collection_name:
-            for loc in self.app.runtime.config.collections_paths:
-                loc = os.path.expanduser(loc)
-                possible_paths.append(
-                    path_dwim(
-                        loc,
-                        os.path.join(
-                            "ansible_collections",
-                            namespace_name,
-                            collection_name,
-                            "roles",
-                            role_name[-1],
-                        ),
-                    ),
-                )
+    possible_paths.append(path_dwim(basedir, ""))
 
-        possible_paths.append(path_dwim(basedir, ""))
+    for path_option in possible_paths:  # pragma: no branch
+        if os.path.isdir(path_option):
+            role_path = path_option
+            break
 
-        for path_option in possible_paths:  # pragma: no branch
-            if os.path.isdir(path_option):
-                role_path = path_option
-                break
+    if role_path:  # pragma: no branch
+        add_all_plugin_dirs(role_path)  # type: ignore[no-untyped-call]
+
+    return role_path
 
-        if role_path:  # pragma: no branch
-            add_all_plugin_dirs(role_path)  # type: ignore[no-untyped-call]
 
-        return role_path
+def clear_resolution_caches() -> None:
+    """Forget the paths found for roles and includes, as files changed."""
+    _find_role_path.cache_clear()
+    _role_files.cache_clear()
+    _resolve_include_path_in.cache_clear()
 
 
 def _get_task_handler_children_for_tasks_or_playbooks(
@@ -828,6 +985,7 @@ def _get_task_handler_children_for_tasks_or_playbooks(
     k: Any,
     parent_type: FileType,
     lintable: Lintable | None = None,
+    registry: LintableRegistry | None = None,
 ) -> Lintable:
     """Try to get children of taskhandler for include/import tasks/playbooks."""
     child_type = k if parent_type == "playbook" else parent_type
@@ -858,10 +1016,9 @@ def _get_task_handler_children_for_tasks_or_playbooks(
                 # ignore invalid data (syntax check will outside the scope)
                 continue
             f = _resolve_include_path(lintable, basedir, file_name)
-            child = Lintable(f, kind=child_type)
-            if lintable:
-                child.parent = lintable
-            return child
+            return (registry or LintableRegistry()).get(
+                f, kind=child_type, parent=lintable
+            )
     msg = f"The node contains none of: {', '.join(sorted(INCLUSION_ACTION_NAMES))}"
     raise LookupError(msg)
 
@@ -1329,14 +1486,55 @@ def add_action_type(  # type: ignore[no-any-unimported]
     return results
 
 
-@cache
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return the modification time and size of a file, if it exists."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def limit_parse_caches(size: int | None) -> None:
+    """Limit how many parsed files are kept in memory, None meaning no limit."""
+    global _parsed_files_limit  # pylint: disable=global-statement
+    if size == _parsed_files_limit:
+        return
+    _parsed_files_limit = size
+    while size is not None and len(_parsed_files) > size:
+        _parsed_files.popitem(last=False)
+    set_load_data_cache_size(size)
+
+
+def parsed_files() -> list[tuple[str, str, Path]]:
+    """Return the name, kind and absolute path of the parsed files."""
+    return list(_parsed_files)
+
+
 def parse_yaml_linenumbers(  # type: ignore[no-any-unimported]
     lintable: Lintable,
 ) -> AnsibleBaseYAMLObject | None:
     """Parse yaml as ansible.utils.parse_yaml but with linenumbers.
 
-    The line numbers are stored in each node's LINE_NUMBER_KEY key.
+    The line numbers are stored in each node's LINE_NUMBER_KEY key. Results
+    are reused until the file changes on disk.
     """
+    key = (lintable.name, str(lintable.kind), lintable.abspath)
+    stamp = _file_stamp(lintable.path)
+    if key in _parsed_files and _parsed_files[key][0] == stamp:
+        _parsed_files.move_to_end(key)
+        return _parsed_files[key][1]
+    result = _parse_yaml_linenumbers(lintable)
+    _parsed_files[key] = (stamp, result)
+    _parsed_files.move_to_end(key)
+    if _parsed_files_limit is not None and len(_parsed_files) > _parsed_files_limit:
+        _parsed_files.popitem(last=False)
+    return result
+
+
+def _parse_yaml_linenumbers(  # type: ignore[no-any-unimported]
+    lintable: Lintable,
+) -> AnsibleBaseYAMLObject | None:
     loader: AnsibleLoader  # type: ignore[valid-type]
     result = AnsibleSequence()
 
@@ -1526,17 +1724,29 @@ def parse_examples_from_plugin(lintable: Lintable) -> tuple[int, str, str]:
 
     Store a line number offset to realign returned line numbers later
     """
-    offset = 1
-    parsed = ast.parse(lintable.content)
-    for child in parsed.body:
-        if isinstance(child, ast.Assign):
-            label = child.targets[0]
-            if isinstance(label, ast.Name) and label.id == "EXAMPLES":
-                offset = child.lineno - 1
-                break
+    return parse_examples(lintable.content)
+
 
-    docs = read_docstring(str(lintable.path.resolve(strict=False)))  # type: ignore[no-untyped-call]
-    examples = docs["plainexamples"] or ""
+def parse_examples(source: str) -> tuple[int, str, str]:
+    """Return the line offset, content and format of EXAMPLES in plugin code.
+
+    The module is parsed a single time and, like ansible-doc does, the last
+    assignment of a string to ``EXAMPLES`` is used.
+    """
+    offset = 1
+    examples = ""
+    for child in ast.parse(source).body:
+        if (
+            isinstance(child, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "EXAMPLES"
+                for target in child.targets
+            )
+            and isinstance(child.value, ast.Constant)
+            and isinstance(child.value.value, str)
+        ):
+            offset = child.lineno - 1
+            examples = child.value.value
 
     # Extract example format type (if present).
     # See https://github.com/ansible/ansible/pull/71184 and https://github.com/ansible/ansible-lint/issues/5037
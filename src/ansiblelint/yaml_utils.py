@@ -522,6 +522,198 @@ def _get_path_to_task_in_nested_tasks_block(
     return []
 
 
+class LinePathIndex:
+    """Paths of the plays and tasks found at each line of a YAML document.
+
+    ``get_path_to_play`` and ``get_path_to_task`` scan the document for each
+    line they are given. The index scans it once, giving each line the path
+    those functions would return, so locating many matches inside the same
+    file only needs lookups.
+    """
+
+    def __init__(
+        self,
+        lintable: Lintable,
+        ruamel_data: CommentedMap | CommentedSeq,
+    ) -> None:
+        """Create the index, which is built on first use."""
+        self.lintable = lintable
+        self.ruamel_data = ruamel_data
+        self.line_count = lintable.content.count("\n") + 1
+        self._plays: list[list[str | int] | None] | None = None
+        self._tasks: list[list[str | int] | None] | None = None
+
+    def _indexed(self, lineno: int) -> bool:
+        return (
+            1 <= lineno <= self.line_count
+            and self.lintable.kind in ("tasks", "handlers", "playbook")
+            and isinstance(self.ruamel_data, CommentedSeq)
+        )
+
+    def get_path_to_play(self, lineno: int) -> list[str | int]:
+        """Get the path to the play at the given line number."""
+        if not self._indexed(lineno):
+            return get_path_to_play(self.lintable, lineno, self.ruamel_data)
+        if self._plays is None:
+            self._plays = self._index_plays(cast("CommentedSeq", self.ruamel_data))
+        return list(self._plays[lineno - 1] or [])
+
+    def get_path_to_task(self, lineno: int) -> list[str | int]:
+        """Get the path to the task at the given line number."""
+        if not self._indexed(lineno):
+            return get_path_to_task(self.lintable, lineno, self.ruamel_data)
+        if self._tasks is None:
+            self._tasks = self._index_tasks(cast("CommentedSeq", self.ruamel_data))
+        return list(self._tasks[lineno - 1] or [])
+
+    def _index_plays(self, plays: CommentedSeq) -> list[list[str | int] | None]:
+        paths: list[list[str | int] | None] = [None] * self.line_count
+        if self.lintable.kind != "playbook":
+            return paths
+        # the first line is never part of a play
+        paths[0] = []
+        for play_index in range(len(plays)):
+            line = _item_line(plays, play_index)
+            _paint(paths, line, line + 1, [play_index])
+            if play_index > 0:
+                _paint(
+                    paths, _item_line(plays, play_index - 1) + 1, line, [play_index - 1]
+                )
+        # lines that are not found belong to the last play
+        if plays:
+            _paint(paths, 0, self.line_count, [len(plays) - 1])
+        return paths
+
+    def _index_tasks(self, data: CommentedSeq) -> list[list[str | int] | None]:
+        paths: list[list[str | int] | None] = [None] * self.line_count
+        if self.lintable.kind in ("tasks", "handlers"):
+            _paint_tasks_block(paths, data, None, [], self.line_count)
+            return paths
+        for play_index, play in enumerate(data):
+            next_play_line_index = (
+                _item_line(data, play_index + 1) if play_index + 1 < len(data) else None
+            )
+            if not isinstance(play, CommentedMap):
+                continue
+            # lines after the start of the next play are never part of this one
+            stop = next_play_line_index or self.line_count
+            play_keys = list(play.keys())
+            for tasks_keyword in PLAYBOOK_TASK_KEYWORDS:
+                if not play.get(tasks_keyword):
+                    continue
+                try:
+                    next_keyword = play_keys[play_keys.index(tasks_keyword) + 1]
+                except IndexError:
+                    last_lineno_in_block = next_play_line_index
+                else:
+                    last_lineno_in_block = play.lc.data[next_keyword][0]
+                _paint_tasks_block(
+                    paths,
+                    play[tasks_keyword],
+                    last_lineno_in_block,
+                    [play_index, tasks_keyword],
+                    stop,
+                )
+        return paths
+
+
+def _item_line(seq: CommentedSeq, index: int) -> int:
+    """Return the 0-based line of an item of a sequence."""
+    item = seq[index]
+    line = item.lc.line if isinstance(item, CommentedMap | CommentedSeq) else None
+    if line is None:
+        line = seq.lc.item(index)[0]
+    if not isinstance(line, int):  # pragma: no cover
+        msg = f"expected lc.line to be an int, got {line!r}"
+        raise TypeError(msg)
+    return line
+
+
+def _paint(
+    paths: list[list[str | int] | None],
+    start: int,
+    stop: int,
+    path: list[str | int],
+) -> None:
+    """Give a path to the lines between start and stop without one yet."""
+    for line_index in range(max(start, 0), min(stop, len(paths))):
+        if paths[line_index] is None:
+            paths[line_index] = path
+
+
+def _paint_tasks_block(
+    paths: list[list[str | int] | None],
+    tasks_block: CommentedSeq,
+    last_lineno: int | None,  # 1-based
+    parent_path: list[str | int],
+    stop: int,  # 0-based, exclusive
+) -> None:
+    """Index a tasks block like ``_get_path_to_task_in_tasks_block`` finds tasks.
+
+    Lines are given a path in the same order the tasks are checked by the
+    function, so the first path found for a line is kept.
+    """
+    # lines after the block end at last_lineno, which is 1-based
+    block_stop = min(stop, last_lineno) if last_lineno is not None else stop
+    last_task_index = len(tasks_block) - 1
+    for task_index, task in enumerate(tasks_block):
+        task_path = [*parent_path, task_index]
+        task_line_index = _item_line(tasks_block, task_index)
+        next_task_line_index = (
+            _item_line(tasks_block, task_index + 1)
+            if task_index < last_task_index
+            else None
+        )
+        if isinstance(task, CommentedMap):
+            _paint_nested_tasks_blocks(
+                paths, task, task_path, next_task_line_index, stop
+            )
+        _paint(paths, task_line_index, min(task_line_index + 1, stop), task_path)
+        if task_index > 0:
+            _paint(
+                paths,
+                _item_line(tasks_block, task_index - 1) + 1,
+                min(task_line_index, stop),
+                [*parent_path, task_index - 1],
+            )
+        if task_index == last_task_index:
+            _paint(paths, task_line_index + 1, block_stop, task_path)
+
+
+def _paint_nested_tasks_blocks(
+    paths: list[list[str | int] | None],
+    task: CommentedMap,
+    task_path: list[str | int],
+    next_task_line_index: int | None,  # 0-based
+    stop: int,  # 0-based, exclusive
+) -> None:
+    """Index the nested tasks blocks like ``_get_path_to_task_in_nested_tasks_block``."""
+    task_keys = list(task.keys())
+    for key_index, task_key in enumerate(task_keys):
+        nested_task_block = task[task_key]
+        if (
+            task_key not in NESTED_TASK_KEYS
+            or not nested_task_block
+            or not isinstance(nested_task_block, CommentedSeq)
+        ):
+            continue
+        key_stop = stop
+        if key_index + 1 < len(task_keys):
+            next_task_key = task_keys[key_index + 1]
+            # lines from the value of the next key on are never part of the block
+            key_stop = min(stop, task.lc.data[next_task_key][2])
+            last_lineno_in_block = task.lc.data[next_task_key][0]
+        else:
+            last_lineno_in_block = next_task_line_index
+        _paint_tasks_block(
+            paths,
+            nested_task_block,
+            last_lineno_in_block,
+            [*task_path, task_key],
+            key_stop,
+        )
+
+
 class OctalIntYAML11(ScalarInt):
     """OctalInt representation for YAML 1.1."""
 
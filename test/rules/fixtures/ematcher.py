@@ -11,6 +11,7 @@ class EMatcherRule(AnsibleLintRule):
         "This is a test custom rule that looks for lines containing BANNED string"
     )
     tags = ["fake", "dummy", "test1"]
+    line_pattern = "BANNED"
 
     def match(self, line: str) -> bool:
         return "BANNED" in line
@@ -240,6 +240,21 @@ def test_config_failure(base_arguments: list[str], config_file: str) -> None:
         cli.get_config([*base_arguments, "-c", config_file])
 
 
+@pytest.mark.parametrize("jobs", ("-1", "two"))
+def test_jobs_invalid(
+    base_arguments: list[str], jobs: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Ensures negative or non numeric --jobs values are rejected."""
+    with pytest.raises(SystemExit, match=r"^2$"):
+        cli.get_config([*base_arguments, "--jobs", jobs])
+    assert "invalid non-negative int value" in capsys.readouterr().err
+
+
+def test_jobs_zero(base_arguments: list[str]) -> None:
+    """Ensures --jobs accepts zero, meaning the number of available CPUs."""
+    assert cli.get_config([*base_arguments, "--jobs", "0"]).jobs == 0
+
+
 def test_extra_vars_loaded(base_arguments: list[str]) -> None:
     """Ensure ``extra_vars`` option is loaded from file config."""
     config = cli.get_config(
@@ -184,7 +184,14 @@ def test_run_single_role_path_with_roles_path_env(local_test_dir: Path) -> None:
     ),
     ids=("on", "off"),
 )
-def test_run_playbook_github(result: bool, env: dict[str, str]) -> None:
+@pytest.mark.parametrize(
+    "args",
+    ((), ("--format", "ndjson")),
+    ids=("rich", "ndjson"),
+)
+def test_run_playbook_github(
+    result: bool, env: dict[str, str], args: tuple[str, ...]
+) -> None:
     """Call ansible-lint simulating GitHub Actions environment."""
     cwd = Path(__file__).parent.parent.resolve()
     role_path = "examples/playbooks/example.yml"
@@ -192,7 +199,7 @@ def test_run_playbook_github(result: bool, env: dict[str, str]) -> None:
     if env is None:
         env = {}
     env["PATH"] = os.environ["PATH"]
-    result_gh = run_ansible_lint(role_path, cwd=cwd, env=env)
+    result_gh = run_ansible_lint(role_path, *args, cwd=cwd, env=env)
 
     expected = (
         "::error file=examples/playbooks/example.yml,line=44,severity=VERY_LOW,title=package-latest::"
@@ -0,0 +1,140 @@
+"""Tests related to ansiblelint.daemon module."""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansiblelint.constants import RC
+from ansiblelint.daemon import _check_socket, default_socket_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_daemon(tmp_path: Path) -> None:
+    """Verify that the daemon answers lint requests and notices changed files."""
+    socket_path = tmp_path / "daemon.sock"
+    env = {**os.environ, "ANSIBLE_LINT_SOCKET": str(socket_path)}
+    playbook = tmp_path / "playbook.yml"
+    playbook.write_text(
+        "---\n- name: Play\n  hosts: localhost\n  tasks:\n"
+        "    - name: Run\n      ansible.builtin.command: echo foo\n",
+        encoding="utf-8",
+    )
+
+    def lint() -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "ansiblelint.daemon",
+                "--offline",
+                "--nocolor",
+                "-f",
+                "pep8",
+            ],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    with subprocess.Popen(
+        [sys.executable, "-m", "ansiblelint", "--serve", "--offline"],
+        cwd=tmp_path,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ) as daemon:
+        try:
+            for _ in range(1200):
+                if socket_path.exists() or daemon.poll() is not None:
+                    break
+                time.sleep(0.1)
+            result = lint()
+            assert "Running without it" not in result.stderr
+            assert result.returncode == RC.VIOLATIONS_FOUND
+            assert "playbook.yml:5: no-changed-when" in result.stdout
+
+            playbook.write_text(
+                playbook.read_text(encoding="utf-8") + "      changed_when: false\n",
+                encoding="utf-8",
+            )
+            result = lint()
+            assert "Running without it" not in result.stderr
+            assert result.returncode == RC.SUCCESS, result.stdout
+        finally:
+            daemon.terminate()
+
+    # without the daemon, the client lints by itself
+    assert not socket_path.exists()
+    assert lint().returncode == RC.SUCCESS
+
+
+def test_default_socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify that the socket is not placed directly in the shared temp dir."""
+    monkeypatch.delenv("ANSIBLE_LINT_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == tmp_path / "ansible-lint.sock"
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert default_socket_path().parent.name == f"ansible-lint-{os.getuid()}"
+
+
+def test_check_socket(tmp_path: Path) -> None:
+    """Verify that only private sockets of the current user are trusted."""
+    socket_path = tmp_path / "daemon.sock"
+    with pytest.raises(FileNotFoundError):
+        _check_socket(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        socket_path.chmod(0o600)
+        _check_socket(socket_path)
+
+        socket_path.chmod(0o666)
+        with pytest.raises(PermissionError, match="not private"):
+            _check_socket(socket_path)
+        socket_path.chmod(0o600)
+
+        tmp_path.chmod(0o777)
+        try:
+            with pytest.raises(PermissionError, match="modified by other users"):
+                _check_socket(socket_path)
+        finally:
+            tmp_path.chmod(0o700)
+
+    socket_path.unlink()
+    socket_path.write_text("", encoding="utf-8")
+    socket_path.chmod(0o600)
+    with pytest.raises(PermissionError, match="not private"):
+        _check_socket(socket_path)
+
+
+def test_client_untrusted_socket(tmp_path: Path) -> None:
+    """Verify that the client lints by itself when the socket is not private."""
+    socket_path = tmp_path / "daemon.sock"
+    (tmp_path / "playbook.yml").write_text(
+        "---\n- name: Play\n  hosts: localhost\n  tasks: []\n", encoding="utf-8"
+    )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        socket_path.chmod(0o666)
+        server.listen()
+        result = subprocess.run(
+            [sys.executable, "-m", "ansiblelint.daemon", "--offline", "--nocolor"],
+            cwd=tmp_path,
+            env={**os.environ, "ANSIBLE_LINT_SOCKET": str(socket_path)},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    assert "is not private to the current user. Running without it." in result.stderr
+    assert result.returncode == RC.SUCCESS, result.stdout
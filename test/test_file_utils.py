@@ -5,13 +5,15 @@ from __future__ import annotations
 import copy
 import logging
 import os
+import subprocess
 import time
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from ansiblelint import cli, file_utils
+from ansiblelint import cli, file_utils, utils
 from ansiblelint.config import options
 from ansiblelint.file_utils import (
     Lintable,
@@ -688,3 +690,205 @@ def test_expand_dirs_in_lintables_warns_on_expansion(
         expand_dirs_in_lintables(lintables)
     assert "Directory expansion discovered" in caplog.text
     assert "exclude_paths" in caplog.text
+
+
+def test_lintable_tasks_are_normalized_once(
+    default_rules_collection: RulesCollection,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Task index is shared by all rules, so each task is normalized once."""
+    calls: list[str] = []
+    original = utils.normalize_task_v2
+
+    def counting_normalize_task_v2(task: Any) -> Any:
+        calls.append(task.position)
+        return original(task)
+
+    monkeypatch.setattr(utils, "normalize_task_v2", counting_normalize_task_v2)
+    lintable = Lintable("examples/playbooks/tasks/local_action.yml", kind="tasks")
+    assert lintable.tasks is lintable.tasks
+    default_rules_collection.run(lintable)
+    assert len(calls) == len(lintable.tasks)
+    assert all("__raw_task__" not in task.normalized_task for task in lintable.tasks)
+
+
+def test_get_changed_files(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Verify that changed and untracked files are reported by get_changed_files."""
+    monkeypatch.chdir(tmp_path)
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    for name in ("changed.yml", "same.yml"):
+        (tmp_path / name).write_text("---\n", encoding="utf-8")
+    for cmd in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "init"]):
+        subprocess.run(["git", *cmd], check=True, env=env)
+    (tmp_path / "changed.yml").write_text("---\nfoo: bar\n", encoding="utf-8")
+    (tmp_path / "new.yml").write_text("---\n", encoding="utf-8")
+
+    assert file_utils.get_changed_files("HEAD") == {
+        (tmp_path / "changed.yml").resolve(),
+        (tmp_path / "new.yml").resolve(),
+    }
+    with pytest.raises(RuntimeError, match="Unable to find files changed"):
+        file_utils.get_changed_files("missing-revision")
+
+
+def _make_ignored_tree(root: Path) -> None:
+    for name in (
+        "site.yml",
+        "ignored.yml",
+        "roles/foo/tasks/main.yml",
+        "roles/foo/tasks/local.yml",
+        "roles/foo/files/keep.yml",
+        "build/out.yml",
+        ".tox/env.yml",
+    ):
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text("---\n", encoding="utf-8")
+    (root / ".gitignore").write_text(
+        "ignored.yml\nbuild/\nlocal.yml\n", encoding="utf-8"
+    )
+    # nested ignore files apply below their folder, overriding the parent ones
+    (root / "roles/foo/.gitignore").write_text(
+        "files/*\n!local.yml\n", encoding="utf-8"
+    )
+    (root / "roles/foo/files/.gitignore").write_text("!keep.yml\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("jobs", (1, 4), ids=("serial", "parallel"))
+def test_get_all_files_walk(
+    tmp_path: Path, monkeypatch: MonkeyPatch, jobs: int
+) -> None:
+    """Verify that nested .gitignore files are layered when walking folders."""
+    _make_ignored_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(file_utils, "_git_files", lambda _: None)
+    assert file_utils.get_all_files(Path(), jobs=jobs) == [
+        Path(".gitignore"),
+        Path("roles/foo/.gitignore"),
+        Path("roles/foo/files/keep.yml"),
+        Path("roles/foo/tasks/local.yml"),
+        Path("roles/foo/tasks/main.yml"),
+        Path("site.yml"),
+    ]
+    assert file_utils.get_all_files(Path(), exclude_paths=["roles/"]) == [
+        Path(".gitignore"),
+        Path("site.yml"),
+    ]
+
+
+def test_get_all_files_git(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Verify that git decides which files are listed inside a repository."""
+    _make_ignored_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q"], check=True)
+    subprocess.run(["git", "add", "-f", "ignored.yml"], check=True)
+    (tmp_path / "site.yml").unlink()
+    assert file_utils.get_all_files(Path()) == [
+        Path(".gitignore"),
+        Path("ignored.yml"),
+        Path("roles/foo/.gitignore"),
+        Path("roles/foo/files/keep.yml"),
+        Path("roles/foo/tasks/local.yml"),
+        Path("roles/foo/tasks/main.yml"),
+    ]
+
+
+def test_lintable_registry() -> None:
+    """Verify that the registry hands out a single Lintable per file and kind."""
+    registry = file_utils.LintableRegistry()
+    parent = registry.get("examples/playbooks/include.yml")
+    child = registry.get("examples/playbooks/tasks/x.yml", kind="tasks", parent=parent)
+    assert child.parent is parent
+    # symlinks and relative paths lead to the same file
+    same = registry.get(Path("examples/playbooks/../playbooks/tasks/x.yml").absolute())
+    assert same is child
+    # the parent is only recorded by the first include
+    assert registry.get(child.path, kind="tasks", parent=child) is child
+    assert child.parent is parent
+    assert registry.get(child.path, kind="handlers") is not child
+
+    explicit = Lintable("examples/playbooks/empty_playbook.yml")
+    registry.add(explicit)
+    assert registry.get("examples/playbooks/empty_playbook.yml") is explicit
+
+
+def test_kind_matcher() -> None:
+    """Verify that the compiled kind patterns keep their order."""
+    matcher = file_utils.KindMatcher((
+        ("tasks", "**/tasks/*.{yml,yaml}"),
+        ("yaml", "**/*.yml"),
+        ("role", "**/x.yml"),
+    ))
+    assert list(matcher.match("roles/foo/tasks/main.yml")) == ["tasks", "yaml"]
+    assert list(matcher.match("tasks/x.yml")) == ["tasks", "yaml", "role"]
+    assert list(matcher.match("foo.yaml")) == []
+
+
+def test_exclude_matcher() -> None:
+    """Verify that compiled exclusions match like each pattern did separately."""
+    patterns = [
+        "roles/vendor/",
+        "*.j2",
+        "molecule",
+        "collections/ansible_collections",
+        "tests/*/fixtures",
+        "/opt/project/build/*.yml",
+    ]
+    paths = [
+        "roles/vendor/tasks/main.yml",
+        "templates/foo.j2",
+        "roles/foo/molecule",
+        "molecule/default/converge.yml",
+        "x/collections/ansible_collections",
+        "collections/ansible_collections/ns/col/galaxy.yml",
+        "tests/unit/fixtures",
+        "tests/unit/x/fixtures",
+        "/opt/project/build/out.yml",
+        "/opt/project/build/sub/out.yml",
+        "site.yml",
+    ]
+    matcher = file_utils.ExcludeMatcher(patterns)
+    for name in paths:
+        path = Path(name)
+        abs_path = str(Path("/opt/project") / name)
+        expected = any(
+            abs_path.startswith(pattern)
+            or path.match(pattern)
+            or fnmatch(abs_path, pattern)
+            for pattern in patterns
+        )
+        assert matcher.match(path, abs_path) is expected, name
+        assert matcher.match_abspath(abs_path) is any(
+            abs_path.startswith(pattern) or fnmatch(abs_path, pattern)
+            for pattern in patterns
+        )
+    # lintables are also matched by their description
+    matcher = file_utils.ExcludeMatcher(["templates/*"])
+    assert matcher.match(Path("foo.yml"), "/x/foo.yml", "templates/x.j2 (yaml)")
+
+
+def test_get_all_files_excluded_folders(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Verify that excluded folders exclude their files, unless negated."""
+    _make_ignored_tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q"], check=True)
+    assert file_utils.get_all_files(Path(), exclude_paths=["roles/foo/"]) == [
+        Path(".gitignore"),
+        Path("site.yml"),
+    ]
+    assert file_utils.get_all_files(
+        Path(), exclude_paths=["roles/foo/tasks/", "!roles/foo/tasks/main.yml"]
+    ) == [
+        Path(".gitignore"),
+        Path("roles/foo/.gitignore"),
+        Path("roles/foo/files/keep.yml"),
+        Path("roles/foo/tasks/main.yml"),
+        Path("site.yml"),
+    ]
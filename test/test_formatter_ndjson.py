@@ -0,0 +1,96 @@
+"""Test the newline delimited JSON formatter."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from ansiblelint.errors import MatchError
+from ansiblelint.file_utils import Lintable
+from ansiblelint.formatters import CodeclimateJSONFormatter, NDJSONFormatter
+from ansiblelint.rules import AnsibleLintRule
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def ndjson_formatter_matches() -> list[MatchError]:
+    """Create test match errors for NDJSON formatter tests."""
+    rule = AnsibleLintRule()
+    rule.id = "TCF0001"
+    return [
+        MatchError(
+            message="message",
+            lineno=lineno,
+            details="hello",
+            lintable=Lintable("filename.yml", content=""),
+            rule=rule,
+        )
+        for lineno in (1, 2)
+    ]
+
+
+@pytest.fixture
+def ndjson_formatter() -> NDJSONFormatter:
+    """Create a NDJSONFormatter instance."""
+    return NDJSONFormatter(pathlib.Path.cwd(), display_relative_path=True)
+
+
+def test_ndjson_matches_codeclimate(
+    ndjson_formatter: NDJSONFormatter,
+    ndjson_formatter_matches: list[MatchError],
+) -> None:
+    """Test that each line is the Code Climate issue of a match."""
+    codeclimate = CodeclimateJSONFormatter(
+        pathlib.Path.cwd(), display_relative_path=True
+    )
+    output = ndjson_formatter.format_result(ndjson_formatter_matches)
+    assert [json.loads(line) for line in output.splitlines()] == json.loads(
+        codeclimate.format_result(ndjson_formatter_matches)
+    )
+    assert [
+        ndjson_formatter.apply(match) for match in ndjson_formatter_matches
+    ] == output.splitlines()
+
+
+def test_ndjson_single_match(
+    ndjson_formatter: NDJSONFormatter,
+    ndjson_formatter_matches: list[MatchError],
+) -> None:
+    """Test negative case. Only lists are allowed."""
+    with pytest.raises(TypeError):
+        ndjson_formatter.format_result(ndjson_formatter_matches[0])  # type: ignore[arg-type]
+
+
+def test_ndjson_cli(tmp_path: pathlib.Path) -> None:
+    """Test that streamed issues and the SARIF file match the JSON outputs."""
+    sarif_file = tmp_path / "output.sarif"
+    cmd = [
+        sys.executable,
+        "-m",
+        "ansiblelint",
+        "--offline",
+        "-q",
+        "examples/playbooks/norole.yml",
+    ]
+    result = subprocess.run(
+        [*cmd, "-f", "ndjson", "--sarif-file", str(sarif_file)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 2
+    issues = [json.loads(line) for line in result.stdout.splitlines()]
+    expected = subprocess.run(
+        [*cmd, "-f", "codeclimate"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert issues == json.loads(expected.stdout)
+    sarif = json.loads(sarif_file.read_text(encoding="utf-8"))
+    assert len(sarif["runs"][0]["results"]) == len(issues)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import pathlib
@@ -11,10 +12,11 @@ from tempfile import NamedTemporaryFile
 
 import pytest
 
-from ansiblelint.app import App  # ruff:ignore[typing-only-first-party-import]
+from ansiblelint.app import App, MatchStream
+from ansiblelint.config import Options
 from ansiblelint.errors import MatchError
 from ansiblelint.file_utils import Lintable
-from ansiblelint.formatters import SarifFormatter
+from ansiblelint.formatters import SarifFormatter, SarifWriter
 from ansiblelint.rules import AnsibleLintRule, RulesCollection
 
 # pylint: disable=redefined-outer-name
@@ -132,6 +134,42 @@ def test_sarif_single_match(
         sarif_formatter.format_result(sarif_formatter_matches[0])  # type: ignore[arg-type]
 
 
+def test_sarif_writer(
+    sarif_formatter: SarifFormatter,
+    sarif_formatter_matches: list[MatchError],
+) -> None:
+    """Test that the incrementally written SARIF is the same as the formatted one."""
+    stream = io.StringIO()
+    writer = SarifWriter(stream, pathlib.Path.cwd(), display_relative_path=True)
+    for match in sarif_formatter_matches:
+        writer.add(match)
+    writer.close()
+    assert json.loads(stream.getvalue()) == json.loads(
+        sarif_formatter.format_result(sarif_formatter_matches)
+    )
+
+
+@pytest.mark.parametrize("complete", (True, False), ids=("complete", "failed"))
+def test_sarif_match_stream(
+    sarif_formatter_matches: list[MatchError],
+    tmp_path: pathlib.Path,
+    complete: bool,
+) -> None:
+    """Test that the streamed SARIF file only appears once linting is complete."""
+    sarif_file = tmp_path / "output.sarif"
+    app = App(Options(format="ndjson", sarif_file=sarif_file, cwd=tmp_path))
+    stream = MatchStream(app, lambda matches: matches)
+    stream(sarif_formatter_matches)
+    assert not sarif_file.exists()
+
+    stream.close(complete=complete)
+    assert sarif_file.exists() is complete
+    if complete:
+        results = json.loads(sarif_file.read_text(encoding="utf-8"))["runs"][0]
+        assert len(results["results"]) == len(sarif_formatter_matches)
+    assert list(tmp_path.iterdir()) == ([sarif_file] if complete else [])
+
+
 def test_sarif_format(
     sarif_formatter: SarifFormatter,
     sarif_formatter_matches: list[MatchError],
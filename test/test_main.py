@@ -333,6 +333,56 @@ def test_list_tags() -> None:
             assert isinstance(item, str)
 
 
+@pytest.mark.parametrize(
+    ("command", "unused_module"),
+    (
+        pytest.param("--version", "ansiblelint.rules", id="version"),
+        pytest.param("--list-profiles", "ansiblelint.rules", id="list-profiles"),
+        pytest.param("--list-rules", "ansiblelint.app", id="list-rules"),
+        pytest.param("--list-tags", "ansiblelint.app", id="list-tags"),
+    ),
+)
+def test_informational_commands_imports(command: str, unused_module: str) -> None:
+    """Asserts that commands which do not lint skip the modules they do not need."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "ansiblelint", command],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result
+    modules = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "ansiblelint.cli" in modules
+    assert unused_module not in modules
+
+
+def test_profile_rules() -> None:
+    """Asserts that timings of rules and phases are reported on stderr."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "ansiblelint",
+            "--offline",
+            "--nocolor",
+            "--profile-rules",
+            "examples/playbooks/rule-no-changed-when-pass.yml",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result
+    assert "# Rule timings" in result.stderr
+    assert "no-changed-when              matchtasks" in result.stderr
+    for phase in ("discovery", "yaml load", "syntax check", "rules"):
+        assert f"\n{phase} " in result.stderr
+
+
 def test_ro_venv(tmp_path: Path) -> None:
     """Tests behavior when the virtual environment is read-only."""
     tox_work_dir = os.environ.get("TOX_WORK_DIR", ".tox")
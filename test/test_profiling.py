@@ -0,0 +1,28 @@
+"""Tests for the profiler used by --profile-rules."""
+
+from __future__ import annotations
+
+import time
+
+from ansiblelint.profiling import Profiler
+
+
+def test_profiler_nested_timings() -> None:
+    """Asserts that time spent in nested measurements is only counted once."""
+    profiler = Profiler()
+    profiler.enabled = True
+    with profiler.phase("rules"):
+        with profiler.rule("name", "matchtask"):
+            with profiler.phase("yaml load"):
+                time.sleep(0.05)
+            time.sleep(0.05)
+        time.sleep(0.05)
+
+    for timing in (
+        profiler.phases["rules"],
+        profiler.phases["yaml load"],
+        profiler.rules["name", "matchtask"],
+    ):
+        assert timing.calls == 1
+        assert 0.05 <= timing.seconds < 0.09
+    assert "total measured time of 0.1" in profiler.report()
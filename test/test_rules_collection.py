@@ -22,14 +22,24 @@
 from __future__ import annotations
 
 import collections
+import json
 import re
+import subprocess
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from ansiblelint.constants import DEFAULT_RULESDIR
 from ansiblelint.file_utils import Lintable
-from ansiblelint.rules import RulesCollection
+from ansiblelint.profiling import profiler
+from ansiblelint.rules import (
+    RULE_MANIFEST,
+    LineScanner,
+    RulesCollection,
+    build_rule_manifest,
+)
 from ansiblelint.testing import run_ansible_lint
 
 if TYPE_CHECKING:
@@ -224,3 +234,153 @@ def test_category_tag_override(
     for m in matches:
         if m.rule.id == "TEST0001":
             assert m.tag == "TEST0001[BANNED]"
+
+
+def test_dispatch_table(default_rules_collection: RulesCollection) -> None:
+    """Test that rules only run the match methods applying to each kind of file."""
+
+    def dispatch(
+        lintable: Lintable, skip_list: list[str]
+    ) -> dict[str, tuple[str, ...]]:
+        return {
+            rule.id: methods or ()
+            for rule, methods in default_rules_collection._dispatch_table(  # ruff:ignore[private-member-access]
+                lintable, set(), skip_list, is_dir=False
+            )
+        }
+
+    playbook = dispatch(
+        Lintable("examples/playbooks/rule-no-changed-when-pass.yml"), []
+    )
+    assert playbook["no-changed-when"] == ("matchtasks",)
+    assert playbook["name"] == ("matchtasks", "matchyaml")
+    assert "syntax-check" not in playbook
+    assert "internal-error" not in playbook
+
+    variables = dispatch(Lintable("examples/playbooks/vars/empty_vars.yml"), [])
+    assert "no-changed-when" not in variables
+    assert "matchtasks" not in variables.get("name", ())
+
+    # task loading errors are still reported when all the rules looking at
+    # tasks are skipped
+    skip_list = [
+        rule_id for rule_id, methods in playbook.items() if "matchtasks" in methods
+    ]
+    remaining = dispatch(
+        Lintable("examples/playbooks/rule-no-changed-when-pass.yml"), skip_list
+    )
+    assert sum("matchtasks" in methods for methods in remaining.values()) == 1
+
+
+def test_line_scanner(
+    test_rules_collection: RulesCollection,
+    ematchtestfile: Lintable,
+    bracketsmatchtestfile: Lintable,
+) -> None:
+    """Test that scanning lines once finds the same matches as each rule."""
+    rules = [
+        rule for rule in test_rules_collection if rule.id in ("TEST0001", "TEST0002")
+    ]
+    scanner = LineScanner(rules)  # type: ignore[arg-type]
+    for lintable in (ematchtestfile, bracketsmatchtestfile):
+        found = scanner.matchlines(lintable)
+        for rule in rules:
+            expected = rule.matchlines(lintable)
+            assert [(m.lineno, m.tag) for m in found[rule]] == [
+                (m.lineno, m.tag) for m in expected
+            ]
+            assert all(m.match_type == "line" for m in found[rule])
+
+    # profiled runs call the rules separately, with the same results
+    matches = test_rules_collection.run(ematchtestfile)
+    profiler.enabled = True
+    try:
+        assert test_rules_collection.run(ematchtestfile) == matches
+    finally:
+        profiler.enabled = False
+        profiler.reset()
+
+
+def test_getitem(default_rules_collection: RulesCollection) -> None:
+    """Test that rules are found by their id."""
+    assert default_rules_collection["yaml"].id == "yaml"
+    with pytest.raises(ValueError, match="not present"):
+        default_rules_collection["no-such-rule"]
+
+
+def test_rule_manifest_is_current() -> None:
+    """Test that the manifest of the built-in rules is up to date."""
+    with (DEFAULT_RULESDIR / RULE_MANIFEST).open(encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest == build_rule_manifest(DEFAULT_RULESDIR), (
+        "Run tools/generate_rule_manifest.py to update the rule manifest."
+    )
+
+
+@pytest.mark.parametrize(
+    ("tags", "skip_list", "profile"),
+    (
+        pytest.param(["formatting"], [], None, id="tags"),
+        pytest.param([], ["yaml", "name"], None, id="skip"),
+        pytest.param([], [], "min", id="profile"),
+    ),
+)
+def test_rule_manifest_selection(
+    config_options: Options,
+    app: App,
+    tags: list[str],
+    skip_list: list[str],
+    profile: str | None,
+) -> None:
+    """Test that rules left out using the manifest are the ones unable to run."""
+    full = RulesCollection(
+        app=app,
+        rulesdirs=[DEFAULT_RULESDIR],
+        options=config_options,
+        profile_name=profile,
+    )
+    config_options.tags = tags
+    config_options.skip_list = skip_list
+    lazy = RulesCollection(
+        app=app,
+        rulesdirs=[DEFAULT_RULESDIR],
+        options=config_options,
+        profile_name=profile,
+    )
+
+    def running(rules: RulesCollection) -> set[str]:
+        return {
+            rule.id
+            for rule in rules
+            if rules._should_run_rule(rule, set(tags), skip_list)  # ruff:ignore[private-member-access]
+        }
+
+    assert running(lazy) == running(full)
+    assert len(lazy) <= len(full)
+    # rules needed by the runner are always loaded
+    assert "syntax-check" in {rule.id for rule in lazy}
+    if tags:
+        assert len(lazy) < len(full)
+
+
+def test_rule_manifest_imports(tmp_path: Path) -> None:
+    """Test that the modules of the rules unable to run are not imported."""
+    script = (
+        "import sys\n"
+        "from ansiblelint.app import get_app\n"
+        "from ansiblelint.config import Options\n"
+        "from ansiblelint.constants import DEFAULT_RULESDIR\n"
+        "from ansiblelint.rules import RulesCollection\n"
+        "options = Options(tags=['no-changed-when'], offline=True)\n"
+        "RulesCollection(app=get_app(offline=True), rulesdirs=[DEFAULT_RULESDIR], "
+        "options=options)\n"
+        "print(sorted(m for m in ('no_changed_when', 'partial_become') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+    assert result.stdout.strip() == "['no_changed_when']"
@@ -21,16 +21,31 @@
 # THE SOFTWARE.
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
+import ansiblelint.utils
 from ansiblelint import formatters
+from ansiblelint._internal import syntax_check
+from ansiblelint._internal.syntax_check import SyntaxCheckWorker, run_syntax_check
+from ansiblelint.cache import ResultCache
+from ansiblelint.config import Options
+from ansiblelint.constants import States
 from ansiblelint.file_utils import Lintable
 from ansiblelint.runner import Runner
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from ansiblelint.errors import MatchError
     from ansiblelint.rules import RulesCollection
 
 LOTS_OF_WARNINGS_PLAYBOOK = Path("examples/playbooks/lots_of_warnings.yml").resolve()
@@ -371,3 +386,446 @@ def test_map_syntax_check_workers_threadpool_fallback(
     files = [Lintable("examples/playbooks/become.yml")]
     results = runner._map_syntax_check_workers(lambda _f: [], files)  # ruff:ignore[private-member-access]
     assert results == [[]]
+
+
+def test_runner_jobs(default_rules_collection: RulesCollection) -> None:
+    """Test that running rules inside worker processes gives the same matches."""
+    playbooks = [
+        "examples/playbooks/deep/",
+        "examples/playbooks/example.yml",
+        "examples/playbooks/tasks/local_action.yml",
+    ]
+    serial_matches = Runner(*playbooks, rules=default_rules_collection).run()
+    parallel_matches = Runner(*playbooks, rules=default_rules_collection, jobs=2).run()
+
+    assert serial_matches
+    assert [repr(match) for match in parallel_matches] == [
+        repr(match) for match in serial_matches
+    ]
+    assert [match.level for match in parallel_matches] == [
+        match.level for match in serial_matches
+    ]
+
+
+def test_runner_pipelined(
+    default_rules_collection: RulesCollection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that pipelining the syntax checks and the rules gives the same results."""
+    lintables = [
+        "examples/playbooks/import-failed-syntax-check.yml",
+        "examples/playbooks/test_import_with_malformed.yml",
+        "examples/playbooks/common-include-wrong-syntax.yml",
+        "examples/playbooks/example.yml",
+        "examples/playbooks/tasks/passing_task.yml",
+    ]
+    pipelined = Runner(*lintables, rules=default_rules_collection)
+    pipelined_matches = pipelined.run()
+
+    monkeypatch.setattr(Runner, "_can_pipeline", lambda _self: False)
+    phased = Runner(*lintables, rules=default_rules_collection)
+    phased_matches = phased.run()
+
+    assert any(match.rule.id == "syntax-check" for match in phased_matches)
+    assert [repr(match) for match in pipelined_matches] == [
+        repr(match) for match in phased_matches
+    ]
+    assert pipelined.checked_files == phased.checked_files
+    assert pipelined.include_graph.edges() == phased.include_graph.edges()
+
+
+def test_runner_pipelined_overlap(
+    default_rules_collection: RulesCollection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that files which cannot fail a syntax check are linted during it."""
+    linted = threading.Event()
+    run_rules = default_rules_collection.run
+    syntax_check = Runner._get_ansible_syntax_check_matches  # ruff:ignore[private-member-access]
+
+    def run(lintable: Lintable, *args: Any, **kwargs: Any) -> list[MatchError]:
+        if lintable.kind == "tasks":
+            linted.set()
+        return run_rules(lintable, *args, **kwargs)
+
+    def wait_and_check(self: Runner, lintable: Lintable, app: Any) -> list[MatchError]:
+        assert linted.wait(timeout=60), "tasks file was not linted during the check"
+        return syntax_check(self, lintable, app)
+
+    monkeypatch.setattr(default_rules_collection, "run", run)
+    monkeypatch.setattr(Runner, "_get_ansible_syntax_check_matches", wait_and_check)
+    matches = Runner(
+        "examples/playbooks/syntax-error.yml",
+        "examples/playbooks/tasks/passing_task.yml",
+        rules=default_rules_collection,
+    ).run()
+
+    assert [match.tag for match in matches] == ["syntax-check[specific]"]
+
+
+@pytest.mark.parametrize(
+    "playbook",
+    (
+        pytest.param("examples/playbooks/example.yml", id="valid"),
+        pytest.param("examples/playbooks/syntax-error.yml", id="syntax-error"),
+        pytest.param(
+            "examples/playbooks/test_import_with_malformed.yml", id="malformed"
+        ),
+    ),
+)
+def test_syntax_check_worker(playbook: str) -> None:
+    """Test that syntax check workers give the same results as ansible-playbook."""
+    cmd = ["ansible-playbook", "--syntax-check", "-vv", playbook]
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    expected = subprocess.run(
+        cmd,
+        stdin=subprocess.PIPE,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+    # second call reuses the already started worker
+    for _ in range(2):
+        result = run_syntax_check(cmd, env)
+        assert result.returncode == expected.returncode
+        assert result.stderr == expected.stderr
+
+
+def test_syntax_check_worker_close() -> None:
+    """Test that closing a worker waits for it and closes its pipes."""
+    worker = SyntaxCheckWorker({**os.environ, "PYTHONWARNINGS": "ignore"})
+    worker.close()
+    assert worker.proc.returncode is not None
+    assert worker.proc.stdin
+    assert worker.proc.stdin.closed
+    assert worker.proc.stdout
+    assert worker.proc.stdout.closed
+    # closing again does nothing
+    worker.close()
+
+
+def test_syntax_check_worker_key(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that workers are only reused with the same ansible configuration."""
+    worker_key = syntax_check._worker_key  # ruff:ignore[private-member-access]
+    env = {"PATH": os.environ["PATH"]}
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.chdir(first)
+    key = worker_key(env)
+    assert worker_key(env) == key
+
+    monkeypatch.chdir(second)
+    assert worker_key(env) != key
+
+    config = second / "ansible.cfg"
+    config.write_text("[defaults]\n", encoding="utf-8")
+    key = worker_key(env)
+    assert key[1] == str(config.resolve())
+    mtime = config.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config, ns=(mtime, mtime))
+    assert worker_key(env) != key
+
+
+def test_runner_result_cache(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cached results are reused until an included file changes."""
+    playbook = tmp_path / "playbook.yml"
+    playbook.write_text(
+        "---\n- hosts: localhost\n  tasks:\n    - import_tasks: tasks.yml\n",
+        encoding="utf-8",
+    )
+    tasks = tmp_path / "tasks.yml"
+    tasks.write_text("---\n- shell: echo foo\n", encoding="utf-8")
+    result_cache = ResultCache(tmp_path / "cache", Options(), default_rules_collection)
+
+    def lint() -> list[str]:
+        matches = Runner(
+            playbook,
+            rules=default_rules_collection,
+            result_cache=result_cache,
+            _skip_ansible_syntax_check=True,
+        ).run()
+        return [repr(match) for match in matches]
+
+    expected = lint()
+    assert expected
+
+    checked: list[str] = []
+    run = default_rules_collection.run
+
+    def counting_run(file: Lintable, *args: Any, **kwargs: Any) -> Any:
+        checked.append(file.path.name)
+        return run(file, *args, **kwargs)
+
+    monkeypatch.setattr(default_rules_collection, "run", counting_run)
+    assert lint() == expected
+    assert not checked
+
+    # changing the included file also invalidates the results of its parent
+    tasks.write_text("---\n- shell: echo bar\n", encoding="utf-8")
+    lint()
+    assert sorted(checked) == ["playbook.yml", "tasks.yml"]
+
+
+def test_result_cache_yamllint_config(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that changing the yamllint configuration invalidates the results."""
+    salt = ResultCache(tmp_path, Options(), default_rules_collection).salt
+    assert ResultCache(tmp_path, Options(), default_rules_collection).salt == salt
+
+    yamllint_config = default_rules_collection.app.yamllint_config
+    monkeypatch.setitem(
+        yamllint_config.rules,
+        "line-length",
+        {"level": "error", "max": 40, "allow-non-breakable-words": True},
+    )
+    assert ResultCache(tmp_path, Options(), default_rules_collection).salt != salt
+
+
+def test_result_cache_prune(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+) -> None:
+    """Test that entries not used recently are removed from the cache."""
+    result_cache = ResultCache(tmp_path, Options(), default_rules_collection)
+    result_cache.set("old", {"matches": []})
+    result_cache.set("used", {"matches": []})
+    result_cache.set("recent", {"matches": []})
+    expired = time.time() - ResultCache.MAX_AGE - 60
+    for key in ("old", "used"):
+        os.utime(result_cache.path / f"{key}.json", (expired, expired))
+    assert result_cache.get("used") == {"matches": []}
+
+    result_cache = ResultCache(tmp_path, Options(), default_rules_collection)
+    assert result_cache.get("old") is None
+    assert result_cache.get("used") == {"matches": []}
+    assert result_cache.get("recent") == {"matches": []}
+
+
+def test_result_cache_local_modules(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+) -> None:
+    """Test that changing a module of the project invalidates the results."""
+    module = tmp_path / "roles" / "foo" / "library" / "my_module.py"
+    module.parent.mkdir(parents=True)
+    module.write_text("# module\n", encoding="utf-8")
+    options = Options(project_dir=str(tmp_path))
+    salt = ResultCache(tmp_path, options, default_rules_collection).salt
+    assert ResultCache(tmp_path, options, default_rules_collection).salt == salt
+
+    mtime = module.stat().st_mtime_ns + 1_000_000_000
+    os.utime(module, ns=(mtime, mtime))
+    assert ResultCache(tmp_path, options, default_rules_collection).salt != salt
+
+
+def test_runner_result_cache_galaxy(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+) -> None:
+    """Test that galaxy files are linted again when files next to them change."""
+    collection = tmp_path / "collection"
+    shutil.copytree("examples/galaxy_tags/pass", collection)
+    runtime = collection / "meta" / "runtime.yml"
+    runtime.unlink()
+    result_cache = ResultCache(tmp_path / "cache", Options(), default_rules_collection)
+
+    def lint() -> list[str]:
+        matches = Runner(
+            collection / "galaxy.yml",
+            rules=default_rules_collection,
+            result_cache=result_cache,
+            _skip_ansible_syntax_check=True,
+        ).run()
+        return [match.tag for match in matches]
+
+    assert "galaxy[no-runtime]" in lint()
+    runtime.write_text("---\nrequires_ansible: '>=2.15.0'\n", encoding="utf-8")
+    assert "galaxy[no-runtime]" not in lint()
+
+
+def test_runner_result_cache_syntax_check(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that deeply included files invalidate results when running checks."""
+    for name in ("p.yml", "q.yml"):
+        (tmp_path / name).write_text(
+            "---\n- import_playbook: t.yml\n",
+            encoding="utf-8",
+        )
+    (tmp_path / "t.yml").write_text(
+        "---\n- hosts: localhost\n  tasks:\n    - include_tasks: n.yml\n",
+        encoding="utf-8",
+    )
+    tasks = tmp_path / "n.yml"
+    tasks.write_text("---\n- shell: echo foo\n", encoding="utf-8")
+    result_cache = ResultCache(tmp_path / "cache", Options(), default_rules_collection)
+
+    def lint() -> None:
+        Runner(
+            tmp_path / "p.yml",
+            tmp_path / "q.yml",
+            rules=default_rules_collection,
+            result_cache=result_cache,
+        ).run()
+
+    lint()
+    checked: list[str] = []
+    run = default_rules_collection.run
+
+    def counting_run(file: Lintable, *args: Any, **kwargs: Any) -> Any:
+        checked.append(file.path.name)
+        return run(file, *args, **kwargs)
+
+    monkeypatch.setattr(default_rules_collection, "run", counting_run)
+    tasks.write_text("---\n- shell: echo bar\n", encoding="utf-8")
+    lint()
+    assert sorted(checked) == ["n.yml", "p.yml", "q.yml", "t.yml"]
+
+
+def test_runner_changed_files(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+) -> None:
+    """Test that only changed files and the files including them are linted."""
+    (tmp_path / "playbook.yml").write_text(
+        "---\n- hosts: localhost\n  tasks:\n    - import_tasks: tasks.yml\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "other.yml").write_text(
+        "---\n- hosts: localhost\n  roles:\n    - role: ./roles/foo\n",
+        encoding="utf-8",
+    )
+    tasks = tmp_path / "tasks.yml"
+    tasks.write_text("---\n- shell: echo foo\n", encoding="utf-8")
+    role_tasks = tmp_path / "roles" / "foo" / "tasks" / "main.yml"
+    role_tasks.parent.mkdir(parents=True)
+    role_tasks.write_text("---\n- shell: echo foo\n", encoding="utf-8")
+
+    def lint(changed: Path) -> set[str]:
+        checked_files: set[Lintable] = set()
+        Runner(
+            tmp_path / "playbook.yml",
+            tmp_path / "other.yml",
+            tmp_path / "tasks.yml",
+            rules=default_rules_collection,
+            checked_files=checked_files,
+            changed_files={changed},
+            _skip_ansible_syntax_check=True,
+        ).run()
+        return {file.path.name for file in checked_files}
+
+    assert lint(tasks) == {"playbook.yml", "tasks.yml"}
+    assert lint(role_tasks) == {"other.yml", "main.yml"}
+
+
+def test_runner_include_graph(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+) -> None:
+    """Test that the files included by each other are exported as a graph."""
+    (tmp_path / "playbook.yml").write_text(
+        "---\n- hosts: localhost\n  roles:\n    - role: foo\n"
+        "  tasks:\n    - import_tasks: tasks.yml\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "tasks.yml").write_text(
+        "---\n- include_tasks: nested.yml\n", encoding="utf-8"
+    )
+    (tmp_path / "nested.yml").write_text("---\n- shell: echo foo\n", encoding="utf-8")
+    role_tasks = tmp_path / "roles" / "foo" / "tasks" / "main.yml"
+    role_tasks.parent.mkdir(parents=True)
+    role_tasks.write_text("---\n- shell: echo foo\n", encoding="utf-8")
+
+    runner = Runner(
+        tmp_path / "playbook.yml",
+        rules=default_rules_collection,
+        _skip_ansible_syntax_check=True,
+    )
+    runner.run()
+    edges = {
+        (Path(parent).name, Path(child).name)
+        for parent, child in runner.include_graph.edges()
+    }
+    assert edges == {
+        ("playbook.yml", "main.yml"),
+        ("playbook.yml", "tasks.yml"),
+        ("tasks.yml", "nested.yml"),
+    }
+
+    runner.include_graph.write(tmp_path / "graph.json")
+    data = json.loads((tmp_path / "graph.json").read_text(encoding="utf-8"))
+    assert {node["kind"] for node in data["nodes"]} == {"playbook", "tasks"}
+    assert len(data["edges"]) == 3
+
+    runner.include_graph.write(tmp_path / "graph.dot")
+    dot = (tmp_path / "graph.dot").read_text(encoding="utf-8")
+    assert dot.startswith("digraph includes {\n")
+    assert dot.count(" -> ") == 3
+
+
+def test_runner_low_memory(
+    default_rules_collection: RulesCollection,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Test that releasing the data of linted files keeps the same results."""
+    (tmp_path / "playbook.yml").write_text(
+        "---\n- hosts: localhost\n  tasks:\n    - import_tasks: tasks.yml\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "tasks.yml").write_text("---\n- shell: echo foo\n", encoding="utf-8")
+
+    def run(*, low_memory: bool) -> tuple[Runner, list[Any]]:
+        runner = Runner(
+            tmp_path / "playbook.yml",
+            rules=default_rules_collection,
+            _skip_ansible_syntax_check=True,
+            low_memory=low_memory,
+        )
+        matches = runner.run()
+        return runner, [(m.filename, m.lineno, m.tag) for m in matches]
+
+    parse = mocker.spy(ansiblelint.utils, "parse_yaml_linenumbers")
+    _, expected = run(low_memory=False)
+    parsed = parse.call_count
+    runner, found = run(low_memory=True)
+    assert found == expected
+    # data is only released once the rules are done with it
+    assert parse.call_count == 2 * parsed
+    assert expected
+    for lintable in runner.lintables:
+        assert lintable.state == States.NOT_LOADED
+        assert lintable._content is None  # ruff:ignore[private-member-access]
+
+    # released data is loaded again when needed
+    tasks = next(item for item in runner.lintables if item.name.endswith("tasks.yml"))
+    assert tasks.data[0]["shell"] == "echo foo"
+
+
+def test_limit_parse_caches(tmp_path: Path) -> None:
+    """Test that only the most recently parsed files are kept, when limited."""
+    ansiblelint.utils.limit_parse_caches(1)
+    try:
+        for name in ("a.yml", "b.yml"):
+            (tmp_path / name).write_text("---\nfoo: bar\n", encoding="utf-8")
+            _ = Lintable(tmp_path / name, kind="yaml").data
+        assert [path.name for *_, path in ansiblelint.utils.parsed_files()][-1:] == [
+            "b.yml"
+        ]
+        assert len(ansiblelint.utils.parsed_files()) == 1
+    finally:
+        ansiblelint.utils.limit_parse_caches(None)
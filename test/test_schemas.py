@@ -6,18 +6,22 @@ import os
 import re
 import subprocess
 import sys
-import urllib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
-from unittest.mock import DEFAULT, MagicMock, patch
+from typing import Any, ClassVar
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
 
 import license_expression
 import pytest
+import yaml
 
 from ansiblelint.file_utils import Lintable
 from ansiblelint.schemas import __file__ as schema_module
+from ansiblelint.schemas import __main__ as schemas_main
 from ansiblelint.schemas.__main__ import refresh_schemas
-from ansiblelint.schemas.main import validate_file_schema
+from ansiblelint.schemas.main import get_validator, validate_file_schema
 
 schema_path = Path(schema_module).parent
 spdx_config_path = (
@@ -26,38 +30,124 @@ spdx_config_path = (
 RE_SPDX_SAFE_TOX_ENV_NAME = re.compile(r"^py[\d\.]*$")
 
 
-def urlopen_side_effect(*_args: Any, **kwargs: Any) -> Any:
-    """Actual test that timeout parameter is defined."""
-    assert "timeout" in kwargs
-    assert kwargs["timeout"] > 0
-    return DEFAULT
-
-
-@patch("urllib.request")
-def test_requests_uses_timeout(mock_request: MagicMock) -> None:
+@patch("ansiblelint.schemas.__main__.HTTPSConnection")
+def test_requests_uses_timeout(mock_connection: MagicMock) -> None:
     """Test that schema refresh uses timeout."""
-    mock_request.urlopen.side_effect = urlopen_side_effect
     refresh_schemas(min_age_seconds=0)
-    mock_request.urlopen.assert_called()
+    mock_connection.assert_called()
+    assert mock_connection.call_args.kwargs["timeout"] > 0
 
 
-@patch("urllib.request")
+@patch("ansiblelint.schemas.__main__.HTTPSConnection")
 def test_request_timeouterror_handling(
-    mock_request: MagicMock,
+    mock_connection: MagicMock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test that schema refresh can handle time out errors."""
     error_msg = "Simulating handshake operation time out."
-    mock_request.urlopen.side_effect = urllib.error.URLError(  # pyright: ignore[reportAttributeAccessIssue]
-        TimeoutError(error_msg)
-    )
+    mock_connection.return_value.request.side_effect = TimeoutError(error_msg)
     with caplog.at_level(logging.DEBUG):
         assert refresh_schemas(min_age_seconds=0) == 0
-    mock_request.urlopen.assert_called()
+    mock_connection.return_value.request.assert_called()
     assert "Skipped schema refresh due to unexpected exception: " in caplog.text
     assert error_msg in caplog.text
 
 
+class _SchemaHandler(BaseHTTPRequestHandler):
+    """Serve schemas with etags, over keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+    clients: ClassVar[set[tuple[str, int]]] = set()
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answer like the schema store does."""
+        self.clients.add(self.client_address)
+        # proxies receive absolute targets
+        path = urlsplit(self.path).path
+        if path == "/moved.json":
+            self.send_response(301)
+            self.send_header("Location", "/foo.json")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif path == "/bad.json":
+            self.send_response(200)
+            self.send_header("Content-Length", "1")
+            self.end_headers()
+            self.wfile.write(b"\xff")
+        elif path != "/foo.json":
+            self.send_error(404)
+        elif self.headers["If-None-Match"] == '"2"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            body = b'{"title": "foo"}\n'
+            self.send_response(200)
+            self.send_header("ETag", '"2"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """Keep the test output quiet."""
+
+
+def test_refresh_schemas_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that schemas failing to download keep their last-known good copy."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SchemaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    (tmp_path / "missing.json").write_text("{}\n", encoding="utf-8")
+    schemas = {
+        "foo": {"etag": "1", "url": f"{base}/foo.json"},
+        "moved": {"etag": "", "url": f"{base}/moved.json"},
+        "bad": {"etag": "1", "url": f"{base}/bad.json"},
+        # last, as errors close the connection
+        "missing": {"etag": "1", "url": f"{base}/missing.json"},
+    }
+    # a single worker has to reuse its connection
+    monkeypatch.setattr(schemas_main, "SCHEMA_REFRESH_WORKERS", 1)
+    try:
+        assert schemas_main._refresh(schemas, tmp_path) == 2  # ruff:ignore[private-member-access]
+        assert len(_SchemaHandler.clients) == 1
+        # unchanged schemas are not downloaded again
+        assert schemas_main._refresh(schemas, tmp_path) == 0  # ruff:ignore[private-member-access]
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert schemas["foo"]["etag"] == "2"
+    assert schemas["moved"]["etag"] == "2"
+    assert schemas["missing"]["etag"] == "1"
+    assert json.loads((tmp_path / "foo.json").read_text(encoding="utf-8")) == {
+        "title": "foo"
+    }
+    assert (tmp_path / "missing.json").read_text(encoding="utf-8") == "{}\n"
+    assert schemas["bad"]["etag"] == "1"
+
+
+def test_refresh_schemas_proxy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that schemas are downloaded through the proxy of the environment."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SchemaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for name in ("no_proxy", "NO_PROXY", "HTTP_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{server.server_address[1]}")
+    # the host can only be reached through the proxy
+    schemas = {"foo": {"etag": "", "url": "http://schemas.invalid/foo.json"}}
+    try:
+        assert schemas_main._refresh(schemas, tmp_path) == 1  # ruff:ignore[private-member-access]
+        monkeypatch.setenv("no_proxy", "schemas.invalid")
+        schemas["foo"]["etag"] = ""
+        assert schemas_main._refresh(schemas, tmp_path) == 0  # ruff:ignore[private-member-access]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def test_schema_refresh_cli() -> None:
     """Ensure that we test the cli schema refresh command."""
     proc = subprocess.run(
@@ -77,6 +167,39 @@ def test_validate_file_schema() -> None:
     assert "Unable to find JSON Schema" in result[0]
 
 
+def test_validate_file_schema_reuses_loaded_data() -> None:
+    """Test that validation uses the data of the lintable and a shared validator."""
+    lintable = Lintable("examples/playbooks/rule-no-changed-when-pass.yml")
+    assert validate_file_schema(lintable) == []
+    assert get_validator("playbook") is get_validator("playbook")
+
+    lintable = Lintable("examples/playbooks/contains_secrets.yml")
+    result = validate_file_schema(lintable)
+    assert len(result) == 1, result
+    assert result[0].startswith("Failed to load YAML file")
+
+
+def test_validate_file_schema_multiple_documents(tmp_path: Path) -> None:
+    """Test that multiple documents fail as when loading the file on its own."""
+    vars_file = tmp_path / "group_vars" / "web.yml"
+    vars_file.parent.mkdir()
+    vars_file.write_text("---\na: 1\n---\nb: 2\n", encoding="utf-8")
+    with pytest.raises(yaml.composer.ComposerError, match="single document"):
+        validate_file_schema(Lintable(vars_file, kind="vars"))
+
+
+def test_validate_file_schema_dates(tmp_path: Path) -> None:
+    """Test that dates are reported with their YAML type."""
+    vars_file = tmp_path / "vars.yml"
+    vars_file.write_text("---\nwhen: 2024-01-01\n", encoding="utf-8")
+    result = validate_file_schema(Lintable(vars_file, kind="vars"))
+    assert len(result) == 1, result
+    assert result[0] == (
+        f"Failed to load YAML file '{vars_file}': "
+        "Object of type date is not JSON serializable"
+    )
+
+
 @pytest.mark.skipif(
     not RE_SPDX_SAFE_TOX_ENV_NAME.match(os.environ.get("TOX_ENV_NAME", "")),
     reason="Skipping SPDX license test due to constraints not being used by current job.",
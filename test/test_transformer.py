@@ -274,6 +274,36 @@ def test_transformer(  # pylint: disable=too-many-arguments,too-many-positional-
         playbook.with_suffix(f".tmp{playbook.suffix}").unlink()
 
 
+@mock.patch.dict(os.environ, {"ANSIBLE_LINT_WRITE_TMP": "1"}, clear=True)
+@pytest.mark.libyaml
+def test_transformer_jobs(
+    config_options: Options,
+    default_rules_collection: RulesCollection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that files transformed by forked workers are the expected ones."""
+    monkeypatch.setenv("ANSIBLE_LINT_NODEPS", "1")
+    playbooks = [
+        Path("examples/playbooks/transform-name.yml"),
+        Path("examples/playbooks/transform-yaml-comments.yml"),
+    ]
+    config_options.lintables = [str(playbook) for playbook in playbooks]
+    config_options.write_list = ["all"]
+    config_options.jobs = 2
+    result = get_matches(rules=default_rules_collection, options=config_options)
+
+    Transformer(result=result, options=config_options).run()
+
+    assert any(match.fixed for match in result.matches)
+    for playbook in playbooks:
+        expected_content = playbook.with_suffix(
+            f".transformed{playbook.suffix}",
+        ).read_text(encoding="utf-8")
+        tmp = playbook.with_suffix(f".tmp{playbook.suffix}")
+        assert tmp.read_text(encoding="utf-8") == expected_content
+        tmp.unlink()
+
+
 @pytest.mark.parametrize(
     ("write_list", "expected"),
     (
@@ -22,12 +22,14 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import subprocess
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from ansible.errors import AnsibleError
 from ansible.utils.sentinel import Sentinel
 from packaging.version import Version
 
@@ -50,6 +52,7 @@ if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
     from _pytest.logging import LogCaptureFixture
     from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
 
     from ansiblelint.rules import RulesCollection
 
@@ -371,6 +374,55 @@ def test_template_lookup_behavior(template: str, has_lookup: bool) -> None:
         )
 
 
+def test_template_outcomes_are_reused(mocker: MockerFixture) -> None:
+    """Verify that rendering the same string twice only templates it once."""
+    spy = mocker.spy(utils, "ansible_template")
+    for variables in ({"item": "a"}, {"item": "a"}, {"item": "b"}):
+        utils.template(
+            basedir=Path("/base/dir"),
+            value="{{ item }}-outcome",
+            variables=variables,
+        )
+    assert spy.call_count == 2
+    assert (
+        utils.template(
+            basedir=Path("/base/dir"),
+            value="{{ item }}-outcome",
+            variables={"item": "b"},
+        )
+        == "b-outcome"
+    )
+
+    # each caller failing on errors gets its own exception
+    errors = []
+    for _ in range(2):
+        with pytest.raises(AnsibleError) as exc_info:
+            utils.template(
+                basedir=Path("/base/dir"),
+                value="{{ 'a' | int(",
+                variables={},
+                fail_on_error=True,
+            )
+        assert exc_info.value.__traceback__ is not None
+        errors.append(exc_info.value)
+    assert errors[0] is not errors[1]
+    assert spy.call_count == 4
+
+    # while the others reuse the remembered failure
+    assert (
+        utils.template(
+            basedir=Path("/base/dir"),
+            value="{{ 'a' | int(",
+            variables={},
+        )
+        == "{{ 'a' | int("
+    )
+    assert spy.call_count == 4
+    assert utils.ansible_templar(Path("/base/dir/tasks"), {}) is utils.ansible_templar(
+        Path("/base/dir"), {"item": "a"}
+    )
+
+
 def test_task_to_str_unicode() -> None:
     """Ensure that extracting messages from tasks preserves Unicode."""
     task = utils.Task({"fail": {"msg": "unicode é ô à"}}, filename="filename.yml")
@@ -583,6 +635,61 @@ def test_find_children_in_module(default_rules_collection: RulesCollection) -> N
     assert child.base_kind == "text/yaml"
     assert child.content.startswith("---")
 
+    # Examples are kept in memory, realigned with the plugin lines
+    assert not hasattr(child, "file")
+    assert child.path == lintable.path
+    assert child.name == lintable.name
+    assert child.line_offset == 7
+
+
+def test_plugin_examples_not_written(default_rules_collection: RulesCollection) -> None:
+    """Verify that updating plugin examples does not overwrite the plugin."""
+    lintable = Lintable("plugins/modules/fake_module.py")
+    child = Runner(rules=default_rules_collection).find_children(lintable)[0]
+    child.content = "---\n[]\n"
+    child.write()
+    assert lintable.path.read_text(encoding="utf-8") == lintable.content
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    (
+        pytest.param("", (1, "", "yaml"), id="missing"),
+        pytest.param(
+            'EXAMPLES = """\n- a: 1\n"""\n', (0, "---\n- a: 1\n", "yaml"), id="yaml"
+        ),
+        pytest.param(
+            'EXAMPLES = "1"\n\nEXAMPLES = r"""\n# fmt: code\nx\n"""\n',
+            (2, "\n# fmt: code\nx\n", "code"),
+            id="last",
+        ),
+        pytest.param("EXAMPLES = dict(a=1)\n", (1, "", "yaml"), id="not-string"),
+    ),
+)
+def test_parse_examples(source: str, expected: tuple[int, str, str]) -> None:
+    """Verify that EXAMPLES are extracted from python source."""
+    assert utils.parse_examples(source) == expected
+
+
+def test_extract_plugin_examples(default_rules_collection: RulesCollection) -> None:
+    """Verify that plugin examples extracted in parallel match serial ones."""
+    runner = Runner(
+        "examples/.collection/plugins/modules",
+        rules=default_rules_collection,
+        jobs=2,
+    )
+    plugins = [lintable for lintable in runner.lintables if lintable.kind == "plugin"]
+    assert len(plugins) == 3
+    runner._extract_plugin_examples()  # ruff:ignore[private-member-access]
+    extracted = runner._plugin_examples.copy()  # ruff:ignore[private-member-access]
+    if "fork" in multiprocessing.get_all_start_methods():
+        assert extracted == {
+            plugin: utils.parse_examples_from_plugin(plugin) for plugin in plugins
+        }
+    # gamma.py has text examples, which are not linted
+    children = [child for plugin in plugins for child in runner.plugin_children(plugin)]
+    assert [child.line_offset for child in children] == [29, 29]
+
 
 def test_find_children_in_playbook(default_rules_collection: RulesCollection) -> None:
     """Verify correct function of find_children() in playbooks."""
@@ -1110,3 +1217,19 @@ def test_import_playbook_children_missing_playbook(
 
     assert result == []
     assert "Failed to find missing.yml playbook" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "filename",
+    (
+        pytest.param("examples/playbooks/vars/strings.yml", id="vars"),
+        pytest.param("examples/playbooks/playbook-parent.yml", id="playbook"),
+    ),
+)
+def test_parse_yaml_from_lintable(filename: str) -> None:
+    """Verify that lintable data is reused without our own annotations."""
+    lintable = Lintable(filename)
+    result = utils.parse_yaml_from_lintable(lintable)
+    assert result == utils.parse_yaml_from_file(filename)
+    assert constants.LINE_NUMBER_KEY not in str(result)
+    assert constants.SKIPPED_RULES_KEY not in str(result)
@@ -956,6 +956,35 @@ def test_get_path_to_task(
     assert path_to_task == expected_path
 
 
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        pytest.param("examples/playbooks/become.yml", id="playbook"),
+        pytest.param("examples/playbooks/block.yml", id="playbook-block"),
+        pytest.param("examples/playbooks/playbook-parent.yml", id="import_playbook"),
+        pytest.param(
+            "examples/playbooks/tasks/include-in-block-inner.yml", id="tasks-nested"
+        ),
+        pytest.param("examples/roles/more_complex/handlers/main.yml", id="handlers"),
+        pytest.param("examples/roles/more_complex/tasks/main.yml", id="tasks"),
+        pytest.param("examples/playbooks/vars/other.yml", id="vars"),
+    ),
+)
+def test_line_path_index(
+    lintable: Lintable,
+    ruamel_data: CommentedMap | CommentedSeq,
+) -> None:
+    """Ensure ``LinePathIndex`` gives the paths found by ``get_path_to_*``."""
+    index = ansiblelint.yaml_utils.LinePathIndex(lintable, ruamel_data)
+    for lineno in range(1, index.line_count + 5):
+        assert index.get_path_to_play(
+            lineno
+        ) == ansiblelint.yaml_utils.get_path_to_play(lintable, lineno, ruamel_data)
+        assert index.get_path_to_task(
+            lineno
+        ) == ansiblelint.yaml_utils.get_path_to_task(lintable, lineno, ruamel_data)
+
+
 @pytest.mark.parametrize(
     ("file_path", "lineno"),
     (
@@ -0,0 +1,172 @@
+#!python3
+"""Benchmark the linter against generated projects.
+
+Projects are generated inside a temporary directory and their content only
+depends on the given size, so timings can be compared between changes:
+
+    python tools/benchmark.py --size 20 --repeat 3 -- --profile-rules
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TASKS = """\
+- name: Install package {i}
+  ansible.builtin.package:
+    name: "{{{{ packages[{i}] | default('pkg{i}') }}}}"
+    state: present
+  when: inventory_hostname in groups['web']
+- name: Render template {i}
+  ansible.builtin.template:
+    src: config{i}.j2
+    dest: "/etc/app/config{i}.conf"
+    mode: "0644"
+  loop: "{{{{ items | default([]) }}}}"
+- name: Run command {i}
+  ansible.builtin.command: echo {{{{ item }}}}
+  changed_when: false
+  loop: [1, 2, 3]
+"""
+
+
+def _indent(text: str, spaces: int) -> str:
+    return "".join(
+        f"{' ' * spaces}{line}\n" if line else "\n" for line in text.splitlines()
+    )
+
+
+def generate_playbooks(root: Path, size: int) -> None:
+    """Generate many independent playbooks, each with a few plays."""
+    for i in range(size * 10):
+        plays = "".join(
+            f"- name: Play {i}.{j}\n  hosts: all\n  tasks:\n{_indent(TASKS.format(i=j), 4)}"
+            for j in range(3)
+        )
+        (root / f"playbook{i}.yml").write_text(f"---\n{plays}", encoding="utf-8")
+
+
+def generate_roles(root: Path, size: int) -> None:
+    """Generate a chain of roles, each depending on the next one."""
+    for i in range(size):
+        role = root / "roles" / f"role{i}"
+        for folder in ("tasks", "handlers", "defaults", "meta"):
+            (role / folder).mkdir(parents=True)
+        dependencies = f"\n  - role: role{i + 1}" if i + 1 < size else " []"
+        (role / "meta" / "main.yml").write_text(
+            "---\ngalaxy_info:\n  author: benchmark\n  description: Benchmark role\n"
+            "  license: MIT\n  min_ansible_version: '2.15'\n  platforms: []\n"
+            f"dependencies:{dependencies}\n",
+            encoding="utf-8",
+        )
+        tasks = "".join(TASKS.format(i=j) for j in range(5))
+        (role / "tasks" / "main.yml").write_text(
+            f"---\n{tasks}- name: Include nested tasks\n"
+            "  ansible.builtin.include_tasks: nested.yml\n",
+            encoding="utf-8",
+        )
+        (role / "tasks" / "nested.yml").write_text(f"---\n{tasks}", encoding="utf-8")
+        (role / "handlers" / "main.yml").write_text(
+            "---\n- name: Restart app\n  ansible.builtin.service:\n"
+            "    name: app\n    state: restarted\n",
+            encoding="utf-8",
+        )
+        (role / "defaults" / "main.yml").write_text(
+            "---\n" + "".join(f"role{i}_var{j}: value{j}\n" for j in range(20)),
+            encoding="utf-8",
+        )
+    (root / "site.yml").write_text(
+        "---\n- name: Site\n  hosts: all\n  roles:\n    - role: role0\n",
+        encoding="utf-8",
+    )
+
+
+def generate_vars(root: Path, size: int) -> None:
+    """Generate large and nested variable files."""
+    for folder in ("group_vars", "host_vars"):
+        (root / folder).mkdir()
+        for i in range(max(size // 5, 1)):
+            content = "".join(
+                f"app_{i}_setting_{j}:\n"
+                f"  name: setting{j}\n"
+                f'  value: "{{{{ app_{i}_setting_{max(j - 1, 0)}.value | default({j}) }}}}"\n'
+                f"  enabled: {str(j % 2 == 0).lower()}\n"
+                f"  items: [{', '.join(str(k) for k in range(5))}]\n"
+                for j in range(size * 50)
+            )
+            (root / folder / f"host{i}.yml").write_text(
+                f"---\n{content}", encoding="utf-8"
+            )
+
+
+CORPORA = {
+    "playbooks": generate_playbooks,
+    "roles": generate_roles,
+    "vars": generate_vars,
+}
+
+
+def run(project: Path, args: list[str], repeat: int) -> list[float]:
+    """Lint a project several times, returning the duration of each run."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+            [sys.executable, "-m", "ansiblelint", *args],
+            cwd=project,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        timings.append(time.perf_counter() - start)
+        # 2 means that violations were found, which is expected
+        if result.returncode not in (0, 2):
+            sys.exit(f"Linting failed with {result.returncode}:\n{result.stderr}")
+        if "--profile-rules" in args:
+            print(result.stderr, file=sys.stderr)  # ruff:ignore[print]
+    return timings
+
+
+def main() -> None:
+    """Generate the projects and print how long linting them takes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10, help="size of the projects")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per project")
+    parser.add_argument(
+        "--corpus",
+        choices=sorted(CORPORA),
+        action="append",
+        help="projects to generate, all of them by default",
+    )
+    parser.add_argument(
+        "args",
+        nargs="*",
+        help="extra arguments given to ansible-lint, after '--'",
+    )
+    opts = parser.parse_args()
+
+    print(f"{'corpus':<12} {'files':>6} {'min':>8} {'median':>8}")  # ruff:ignore[print]
+    for name in opts.corpus or sorted(CORPORA):
+        with tempfile.TemporaryDirectory(prefix=f"ansible-lint-{name}-") as tmp:
+            project = Path(tmp)
+            (project / ".ansible-lint").write_text(
+                "---\noffline: true\n", encoding="utf-8"
+            )
+            CORPORA[name](project, opts.size)
+            files = sum(1 for path in project.rglob("*.yml") if path.is_file())
+            timings = run(project, opts.args, opts.repeat)
+            print(  # ruff:ignore[print]
+                f"{name:<12} {files:>6} {min(timings):>8.2f} "
+                f"{statistics.median(timings):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
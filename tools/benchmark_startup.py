@@ -0,0 +1,99 @@
+#!python3
+"""Check the import time of the commands that do not lint anything.
+
+Tools call ``ansible-lint --version`` or ``--list-rules`` to detect what the
+linter supports, so these commands must start quickly. Each command runs with
+``python -X importtime`` and the reported import times are added up, failing
+when a command goes over its budget:
+
+    python tools/benchmark_startup.py --repeat 5 --output startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# milliseconds, listing rules and tags needs to import all the rules
+BUDGETS = {
+    "--version": 300,
+    "--list-profiles": 300,
+    "--list-rules": 450,
+    "--list-tags": 450,
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Return the self import time of each module, in microseconds."""
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # header
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def measure(command: str, cwd: Path) -> dict[str, int]:
+    """Run a command once, returning the import times it reported."""
+    result = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true]
+        [sys.executable, "-X", "importtime", "-m", "ansiblelint", command],
+        cwd=cwd,
+        env={**os.environ, "NO_COLOR": "1"},
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(f"{command} failed with {result.returncode}:\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def main() -> None:
+    """Measure the commands and fail if any of them is over its budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per command")
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="budget in milliseconds of all the commands, overriding the defaults",
+    )
+    parser.add_argument("--output", type=Path, help="write the totals as JSON")
+    opts = parser.parse_args()
+
+    results = {}
+    over = []
+    print(f"{'command':<16} {'modules':>8} {'ms':>8} {'budget':>8}")  # ruff:ignore[print]
+    with tempfile.TemporaryDirectory(prefix="ansible-lint-startup-") as tmp:
+        for command, default_budget in BUDGETS.items():
+            runs = [measure(command, Path(tmp)) for _ in range(opts.repeat)]
+            # the fastest run is the least disturbed by the rest of the system
+            fastest = min(runs, key=lambda times: sum(times.values()))
+            total = sum(fastest.values()) / 1000
+            budget = opts.budget or default_budget
+            results[command] = {
+                "modules": len(fastest),
+                "milliseconds": round(total, 1),
+                "budget": budget,
+            }
+            print(  # ruff:ignore[print]
+                f"{command:<16} {len(fastest):>8} {total:>8.1f} {budget:>8}"
+            )
+            if total > budget:
+                over.append(command)
+    if opts.output:
+        opts.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if over:
+        sys.exit(f"Import time over budget for: {', '.join(over)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+#!python3
+"""Script that generates the manifest of the built-in rules.
+
+The manifest allows importing only the rule modules that can run, it has to
+be generated again whenever rules are added, removed or changed.
+"""
+
+from __future__ import annotations
+
+import json
+
+from ansiblelint.constants import DEFAULT_RULESDIR
+from ansiblelint.rules import RULE_MANIFEST, build_rule_manifest
+
+if __name__ == "__main__":
+    manifest = build_rule_manifest(DEFAULT_RULESDIR)
+    with (DEFAULT_RULESDIR / RULE_MANIFEST).open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")